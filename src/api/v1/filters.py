@@ -1,8 +1,18 @@
 import django_filters
 from django.forms import CharField, IntegerField, MultipleChoiceField
 from django_filters import Filter
+from django_filters.constants import EMPTY_VALUES
 
-from forecasts.models import SKU, Forecast, Sale
+from forecasts.models import (
+    SKU,
+    Forecast,
+    GroupSaleWeekly,
+    Sale,
+    SaleDaily,
+    SKUCategory,
+    SKUGroup,
+    SKUSubcategory,
+)
 
 
 class MultipleValueField(MultipleChoiceField):
@@ -49,8 +59,8 @@ class ForecastFilter(django_filters.FilterSet):
         field_class=IntegerField,
         field_name="sku_id",
     )
-    forecast_date = django_filters.DateTimeFilter(
-        field_name="forecast_date__date",
+    forecast_date = django_filters.DateFilter(
+        method="filter_forecast_date",
     )
     date = django_filters.DateTimeFilter(
         field_name="date",
@@ -75,6 +85,16 @@ class ForecastFilter(django_filters.FilterSet):
             "date",
         ]
 
+    def filter_queryset(self, queryset):
+        """Filter forecasts of the current runs if date is not given."""
+        if self.form.cleaned_data.get("forecast_date") is None:
+            queryset = queryset.current()
+        return super().filter_queryset(queryset)
+
+    def filter_forecast_date(self, queryset, name, value):
+        """Filter forecasts of runs published at the date."""
+        return queryset.published(value)
+
 
 class SaleFilter(django_filters.FilterSet):
     """
@@ -101,6 +121,45 @@ class SaleFilter(django_filters.FilterSet):
         fields = ["store", "sku", "date"]
 
 
+class SaleDailyFilter(SaleFilter):
+    """
+    Filter class for daily sales rollups with the filters of sales.
+
+    Days of the rollups are bounded by dates instead of datetimes.
+    """
+
+    date = django_filters.DateFilter()
+    date__gte = django_filters.DateFilter(field_name="date", lookup_expr="gte")
+    date__lte = django_filters.DateFilter(field_name="date", lookup_expr="lte")
+
+    class Meta(SaleFilter.Meta):
+        """Meta of filter class for SaleDaily model."""
+
+        model = SaleDaily
+
+
+class GroupSaleWeeklyFilter(django_filters.FilterSet):
+    """
+    Filter class for GroupSaleWeekly model.
+
+    This filter class defines filters for weekly sales of SKU groups,
+    allowing to filter them based on store, group and week.
+    """
+
+    store = MultipleValueFilter(field_class=IntegerField)
+    group = MultipleValueFilter(
+        field_class=CharField, field_name="group__name"
+    )
+    week__gte = django_filters.DateFilter(field_name="week", lookup_expr="gte")
+    week__lte = django_filters.DateFilter(field_name="week", lookup_expr="lte")
+
+    class Meta:
+        """Meta of filter class for GroupSaleWeekly model."""
+
+        model = GroupSaleWeekly
+        fields = ["store", "group", "week"]
+
+
 class SKUFilter(django_filters.FilterSet):
     """
     Filter class for Forecast model.
@@ -109,9 +168,15 @@ class SKUFilter(django_filters.FilterSet):
     allowing to filter forecasts based on store, SKU, and forecast date.
     """
 
-    group = MultipleValueFilter(field_class=CharField)
-    category = MultipleValueFilter(field_class=CharField)
-    subcategory = MultipleValueFilter(field_class=CharField)
+    group = MultipleValueFilter(
+        field_class=CharField, field_name="group__name"
+    )
+    category = MultipleValueFilter(
+        field_class=CharField, field_name="category__name"
+    )
+    subcategory = MultipleValueFilter(
+        field_class=CharField, field_name="subcategory__name"
+    )
 
     class Meta:
         """Meta of filter class for Forecast model."""
@@ -134,19 +199,19 @@ class GroupFilter(django_filters.FilterSet):
 
     store = MultipleValueFilter(
         field_class=IntegerField,
-        field_name="sku_sales__store_id",
+        field_name="skus__assortment__store_id",
     )
 
     class Meta:
         """Meta of filter class for SKU categories."""
 
-        model = SKU
+        model = SKUGroup
         fields = [
             "store",
         ]
 
 
-class CategoryFilter(GroupFilter):
+class CategoryFilter(django_filters.FilterSet):
     """
     Filter class for SKU categories.
 
@@ -154,12 +219,35 @@ class CategoryFilter(GroupFilter):
     allowing to filter categories based on groups and stores.
     """
 
-    group = MultipleValueFilter(field_class=CharField)
+    store = MultipleValueFilter(
+        field_class=IntegerField,
+        field_name="skus__assortment__store_id",
+    )
+    group = MultipleValueFilter(
+        field_class=CharField,
+        field_name="skus__group__name",
+    )
 
-    class Meta(GroupFilter.Meta):
+    class Meta:
         """Meta of filter class for SKU categories."""
 
-        fields = GroupFilter.Meta.fields + ["group"]
+        model = SKUCategory
+        fields = ["store", "group"]
+
+    def filter_queryset(self, queryset):
+        """
+        Filter levels of the hierarchy by conditions on the same SKUs.
+
+        Conditions are applied at once, so a level matches only if one
+        of its SKUs matches all of them.
+        """
+        lookups = {}
+        for name, value in self.form.cleaned_data.items():
+            if value not in EMPTY_VALUES:
+                sku_filter = self.filters[name]
+                lookup = f"{sku_filter.field_name}__{sku_filter.lookup_expr}"
+                lookups[lookup] = value
+        return queryset.filter(**lookups)
 
 
 class SubcategoryFiler(CategoryFilter):
@@ -170,9 +258,13 @@ class SubcategoryFiler(CategoryFilter):
     allowing to filter subcategories based on stores, groups, categories.
     """
 
-    category = MultipleValueFilter(field_class=CharField)
+    category = MultipleValueFilter(
+        field_class=CharField,
+        field_name="skus__category__name",
+    )
 
     class Meta(CategoryFilter.Meta):
         """Meta of filter class for SKU subcategories."""
 
+        model = SKUSubcategory
         fields = CategoryFilter.Meta.fields + ["category"]
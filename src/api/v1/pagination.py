@@ -1,8 +1,131 @@
+import json
+from base64 import urlsafe_b64decode, urlsafe_b64encode
+from binascii import Error as DecodeError
+from collections import OrderedDict
+
 from django.conf import settings
+from django.core.paginator import EmptyPage, Page, PageNotAnInteger, Paginator
+from django.db import connections
+from django.db.models import BooleanField, QuerySet
+from django.db.models.expressions import RawSQL
+from django.utils.functional import cached_property
 from django.utils.translation import gettext_lazy as _
 from rest_framework import pagination
+from rest_framework.exceptions import NotFound
+from rest_framework.response import Response
+from rest_framework.utils.urls import replace_query_param
 
 DEFAULT_PAGE_SIZE = 5
+COUNT_ESTIMATED = "estimated"
+
+
+# Rows of the table or of all leaf partitions of the partitioned table,
+# views have no statistics and tables not analyzed yet have negative ones.
+RELTUPLES_SQL = """
+SELECT SUM(reltuples), MIN(reltuples)
+FROM pg_class
+WHERE relkind = 'r' AND (
+    oid = %s::regclass
+    OR oid IN (SELECT relid FROM pg_partition_tree(%s::regclass) WHERE isleaf)
+)
+"""
+
+
+def is_whole_table(queryset):
+    """Check if the queryset selects every row of its table once."""
+    query = queryset.query
+    if query.where or query.distinct or query.group_by or query.combinator:
+        return False
+    return not query.low_mark and query.high_mark is None
+
+
+def get_estimated_count(queryset):
+    """
+    Return planner estimate of the queryset rows, None if unsupported.
+
+    Estimates of whole tables come from their statistics in ``pg_class``,
+    estimates of filtered querysets and of tables without statistics
+    from their plans.
+    """
+    connection = connections[queryset.db]
+    if connection.vendor != "postgresql":
+        return None
+    if is_whole_table(queryset):
+        table = queryset.model._meta.db_table
+        with connection.cursor() as cursor:
+            cursor.execute(RELTUPLES_SQL, [table, table])
+            rows, min_rows = cursor.fetchone()
+        if rows is not None and min_rows >= 0:
+            return int(rows)
+    sql, params = queryset.query.get_compiler(queryset.db).as_sql()
+    with connection.cursor() as cursor:
+        cursor.execute(f"EXPLAIN (FORMAT JSON) {sql}", params)
+        plan = cursor.fetchone()[0]
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    return int(plan[0]["Plan"]["Plan Rows"])
+
+
+class EstimatedCountPage(Page):
+    """Page of the paginator with estimated count knowing the next page."""
+
+    def __init__(self, object_list, number, paginator, next_rows):
+        super().__init__(object_list, number, paginator)
+        self.next_rows = next_rows
+
+    def has_next(self):
+        """Check if there are rows after the page."""
+        return self.next_rows
+
+
+class EstimatedCountPaginator(Paginator):
+    """
+    Paginator estimating counts of results above the threshold.
+
+    Smaller results are counted exactly. Pages of estimated results are
+    not limited by the count, rows after a page are checked by reading
+    one more row.
+    """
+
+    estimated = False
+
+    @cached_property
+    def count(self):
+        """Return estimated count of large results, exact count otherwise."""
+        if isinstance(self.object_list, QuerySet):
+            estimate = get_estimated_count(self.object_list)
+            if estimate is not None:
+                if estimate >= settings.PAGINATION_ESTIMATE_THRESHOLD:
+                    self.estimated = True
+                    return estimate
+        return super().count
+
+    def validate_number(self, number):
+        """Validate page number, not limited by estimated counts."""
+        self.count  # Rows are counted or estimated first.
+        if not self.estimated:
+            return super().validate_number(number)
+        try:
+            number = int(number)
+        except (TypeError, ValueError):
+            raise PageNotAnInteger(_("That page number is not an integer"))
+        if number < 1:
+            raise EmptyPage(_("That page number is less than 1"))
+        return number
+
+    def page(self, number):
+        """Return page of the number reading one row after it."""
+        number = self.validate_number(number)
+        if not self.estimated:
+            return super().page(number)
+        bottom = (number - 1) * self.per_page
+        top = bottom + self.per_page + 1
+        rows = list(self.object_list[bottom:top])
+        if not rows and number > 1:
+            raise EmptyPage(_("That page contains no results"))
+        return EstimatedCountPage(
+            rows[: self.per_page], number, self, len(rows) > self.per_page
+        )
 
 
 class PageNumberPaginationWithLimit(pagination.PageNumberPagination):
@@ -18,3 +141,137 @@ class PageNumberPaginationWithLimit(pagination.PageNumberPagination):
         "Number of results to return per page. "
         'Set equal "false" to turn off pagination'
     )
+    count_query_param = "count"
+    count_query_description = _(
+        f'Set equal "{COUNT_ESTIMATED}" to estimate counts of large results'
+    )
+
+    def paginate_queryset(self, queryset, request, view=None):
+        """Paginate the queryset estimating its count if requested."""
+        self.count_estimated = (
+            request.query_params.get(self.count_query_param) == COUNT_ESTIMATED
+        )
+        if self.count_estimated:
+            self.django_paginator_class = EstimatedCountPaginator
+        return super().paginate_queryset(queryset, request, view)
+
+    def get_paginated_response(self, data):
+        """Return page telling if the count is estimated if requested."""
+        if not self.count_estimated:
+            return super().get_paginated_response(data)
+        return Response(
+            OrderedDict(
+                [
+                    ("count", self.page.paginator.count),
+                    ("count_estimated", self.page.paginator.estimated),
+                    ("next", self.get_next_link()),
+                    ("previous", self.get_previous_link()),
+                    ("results", data),
+                ]
+            )
+        )
+
+
+class KeysetPagination(pagination.BasePagination):
+    """
+    Cursor pagination by the key fields of the view ordering.
+
+    Rows of a page follow the key of the last row of the previous page
+    passed by the cursor, so pages are read by the index of the key
+    at the same cost wherever they are.
+    """
+
+    page_size = PageNumberPaginationWithLimit.page_size
+    page_size_query_param = "limit"
+    cursor_query_param = "cursor"
+    cursor_query_description = _(
+        "Key of the last row of the previous page. "
+        "Set empty to get the first page by key"
+    )
+    invalid_cursor_message = _("Invalid cursor")
+
+    def paginate_queryset(self, queryset, request, view=None):
+        """Return page of rows following the key of the cursor."""
+        self.request = request
+        fields = [
+            queryset.model._meta.get_field(name)
+            for name in view.cursor_ordering
+        ]
+        queryset = queryset.order_by(*view.cursor_ordering)
+        if cursor := request.query_params.get(self.cursor_query_param):
+            queryset = queryset.filter(
+                self.get_key_condition(queryset, fields, cursor)
+            )
+
+        page_size = self.get_page_size(request)
+        rows = list(queryset[: page_size + 1])
+        self.next_key = None
+        if len(rows) > page_size:
+            rows = rows[:page_size]
+            self.next_key = self.get_key(rows[-1], fields)
+        return rows
+
+    def get_page_size(self, request):
+        """Return page size of the request limit."""
+        try:
+            page_size = int(request.query_params[self.page_size_query_param])
+        except (KeyError, ValueError):
+            return self.page_size
+        return page_size if page_size > 0 else self.page_size
+
+    def get_key(self, row, fields):
+        """Return key of the row, rows of values are dictionaries."""
+        if isinstance(row, dict):
+            values = [row[field.name] for field in fields]
+        else:
+            values = [getattr(row, field.attname) for field in fields]
+        return [str(value) for value in values]
+
+    def get_key_condition(self, queryset, fields, cursor):
+        """Return condition of rows with keys after the cursor key."""
+        connection = connections[queryset.db]
+        try:
+            key = json.loads(urlsafe_b64decode(cursor.encode()))
+            values = [
+                field.get_db_prep_value(field.to_python(value), connection)
+                for field, value in zip(fields, key, strict=True)
+            ]
+        except (DecodeError, TypeError, ValueError) as error:
+            raise NotFound(self.invalid_cursor_message) from error
+
+        table = connection.ops.quote_name(queryset.model._meta.db_table)
+        columns = ", ".join(
+            f"{table}.{connection.ops.quote_name(field.column)}"
+            for field in fields
+        )
+        placeholders = ", ".join(["%s"] * len(fields))
+        return RawSQL(
+            f"({columns}) > ({placeholders})",
+            values,
+            output_field=BooleanField(),
+        )
+
+    def get_next_link(self):
+        """Return link to the page following the last row key."""
+        if self.next_key is None:
+            return None
+        cursor = urlsafe_b64encode(json.dumps(self.next_key).encode())
+        return replace_query_param(
+            self.request.build_absolute_uri(),
+            self.cursor_query_param,
+            cursor.decode(),
+        )
+
+    def get_paginated_response(self, data):
+        """Return page with the link to the next one."""
+        return Response({"next": self.get_next_link(), "results": data})
+
+    def get_paginated_response_schema(self, schema):
+        """Return schema of the paginated response."""
+        return {
+            "type": "object",
+            "properties": {
+                "next": {"type": "string", "nullable": True},
+                "results": schema,
+            },
+        }
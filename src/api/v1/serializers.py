@@ -1,4 +1,4 @@
-from collections import OrderedDict
+from collections import OrderedDict, defaultdict
 from datetime import date
 
 from rest_framework import serializers
@@ -7,13 +7,59 @@ from rest_framework.fields import SkipField
 from rest_framework.relations import PKOnlyObject
 
 from api.v1 import filters
-from forecasts.models import SKU, Forecast, Sale, Store
+from forecasts.models import (
+    SKU,
+    Forecast,
+    GroupSaleWeekly,
+    ImportJob,
+    Sale,
+    SKUCategory,
+    SKUGroup,
+    SKUSubcategory,
+    Store,
+    UploadSession,
+)
+from forecasts.utils.constants import (
+    DATA_FILE_EXTENSIONS,
+    IMPORT_ENGINE_ORM,
+    IMPORT_ENGINES,
+    IMPORT_MODE_INSERT,
+    IMPORT_MODE_UPSERT,
+    IMPORT_MODELS,
+    IMPORT_MODES,
+    UPSERT_KEYS,
+)
+from forecasts.utils.csv_utils import ReferenceCache
+from forecasts.utils.upload_utils import get_received_chunks
 from users.models import User
 
 
+class SKUDimensionField(serializers.CharField):
+    """SKU hierarchy dimension field represented by its name."""
+
+    def __init__(self, model, **kwargs):
+        self.model = model
+        kwargs.setdefault(
+            "max_length", model._meta.get_field("name").max_length
+        )
+        super().__init__(**kwargs)
+
+    def to_representation(self, value):
+        """Return name of the dimension."""
+        return value.name
+
+    def run_validation(self, data=serializers.empty):
+        """Return unsaved dimension of the name saved with its SKU."""
+        return self.model(name=super().run_validation(data))
+
+
 class SKUSerializer(serializers.ModelSerializer):
     """SKU model serializer."""
 
+    group = SKUDimensionField(SKUGroup)
+    category = SKUDimensionField(SKUCategory)
+    subcategory = SKUDimensionField(SKUSubcategory)
+
     class Meta:
         """SKU model serializer meta."""
 
@@ -82,6 +128,77 @@ class SaleSerializer(serializers.ModelSerializer):
         )
 
 
+class GroupSaleWeeklySerializer(serializers.ModelSerializer):
+    """Weekly sales of SKU group serializer."""
+
+    group = serializers.SlugRelatedField(slug_field="name", read_only=True)
+
+    class Meta:
+        """Weekly sales of SKU group serializer meta."""
+
+        model = GroupSaleWeekly
+        fields = (
+            "store",
+            "group",
+            "week",
+            "sales_units",
+            "sales_units_promo",
+            "sales_rub",
+            "sales_rub_promo",
+        )
+
+
+class SaleCreateListSerializer(serializers.ListSerializer):
+    """Sale creation list serializer resolving natural keys at once."""
+
+    def to_internal_value(self, data):
+        """Replace natural keys of stores and SKUs of rows by their ids."""
+        rows = super().to_internal_value(data)
+        reference_cache = ReferenceCache()
+        references = {
+            name: reference_cache.resolve(
+                model, name, {row[name] for row in rows}
+            )
+            for name, model in self.child.references.items()
+        }
+
+        errors = []
+        for row in rows:
+            row_errors = {}
+            for name in self.child.references:
+                value = row.pop(name)
+                if (pk := references[name].get(value, None)) is None:
+                    row_errors[name] = [
+                        f"Object with {name}={value} does not exist "
+                        "or is not unique."
+                    ]
+                row[f"{name}_id"] = pk
+            errors.append(row_errors)
+        if any(errors):
+            raise ValidationError(errors)
+        return rows
+
+
+class SaleCreateSerializer(SaleSerializer):
+    """Sale creation serializer."""
+
+    # Referenced models by natural key fields resolved by the list serializer.
+    references = {"store": Store, "sku": SKU}
+
+    store = serializers.CharField(
+        max_length=Store._meta.get_field("store").max_length,
+    )
+    sku = serializers.CharField(
+        max_length=SKU._meta.get_field("sku").max_length,
+    )
+
+    class Meta(SaleSerializer.Meta):
+        """Sale creation serializer meta."""
+
+        fields = ("store", "sku") + SaleSerializer.Meta.fields
+        list_serializer_class = SaleCreateListSerializer
+
+
 class ForecastDataSerializer(serializers.Serializer):
     """Forecast data serializer."""
 
@@ -93,9 +210,49 @@ class ForecastDataSerializer(serializers.Serializer):
         return {str(entry["date"]): entry["target"] for entry in instance}
 
 
+def get_pairs_forecasts(request, pairs):
+    """
+    Return filtered forecasts of SKU and store pairs by the pairs.
+
+    Forecasts of all pairs are read by one query ordered by dates.
+    """
+    pairs = {(pair["sku"], pair["store"]) for pair in pairs}
+    forecasts = defaultdict(list)
+    if not pairs:
+        return forecasts
+    queryset = Forecast.objects.filter(
+        sku__in={sku for sku, _ in pairs},
+        store__in={store for _, store in pairs},
+    )
+    for forecast in (
+        filters.ForecastFilter(request.GET, queryset)
+        .qs.values("sku", "store", "date", "target")
+        .order_by("date")
+    ):
+        pair = (forecast.pop("sku"), forecast.pop("store"))
+        if pair in pairs:
+            forecasts[pair].append(forecast)
+    return forecasts
+
+
+class ForecastListSerializer(serializers.ListSerializer):
+    """Forecast list serializer loading forecasts of all pairs at once."""
+
+    def to_representation(self, data):
+        """Load forecasts of the listed pairs before serializing them."""
+        pairs = list(data)
+        self.child.forecasts = get_pairs_forecasts(
+            self.context["request"], pairs
+        )
+        return super().to_representation(pairs)
+
+
 class ForecastSerializer(serializers.ModelSerializer):
     """Forecast model serializer."""
 
+    # Forecasts by pairs loaded by the list serializer.
+    forecasts = None
+
     store = serializers.SlugRelatedField(
         slug_field="store",
         queryset=Store.objects.all(),
@@ -125,21 +282,17 @@ class ForecastSerializer(serializers.ModelSerializer):
             "date",
             "target",
         )
+        list_serializer_class = ForecastListSerializer
 
     def get_forecast(self, forecast):
         """Serialize method to get forecast as JSON."""
-        queryset = Forecast.objects.filter(
-            sku=forecast.get("sku"), store=forecast.get("store")
-        )
-        forecasts = (
-            filters.ForecastFilter(
-                self.context["request"].GET,
-                queryset,
+        forecasts = self.forecasts
+        if forecasts is None:
+            forecasts = get_pairs_forecasts(
+                self.context["request"], [forecast]
             )
-            .qs.values("date", "target")
-            .order_by("date")
-        )
-        return ForecastDataSerializer(forecasts).data
+        pair = (forecast.get("sku"), forecast.get("store"))
+        return ForecastDataSerializer(forecasts.get(pair, [])).data
 
     def get_forecast_date(self, forecast_date):
         """Return required forecast date."""
@@ -173,6 +326,12 @@ class ForecastPostSerializer(serializers.Serializer):
     """Bulk load forecast serializer."""
 
     data = serializers.ListSerializer(child=ForecastSerializer())
+    model_version = serializers.CharField(
+        max_length=255,
+        allow_blank=True,
+        default="",
+    )
+    publish = serializers.BooleanField(default=True)
 
 
 class SKUPostSerializer(serializers.Serializer):
@@ -190,22 +349,154 @@ class StorePostSerializer(serializers.Serializer):
 class SalePostSerializer(serializers.Serializer):
     """Bulk load sale serializer."""
 
-    data = serializers.ListSerializer(child=SaleSerializer())
+    data = SaleCreateSerializer(many=True)
+    mode = serializers.ChoiceField(
+        choices=IMPORT_MODES,
+        default=IMPORT_MODE_INSERT,
+    )
 
 
 class CSVFileSerializer(serializers.Serializer):
     """Load forecast from csv serializer."""
 
     csv_file = serializers.FileField()
+    engine = serializers.ChoiceField(
+        choices=IMPORT_ENGINES,
+        default=IMPORT_ENGINE_ORM,
+    )
+    mode = serializers.ChoiceField(
+        choices=IMPORT_MODES,
+        default=IMPORT_MODE_INSERT,
+    )
 
     def validate_csv_file(self, csv_file):
         """Validate csv file format."""
-        if not csv_file.name.endswith(".csv"):
-            raise serializers.ValidationError(
-                "File must have a CSV extension."
-            )
+        validate_data_file_name(csv_file.name)
         return csv_file
 
+    def validate(self, attrs):
+        """Validate rows of the imported model can be updated."""
+        if model := self.context.get("model", None):
+            validate_import_mode(model, attrs["mode"])
+        return attrs
+
+
+class UploadSessionSerializer(serializers.ModelSerializer):
+    """Upload session model serializer."""
+
+    model = serializers.ChoiceField(
+        choices=tuple(IMPORT_MODELS),
+        write_only=True,
+    )
+    engine = serializers.ChoiceField(
+        choices=IMPORT_ENGINES,
+        default=IMPORT_ENGINE_ORM,
+    )
+    mode = serializers.ChoiceField(
+        choices=IMPORT_MODES,
+        default=IMPORT_MODE_INSERT,
+    )
+    start_import = serializers.BooleanField(default=False, write_only=True)
+    received_chunks = serializers.SerializerMethodField()
+    task_id = serializers.SerializerMethodField()
+
+    class Meta:
+        """Upload session model serializer meta."""
+
+        model = UploadSession
+        fields = (
+            "id",
+            "model",
+            "file_name",
+            "engine",
+            "mode",
+            "start_import",
+            "chunks_count",
+            "received_chunks",
+            "task_id",
+            "created_at",
+            "finalized_at",
+        )
+        read_only_fields = (
+            "chunks_count",
+            "created_at",
+            "finalized_at",
+        )
+
+    def validate_file_name(self, file_name):
+        """Validate uploaded file format."""
+        validate_data_file_name(file_name)
+        return file_name
+
+    def validate(self, attrs):
+        """Validate rows of the imported model can be updated."""
+        validate_import_mode(IMPORT_MODELS[attrs["model"]], attrs["mode"])
+        return attrs
+
+    def get_received_chunks(self, session):
+        """Return indexes of uploaded chunks."""
+        return get_received_chunks(session)
+
+    def get_task_id(self, session):
+        """Return id of the file import task."""
+        if import_job := getattr(session, "import_job", None):
+            return import_job.task_id
+        return None
+
+    def create(self, validated_data):
+        """Create upload session of the chosen model."""
+        model = IMPORT_MODELS[validated_data.pop("model")]
+        validated_data.pop("start_import")
+        validated_data["model_label"] = model._meta.label
+        return super().create(validated_data)
+
+
+class FinalizeUploadSessionSerializer(serializers.Serializer):
+    """Finalize upload session serializer."""
+
+    chunks_count = serializers.IntegerField(min_value=1)
+
+
+def validate_data_file_name(file_name):
+    """Validate data file has supported extension."""
+    if not file_name.endswith(DATA_FILE_EXTENSIONS):
+        raise serializers.ValidationError(
+            "File must be CSV, optionally compressed with gzip or zstd, "
+            "Parquet or Arrow IPC file."
+        )
+
+
+def validate_import_mode(model, mode):
+    """Validate model data can be imported in the mode."""
+    if mode == IMPORT_MODE_UPSERT and model not in UPSERT_KEYS:
+        raise serializers.ValidationError(
+            {"mode": f"Upsert is not supported for {model.__name__}."}
+        )
+
+
+class ImportJobSerializer(serializers.ModelSerializer):
+    """Import job model serializer."""
+
+    throughput = serializers.ReadOnlyField()
+
+    class Meta:
+        """Import job model serializer meta."""
+
+        model = ImportJob
+        fields = (
+            "task_id",
+            "mode",
+            "status",
+            "rows_read",
+            "rows_inserted",
+            "rows_rejected",
+            "throughput",
+            "errors",
+            "created_at",
+            "started_at",
+            "finished_at",
+        )
+
 
 class UserSerializer(serializers.ModelSerializer):
     """User model serializer."""
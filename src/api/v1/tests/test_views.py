@@ -1,12 +1,37 @@
 import csv
+import gzip
+import json
 import os
+import shutil
+import tempfile
+from base64 import urlsafe_b64encode
+from datetime import date
+from unittest import skipUnless
+from unittest.mock import patch
 
-from django.test import TestCase
+from django.core.cache import cache
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
 from rest_framework import status
 from rest_framework.test import APIClient
 from rest_framework_simplejwt.tokens import RefreshToken
 
-from forecasts.models import SKU
+from api.v1.pagination import KeysetPagination, get_estimated_count
+from forecasts.models import (
+    SKU,
+    Forecast,
+    ForecastRun,
+    ForecastSeries,
+    ImportJob,
+    Sale,
+    SKUCategory,
+    SKUGroup,
+    SKUSubcategory,
+    Store,
+)
 from users.models import User
 
 
@@ -23,6 +48,7 @@ class SKUViewSetTest(TestCase):
 
     def setUp(self):
         """Create sample client and SKU for testing."""
+        cache.clear()
         self.csv_data = [
             [
                 "pr_sku_id",
@@ -52,9 +78,9 @@ class SKUViewSetTest(TestCase):
 
         skus = [
             SKU(
-                group=f"Group{i}",
-                category=f"Category{i}",
-                subcategory=f"Subcategory{1}",
+                group=SKUGroup(name=f"Group{i}"),
+                category=SKUCategory(name=f"Category{i}"),
+                subcategory=SKUSubcategory(name=f"Subcategory{1}"),
                 sku=f"SKU{1}",
                 uom=17,
             )
@@ -93,21 +119,745 @@ class SKUViewSetTest(TestCase):
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertGreater(len(response.data), 0)
 
+    def test_list_hierarchy(self):
+        """Test SKU hierarchy lists are filtered by upper levels."""
+        response = self.auth_client.get("/api/v1/groups/")
+        self.assertEqual(len(response.data["groups"]), 5)
+        response = self.auth_client.get(
+            "/api/v1/categories/", {"group": ["Group1", "Group3"]}
+        )
+        self.assertEqual(
+            sorted(response.data["categories"]), ["Category1", "Category3"]
+        )
+        response = self.auth_client.get(
+            self.url, {"category": "Category2", "limit": "false"}
+        )
+        self.assertEqual(response.data[0]["group"], "Group2")
+
+    def test_list_store_hierarchy(self):
+        """Test SKU hierarchy lists are filtered by store assortment."""
+        store = Store.objects.create(
+            store="Store1",
+            city="City1",
+            division="Division1",
+            type_format=1,
+            loc=1,
+            size=1,
+            is_active=True,
+        )
+        Sale.objects.create(
+            store=store,
+            sku=SKU.objects.get(group__name="Group3"),
+            date=timezone.now(),
+            sales_type=False,
+            sales_units=1,
+            sales_units_promo=0,
+            sales_rub=1,
+            sales_rub_promo=0,
+        )
+        response = self.auth_client.get("/api/v1/groups/", {"store": store.pk})
+        self.assertEqual(response.data["groups"], ["Group3"])
+        response = self.auth_client.get(
+            "/api/v1/subcategories/", {"store": store.pk}
+        )
+        self.assertEqual(response.data["subcategories"], ["Subcategory1"])
+
+    def test_list_store_hierarchy_of_same_skus(self):
+        """Test hierarchy filters match the same SKUs of a level."""
+        store = Store.objects.create(
+            store="Store1",
+            city="City1",
+            division="Division1",
+            type_format=1,
+            loc=1,
+            size=1,
+            is_active=True,
+        )
+        Sale.objects.create(
+            store=store,
+            sku=SKU.objects.get(group__name="Group3"),
+            date=timezone.now(),
+            sales_type=False,
+            sales_units=1,
+            sales_units_promo=0,
+            sales_rub=1,
+            sales_rub_promo=0,
+        )
+        # The category has another SKU of another group not sold in store.
+        SKU.objects.create(
+            group=SKUGroup.objects.get(name="Group2"),
+            category=SKUCategory.objects.get(name="Category3"),
+            subcategory=SKUSubcategory.objects.get(name="Subcategory1"),
+            sku="SKU2",
+            uom=17,
+        )
+        for group, categories in (("Group2", []), ("Group3", ["Category3"])):
+            response = self.auth_client.get(
+                "/api/v1/categories/", {"store": store.pk, "group": group}
+            )
+            self.assertEqual(response.data["categories"], categories)
+        response = self.auth_client.get(
+            "/api/v1/subcategories/",
+            {"store": store.pk, "category": "Category3", "group": "Group2"},
+        )
+        self.assertEqual(response.data["subcategories"], [])
+
+    def test_list_groups_conditionally(self):
+        """Test unchanged hierarchy is not listed again by its ETag."""
+        url = "/api/v1/groups/"
+        response = self.auth_client.get(url)
+        etag = response["ETag"]
+        self.assertIn("must-revalidate", response["Cache-Control"])
+
+        # Only the authenticated user and versions of the tables are read.
+        with self.assertNumQueries(2):
+            response = self.auth_client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+        self.assertEqual(response["ETag"], etag)
+        response = self.auth_client.get(
+            url, HTTP_IF_MODIFIED_SINCE=response["Last-Modified"]
+        )
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+
+        response = self.auth_client.get(
+            url, {"store": 1}, HTTP_IF_NONE_MATCH=etag
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        SKUGroup.objects.filter(name="Group1").update(name="Group6")
+        response = self.auth_client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertIn("Group6", response.data["groups"])
+
+    def test_list_hierarchy_cached(self):
+        """Test hierarchy lists are cached until their tables change."""
+        url = "/api/v1/categories/"
+        params = {"group": ["Group3", "Group1"]}
+        response = self.auth_client.get(url, params)
+        self.assertEqual(response["X-Cache"], "MISS")
+        # Lists are cached by the filters given in any order.
+        with self.assertNumQueries(2):
+            response = self.auth_client.get(
+                url, {"group": ["Group1", "Group3"], "unknown": 1}
+            )
+        self.assertEqual(response["X-Cache"], "HIT")
+        self.assertEqual(
+            sorted(response.data["categories"]), ["Category1", "Category3"]
+        )
+
+        SKUCategory.objects.filter(name="Category1").update(name="Category6")
+        response = self.auth_client.get(url, params)
+        self.assertEqual(response["X-Cache"], "MISS")
+        self.assertEqual(
+            sorted(response.data["categories"]), ["Category3", "Category6"]
+        )
+
     def test_create_from_csv(self):
         """Test create skus from csv file."""
         count = SKU.objects.count()
         with open(self.csv_file_path, "r") as file:
             csv_data = {"csv_file": file}
-            response = self.client.post(
-                self.url + "create_from_csv/", csv_data, format="json"
+            response = self.auth_client.post(
+                self.url + "create_from_csv/", csv_data
             )
         self.assertEqual(response.status_code, status.HTTP_201_CREATED)
         expected_sku_count = len(self.csv_data) - 1 + count
         self.assertEqual(SKU.objects.count(), expected_sku_count)
 
+    def test_create_from_compressed_csv(self):
+        """Test create skus from gzip compressed csv file."""
+        count = SKU.objects.count()
+        with open(self.csv_file_path, "rb") as file:
+            csv_file = SimpleUploadedFile(
+                "skus.csv.gz",
+                gzip.compress(file.read()),
+            )
+        response = self.auth_client.post(
+            self.url + "create_from_csv/", {"csv_file": csv_file}
+        )
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(SKU.objects.count(), len(self.csv_data) - 1 + count)
+
+    def test_get_import_status(self):
+        """Test import progress of csv file is returned by task id."""
+        with open(self.csv_file_path, "r") as file:
+            response = self.auth_client.post(
+                self.url + "create_from_csv/", {"csv_file": file}
+            )
+        task_id = response.data["task_id"]
+
+        response = self.auth_client.get(
+            self.url + "get_import_status/", {"task_id": task_id}
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            response.data["status"], ImportJob.StatusChoices.SUCCESS
+        )
+        self.assertEqual(response.data["rows_read"], len(self.csv_data) - 1)
+        self.assertEqual(response.data["rows_rejected"], 0)
+
+        response = self.auth_client.get(
+            "/api/v1/sales/get_import_status/", {"task_id": task_id}
+        )
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+        user = User.objects.create_user(
+            email="other@mail.com",
+            first_name="FirstName",
+            last_name="LastName",
+            password="password",
+        )
+        client = APIClient()
+        client.credentials(
+            HTTP_AUTHORIZATION=(
+                f"Bearer {RefreshToken.for_user(user).access_token}"
+            ),
+        )
+        response = client.get(
+            self.url + "get_import_status/", {"task_id": task_id}
+        )
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_upsert_from_csv_not_supported(self):
+        """Test skus can not be upserted from csv file."""
+        with open(self.csv_file_path, "r") as file:
+            response = self.auth_client.post(
+                self.url + "create_from_csv/",
+                {"csv_file": file, "mode": "upsert"},
+            )
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn("mode", response.data)
+
     def test_retrieve_sku(self):
         """Test view return valid retrieve response."""
         sku = SKU.objects.first()
         response = self.auth_client.get(f"{self.url}{sku.pk}/")
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertEqual(response.data["group"], sku.group)
+        self.assertEqual(response.data["group"], sku.group.name)
+
+
+class SaleViewSetTest(TestCase):
+    """Sale view set testcase class."""
+
+    def setUp(self):
+        """Create sample store and SKU for testing."""
+        self.url = "/api/v1/sales/"
+        self.client = APIClient()
+        Store.objects.create(
+            store="Store1",
+            city="City1",
+            division="Division1",
+            type_format=1,
+            loc=1,
+            size=1,
+            is_active=True,
+        )
+        SKU.objects.create(
+            group=SKUGroup(name="Group1"),
+            category=SKUCategory(name="Category1"),
+            subcategory=SKUSubcategory(name="Subcategory1"),
+            sku="SKU1",
+            uom=1,
+        )
+
+    def get_sale_data(self, sales_units):
+        """Return sale data of the store and SKU."""
+        return {
+            "store": "Store1",
+            "sku": "SKU1",
+            "date": "2023-01-01T00:00:00Z",
+            "sales_type": False,
+            "sales_units": sales_units,
+            "sales_units_promo": 0,
+            "sales_rub": "100.00",
+            "sales_rub_promo": "0.00",
+        }
+
+    def test_create_sales_ignores_duplicates(self):
+        """Test sales resent in the insert mode are not duplicated."""
+        data = {"data": [self.get_sale_data(1)]}
+        for _ in range(2):
+            response = self.client.post(self.url, data, format="json")
+            self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(Sale.objects.get().sales_units, 1)
+
+    def test_create_sales_resolves_keys_at_once(self):
+        """Test stores and SKUs of sales are looked up once per request."""
+        queries = []
+        for rows in (1, 5):
+            with CaptureQueriesContext(connection) as context:
+                response = self.client.post(
+                    self.url,
+                    {"data": [self.get_sale_data(i) for i in range(rows)]},
+                    format="json",
+                )
+            self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+            queries.append(len(context))
+        self.assertEqual(queries[0], queries[1])
+
+    def test_create_sales_of_unknown_keys(self):
+        """Test missing and ambiguous keys are errors of their rows."""
+        SKU.objects.create(
+            group=SKUGroup(name="Group1"),
+            category=SKUCategory(name="Category1"),
+            subcategory=SKUSubcategory(name="Subcategory1"),
+            sku="SKU2",
+            uom=1,
+        )
+        SKU.objects.create(
+            group=SKUGroup(name="Group1"),
+            category=SKUCategory(name="Category1"),
+            subcategory=SKUSubcategory(name="Subcategory1"),
+            sku="SKU2",
+            uom=2,
+        )
+        rows = [self.get_sale_data(1) for _ in range(3)]
+        rows[1]["store"] = "Store2"
+        rows[2]["sku"] = "SKU2"
+        response = self.client.post(self.url, {"data": rows}, format="json")
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        errors = response.data["data"]
+        self.assertEqual(errors[0], {})
+        self.assertEqual(list(errors[1]), ["store"])
+        self.assertEqual(list(errors[2]), ["sku"])
+        self.assertFalse(Sale.objects.exists())
+
+    def test_upsert_sales(self):
+        """Test resent sales are updated in the upsert mode."""
+        self.client.post(
+            self.url,
+            {"data": [self.get_sale_data(1)]},
+            format="json",
+        )
+        response = self.client.post(
+            self.url,
+            {
+                "data": [self.get_sale_data(2), self.get_sale_data(3)],
+                "mode": "upsert",
+            },
+            format="json",
+        )
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(Sale.objects.get().sales_units, 3)
+
+    def test_weekly_group_sales(self):
+        """Test weekly sales of groups follow upserted sales."""
+        for sales_units in (1, 2):
+            self.client.post(
+                self.url,
+                {"data": [self.get_sale_data(sales_units)], "mode": "upsert"},
+                format="json",
+            )
+        response = self.client.get(
+            f"{self.url}weekly/",
+            {"group": "Group1", "week__gte": "2022-12-26", "limit": "false"},
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.data), 1)
+        self.assertEqual(response.data[0]["week"], "2022-12-26")
+        self.assertEqual(response.data[0]["sales_units"], 2)
+        self.assertEqual(response.data[0]["sales_rub"], "100.00")
+
+    def test_list_sales_by_cursor(self):
+        """Test sales are listed by pages following cursors."""
+        data = [
+            {
+                **self.get_sale_data(1),
+                "date": f"2023-01-0{day}T00:00:00Z",
+                "sales_type": sales_type,
+            }
+            for day in (3, 1, 2)
+            for sales_type in (True, False)
+        ]
+        self.client.post(self.url, {"data": data}, format="json")
+
+        sales, url, params = [], self.url, {"cursor": "", "limit": 4}
+        while url:
+            response = self.client.get(url, params)
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            sales += [
+                (sale["date"][:10], sale["sales_type"])
+                for sale in response.data["results"]
+            ]
+            url, params = response.data["next"], None
+        self.assertEqual(
+            sales,
+            [
+                (f"2023-01-0{day}", sales_type)
+                for day in (1, 2, 3)
+                for sales_type in (False, True)
+            ],
+        )
+
+        response = self.client.get(self.url, {"cursor": "invalid"})
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_cursor_prepared_by_queryset_database(self):
+        """Test cursor keys are prepared for the database of the rows."""
+        queryset = Sale.objects.using("replica_0").order_by("store", "sku")
+        fields = [Sale._meta.get_field(name) for name in ("store", "sku")]
+        cursor = urlsafe_b64encode(json.dumps(["1", "2"]).encode()).decode()
+        with patch("api.v1.pagination.connections") as connections:
+            connections["replica_0"].ops.quote_name.side_effect = str
+            KeysetPagination().get_key_condition(queryset, fields, cursor)
+        connections.__getitem__.assert_called_with("replica_0")
+
+    def test_export_sales(self):
+        """Test filtered sales are streamed as a CSV or NDJSON file."""
+        data = [
+            {**self.get_sale_data(day), "date": f"2023-01-0{day}T00:00:00Z"}
+            for day in (2, 1, 3)
+        ]
+        self.client.post(self.url, {"data": data}, format="json")
+        url = self.url + "export/"
+
+        response = self.client.get(url, {"date__gte": "2023-01-02T00:00:00Z"})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response["Content-Type"], "text/csv")
+        content = b"".join(response.streaming_content).decode("utf-8")
+        rows = list(csv.DictReader(content.splitlines()))
+        self.assertEqual(
+            [row["pr_sales_in_units"] for row in rows], ["2", "3"]
+        )
+
+        response = self.client.get(url, {"export_format": "ndjson"})
+        self.assertEqual(response["Content-Type"], "application/x-ndjson")
+        self.assertEqual(len(list(response.streaming_content)), 1)
+
+        response = self.client.get(url, {"export_format": "xml"})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    @skipUnless(connection.vendor == "postgresql", "PostgreSQL is required")
+    def test_table_count_estimated_by_statistics(self):
+        """Test rows of whole tables are estimated by their statistics."""
+        data = [
+            {
+                **self.get_sale_data(day),
+                "date": f"2023-0{month}-0{day}T00:00:00Z",
+            }
+            for day in (1, 2, 3)
+            for month in (1, 2)
+        ]
+        self.client.post(self.url, {"data": data}, format="json")
+        with connection.cursor() as cursor:
+            cursor.execute("ANALYZE forecasts_sale")
+        with self.assertNumQueries(1):
+            self.assertEqual(get_estimated_count(Sale.objects.all()), 6)
+
+    def test_list_sales_with_estimated_count(self):
+        """Test sales are paginated telling if their count is estimated."""
+        data = [
+            {**self.get_sale_data(1), "date": f"2023-01-0{day}T00:00:00Z"}
+            for day in (1, 2, 3)
+        ]
+        self.client.post(self.url, {"data": data}, format="json")
+
+        response = self.client.get(self.url)
+        self.assertNotIn("count_estimated", response.data)
+        response = self.client.get(self.url, {"count": "estimated"})
+        self.assertEqual(response.data["count"], 3)
+        self.assertFalse(response.data["count_estimated"])
+
+        # Estimates are made by the PostgreSQL planner only.
+        estimated = connection.vendor == "postgresql"
+        with self.settings(PAGINATION_ESTIMATE_THRESHOLD=0):
+            pages, url = [], self.url + "?count=estimated&limit=2"
+            while url:
+                response = self.client.get(url)
+                self.assertEqual(response.status_code, status.HTTP_200_OK)
+                self.assertEqual(response.data["count_estimated"], estimated)
+                pages.append(len(response.data["results"]))
+                url = response.data["next"]
+        self.assertEqual(pages, [2, 1])
+
+
+class ForecastViewSetTest(TestCase):
+    """Forecast view set testcase class."""
+
+    def setUp(self):
+        """Create sample store and SKU for testing."""
+        self.url = "/api/v1/forecasts/"
+        self.client = APIClient()
+        Store.objects.create(
+            store="Store1",
+            city="City1",
+            division="Division1",
+            type_format=1,
+            loc=1,
+            size=1,
+            is_active=True,
+        )
+        SKU.objects.create(
+            group=SKUGroup(name="Group1"),
+            category=SKUCategory(name="Category1"),
+            subcategory=SKUSubcategory(name="Subcategory1"),
+            sku="SKU1",
+            uom=1,
+        )
+
+    def post_forecasts(self, targets, publish=True):
+        """Post forecasts of the days from the first day of 2023."""
+        data = [
+            {
+                "store": "Store1",
+                "sku": "SKU1",
+                "date": f"2023-01-{day:02}",
+                "target": target,
+            }
+            for day, target in enumerate(targets, start=1)
+        ]
+        return self.client.post(
+            self.url,
+            {"data": data, "publish": publish},
+            format="json",
+        )
+
+    def get_forecasts(self, **params):
+        """Return listed forecasts of SKUs in stores."""
+        response = self.client.get(self.url, params)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return [result["forecast"] for result in response.data["results"]]
+
+    def test_forecasts_published_as_series(self):
+        """Test forecasts posted in batches are listed after publishing."""
+        response = self.post_forecasts([1, 2, 3], publish=False)
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(self.get_forecasts(), [])
+
+        self.post_forecasts([4])
+        self.assertEqual(ForecastSeries.objects.get().targets, [4, 2, 3])
+        expected = [{"2023-01-01": 4, "2023-01-02": 2, "2023-01-03": 3}]
+        self.assertEqual(self.get_forecasts(), expected)
+        self.assertEqual(
+            self.get_forecasts(forecast_date=timezone.localdate()),
+            expected,
+        )
+
+    def test_new_run_replaces_current(self):
+        """Test published run replaces the current run of the store."""
+        self.post_forecasts([1, 2, 3])
+        self.post_forecasts([5])
+        self.assertEqual(self.get_forecasts(), [{"2023-01-01": 5}])
+
+    def test_statistics_aggregated(self):
+        """Test statistics are read as totals of store SKUs."""
+        self.post_forecasts([3, 4])
+        Sale.objects.bulk_create(
+            Sale(
+                store=Store.objects.get(),
+                sku=SKU.objects.get(),
+                date=f"2023-01-0{day}T00:00:00Z",
+                sales_type=sales_type,
+                sales_units=day,
+                sales_units_promo=0,
+                sales_rub=50,
+                sales_rub_promo=0,
+            )
+            for day in (1, 2)
+            for sales_type in (False, True)
+        )
+        # Existence of forecasts and sales is checked before the totals.
+        with self.assertNumQueries(3):
+            response = self.client.get(f"{self.url}get_statistics/")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        statistics = response.json()
+        self.assertEqual(len(statistics), 1)
+        expected = {
+            "target": 7,
+            "sales_units": 6,
+            "sales_units_promo": 0,
+            "sales_rub": 200,
+            "sales_rub_promo": 0,
+            "price": 200 / 6,
+            "quantity_difference": -1,
+            "amount_difference": -200 / 6,
+            "WAPE": -1 / 6,
+        }
+        for name, value in expected.items():
+            self.assertAlmostEqual(float(statistics[0][name]), value, msg=name)
+
+        response = self.client.get(
+            f"{self.url}get_statistics/",
+            {"date__gte": "2023-01-02", "date__lte": "2023-01-02"},
+        )
+        self.assertEqual(response.json()[0]["target"], 4)
+        self.assertEqual(response.json()[0]["sales_units"], 4)
+        response = self.client.get(
+            f"{self.url}get_statistics/", {"date__gte": "tomorrow"}
+        )
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_forecasts_listed_by_constant_queries(self):
+        """Test forecasts of all listed pairs are read at once."""
+        store = Store.objects.get()
+        skus = SKU.objects.bulk_create(
+            SKU(
+                group=SKUGroup(name="Group1"),
+                category=SKUCategory(name="Category1"),
+                subcategory=SKUSubcategory(name="Subcategory1"),
+                sku=f"SKU{number}",
+                uom=1,
+            )
+            for number in range(2, 8)
+        )
+        run = ForecastRun.objects.get_open()
+        ForecastSeries.objects.add_forecasts(
+            run,
+            [
+                Forecast(
+                    store=store, sku=sku, date=date(2023, 1, day), target=day
+                )
+                for sku in skus
+                for day in (2, 1)
+            ],
+        )
+        run.publish()
+
+        with self.assertNumQueries(2):
+            response = self.client.get(self.url, {"limit": "false"})
+        forecasts = {
+            result["sku"]: result["forecast"] for result in response.data
+        }
+        self.assertEqual(
+            forecasts,
+            {sku.pk: {"2023-01-01": 1, "2023-01-02": 2} for sku in skus},
+        )
+
+
+class UploadSessionViewSetTest(TestCase):
+    """Upload session view set testcase class."""
+
+    def setUp(self):
+        """Create temporary media root and sample CSV content."""
+        self.media_root = tempfile.mkdtemp()
+        self.settings_override = override_settings(MEDIA_ROOT=self.media_root)
+        self.settings_override.enable()
+        self.url = "/api/v1/upload_sessions/"
+        self.client = self.get_client("test@mail.com")
+        self.content = (
+            b"pr_sku_id,pr_group_id,pr_cat_id,pr_subcat_id,pr_uom_id\n"
+            b"SKU1,Group1,Category1,Subcategory1,17\n"
+            b"SKU2,Group1,Category1,Subcategory1,1\n"
+        )
+
+    def tearDown(self):
+        """Remove temporary media root."""
+        self.settings_override.disable()
+        shutil.rmtree(self.media_root, ignore_errors=True)
+
+    def get_client(self, email):
+        """Return client authenticated as a new user with the email."""
+        user = User.objects.create_user(
+            email=email,
+            first_name="FirstName",
+            last_name="LastName",
+            password="password",
+        )
+        client = APIClient()
+        client.credentials(
+            HTTP_AUTHORIZATION=(
+                f"Bearer {RefreshToken.for_user(user).access_token}"
+            ),
+        )
+        return client
+
+    def open_session(self):
+        """Open upload session of SKUs file."""
+        response = self.client.post(
+            self.url,
+            {"model": "sku", "file_name": "skus.csv"},
+        )
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        return response.data["id"]
+
+    def upload_chunk(self, session_id, index, content):
+        """Upload chunk of the file."""
+        return self.client.put(
+            f"{self.url}{session_id}/chunks/{index}/",
+            content,
+            content_type="application/octet-stream",
+        )
+
+    def test_chunked_upload(self):
+        """Test file uploaded by chunks is imported after finalization."""
+        session_id = self.open_session()
+        chunks = [self.content[:30], self.content[30:70], self.content[70:]]
+        self.upload_chunk(session_id, 2, chunks[2])
+        self.upload_chunk(session_id, 0, b"broken chunk")
+        # Chunk uploaded again replaces the previous one.
+        self.upload_chunk(session_id, 0, chunks[0])
+        response = self.upload_chunk(session_id, 1, chunks[1])
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["size"], len(chunks[1]))
+
+        response = self.client.get(f"{self.url}{session_id}/")
+        self.assertEqual(response.data["received_chunks"], [0, 1, 2])
+
+        response = self.client.post(
+            f"{self.url}{session_id}/finalize/",
+            {"chunks_count": 3},
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(SKU.objects.count(), 2)
+        job = ImportJob.objects.get(task_id=response.data["task_id"])
+        self.assertEqual(job.status, ImportJob.StatusChoices.SUCCESS)
+        self.assertEqual(job.rows_read, 2)
+
+        response = self.upload_chunk(session_id, 3, b"late chunk")
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_import_job_created_with_session(self):
+        """Test import job created with the session waits for finalization."""
+        response = self.client.post(
+            self.url,
+            {"model": "sku", "file_name": "skus.csv", "start_import": True},
+        )
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        session_id = response.data["id"]
+        job = ImportJob.objects.get(task_id=response.data["task_id"])
+        self.assertEqual(job.status, ImportJob.StatusChoices.PENDING)
+
+        self.upload_chunk(session_id, 0, self.content)
+        job.refresh_from_db()
+        self.assertEqual(job.status, ImportJob.StatusChoices.PENDING)
+        self.assertFalse(SKU.objects.exists())
+
+        response = self.client.post(
+            f"{self.url}{session_id}/finalize/",
+            {"chunks_count": 1},
+        )
+        self.assertEqual(response.data["task_id"], job.task_id)
+        job.refresh_from_db()
+        self.assertEqual(job.status, ImportJob.StatusChoices.SUCCESS)
+        self.assertEqual(SKU.objects.count(), 2)
+
+    def test_finalize_with_missing_chunks(self):
+        """Test session is not finalized until all chunks are uploaded."""
+        session_id = self.open_session()
+        self.upload_chunk(session_id, 1, self.content)
+        response = self.client.post(
+            f"{self.url}{session_id}/finalize/",
+            {"chunks_count": 3},
+        )
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(response.data["missing_chunks"], [0, 2])
+        self.assertFalse(ImportJob.objects.exists())
+
+    def test_empty_chunk(self):
+        """Test empty chunks are rejected."""
+        session_id = self.open_session()
+        response = self.upload_chunk(session_id, 0, b"")
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_sessions_of_another_user(self):
+        """Test sessions are available to their owners only."""
+        session_id = self.open_session()
+        self.client = self.get_client("other@mail.com")
+        response = self.client.get(f"{self.url}{session_id}/")
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+        response = self.upload_chunk(session_id, 0, self.content)
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+        self.client = APIClient()
+        response = self.client.get(f"{self.url}{session_id}/")
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
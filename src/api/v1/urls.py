@@ -26,6 +26,11 @@ v1_router.register(
 v1_router.register(r"shops", views.StoreViewSet, basename="shops")
 v1_router.register(r"sales", views.SaleViewSet, basename="sales")
 v1_router.register(r"forecasts", views.ForecastViewSet, basename="forecasts")
+v1_router.register(
+    r"upload_sessions",
+    views.UploadSessionViewSet,
+    basename="upload_sessions",
+)
 v1_router.register(r"user", views.UserViewSet, basename="user")
 
 urlpatterns = [
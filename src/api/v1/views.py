@@ -1,6 +1,15 @@
 import json
-
-from django.http import FileResponse
+from hashlib import md5
+
+from django.conf import settings
+from django.http import FileResponse, StreamingHttpResponse
+from django.utils import timezone
+from django.utils.cache import (
+    get_conditional_response,
+    patch_cache_control,
+    patch_vary_headers,
+)
+from django.utils.http import http_date, quote_etag
 from django_filters.rest_framework import DjangoFilterBackend
 from drf_yasg import openapi
 from drf_yasg.utils import swagger_auto_schema
@@ -12,16 +21,105 @@ from rest_framework.response import Response
 from rest_framework.viewsets import GenericViewSet
 
 from api.v1 import filters, serializers
+from api.v1.pagination import KeysetPagination
 from forecasts import models
-from forecasts.models import AsyncFileResults, Forecast
-from forecasts.tasks import forecast_tasks
-from forecasts.utils.csv_utils import import_data, read_csv_file
+from forecasts.errors import UploadError
+from forecasts.models import (
+    AsyncFileResults,
+    Forecast,
+    ForecastRun,
+    ImportJob,
+    UploadSession,
+)
+from forecasts.tasks import forecast_tasks, import_tasks
+from forecasts.utils.cache_utils import get_cache_key, get_or_compute
+from forecasts.utils.constants import (
+    EXPORT_CONTENT_TYPES,
+    EXPORT_FORMAT_CSV,
+    EXPORT_FORMATS,
+    IMPORT_MODE_INSERT,
+    IMPORT_MODE_UPSERT,
+)
+from forecasts.utils.csv_utils import deduplicate_objects, get_conflict_options
+from forecasts.utils.export_utils import stream_export
 from forecasts.utils.report_utils import get_statistics_data
+from forecasts.utils.upload_utils import get_received_chunks, write_chunk
 from users.models import User
 
+SKU_HIERARCHY_MODELS = (
+    models.SKU,
+    models.SKUGroup,
+    models.SKUCategory,
+    models.SKUSubcategory,
+)
+# Hierarchy lists are filtered by stores through their assortment.
+HIERARCHY_LIST_MODELS = (*SKU_HIERARCHY_MODELS, models.StoreAssortment)
+
+
+class TableVersionsMixin:
+    """Mixin reading versions of the tables of the versioned models."""
+
+    versioned_models = ()
+
+    def get_table_versions(self):
+        """Return names, versions and change dates of the tables once."""
+        if not hasattr(self, "_table_versions"):
+            self._table_versions = list(
+                models.TableVersion.objects.of_models(
+                    *self.versioned_models
+                ).values_list("name", "version", "updated_at")
+            )
+        return self._table_versions
+
+
+class VersionedListMixin(TableVersionsMixin):
+    """
+    Mixin answering conditional list requests by versions of tables.
+
+    Lists are not read while the tables of the versioned models are not
+    changed since the versions known to clients and caches.
+    """
+
+    def list(self, request, *args, **kwargs):
+        """Return list or not modified response of unchanged tables."""
+        versions = self.get_table_versions()
+        key = [request.get_full_path(), request.accepted_media_type]
+        key += [(name, version) for name, version, _ in versions]
+        etag = quote_etag(md5(repr(key).encode("utf-8")).hexdigest())
+        last_modified = max(
+            (int(updated_at.timestamp()) for *_, updated_at in versions),
+            default=None,
+        )
 
-class ListOnlyViewSet(mixins.ListModelMixin, GenericViewSet):
-    """Base list only view set."""
+        response = get_conditional_response(
+            request, etag=etag, last_modified=last_modified
+        )
+        if response is None:
+            response = super().list(request, *args, **kwargs)
+        response["ETag"] = etag
+        if last_modified is not None:
+            response["Last-Modified"] = http_date(last_modified)
+        patch_cache_control(
+            response,
+            public=True,
+            max_age=settings.REFERENCE_CACHE_MAX_AGE,
+            must_revalidate=True,
+        )
+        patch_vary_headers(response, ("Accept",))
+        return response
+
+
+class ListOnlyViewSet(
+    TableVersionsMixin,
+    mixins.ListModelMixin,
+    GenericViewSet,
+):
+    """
+    Base list only view set.
+
+    Lists are cached by their filters and versions of the tables of
+    the versioned models, so writes to the tables invalidate them.
+    """
 
     pagination_class = None
     list_key = "default_key"
@@ -49,11 +147,34 @@ class ListOnlyViewSet(mixins.ListModelMixin, GenericViewSet):
             raise self.ModelFieldNotSpecifiedError("model_field")
         return self._get_unique_values(self.model_field)
 
-    def list(self, request, *args, **kwargs):
-        """Return list of filtered unique values."""
+    def get_filter_params(self):
+        """Return sorted values of the filters given in the request."""
+        filter_names = getattr(self.filterset_class, "base_filters", {})
+        return [
+            (name, sorted(self.request.query_params.getlist(name)))
+            for name in sorted(filter_names)
+            if name in self.request.query_params
+        ]
+
+    def get_list_data(self):
+        """Return data of the filtered unique values."""
         queryset = self.filter_queryset(self.get_queryset())
-        serializer = self.get_serializer({self.list_key: queryset})
-        return Response(serializer.data)
+        return dict(self.get_serializer({self.list_key: queryset}).data)
+
+    def list(self, request, *args, **kwargs):
+        """Return list of filtered unique values cached by the filters."""
+        key = get_cache_key(
+            f"list:{self.basename}",
+            self.get_filter_params(),
+            # Dates of changes tell apart versions of recreated tables.
+            self.get_table_versions(),
+        )
+        data, hit = get_or_compute(
+            key, self.get_list_data, settings.LIST_CACHE_SECONDS
+        )
+        response = Response(data)
+        response["X-Cache"] = "HIT" if hit else "MISS"
+        return response
 
 
 class GetOrCreateViewSet(
@@ -64,6 +185,10 @@ class GetOrCreateViewSet(
 ):
     """View set to create or get model instances."""
 
+    # Key fields of an index ordering listed rows, listing by cursors
+    # of the key is turned on by the cursor parameter if set.
+    cursor_ordering = None
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.model = getattr(self, "model", None)
@@ -72,6 +197,19 @@ class GetOrCreateViewSet(
                 "The 'model' attribute must be set on the viewset."
             )
 
+    @property
+    def paginator(self):
+        """Return keyset paginator for listing by cursors if requested."""
+        if not hasattr(self, "_paginator") and self.is_listed_by_cursor():
+            self._paginator = KeysetPagination()
+        return super().paginator
+
+    def is_listed_by_cursor(self):
+        """Check if listing by cursors is requested and supported."""
+        if not self.cursor_ordering or self.action != "list":
+            return False
+        return KeysetPagination.cursor_query_param in self.request.GET
+
     def paginate_queryset(self, queryset):
         """Turn off pagination is required."""
         if self.request.query_params.get("limit") == "false":
@@ -82,6 +220,13 @@ class GetOrCreateViewSet(
         """Return model queryset."""
         return self.model.objects.all()
 
+    def get_export_queryset(self):
+        """Return filtered queryset of exported rows."""
+        queryset = self.filter_queryset(self.get_queryset())
+        if self.cursor_ordering:
+            queryset = queryset.order_by(*self.cursor_ordering)
+        return queryset
+
     def get_serializer_class(self):
         """Return appropriate to method serializer."""
         raise NotImplementedError("Method must be implemented.")
@@ -92,10 +237,13 @@ class GetOrCreateViewSet(
 
         if serializer.is_valid():
             data_entries = serializer.validated_data.get("data", [])
+            mode = serializer.validated_data.get("mode", IMPORT_MODE_INSERT)
             model_objects = [self.model(**attrs) for attrs in data_entries]
+            if mode == IMPORT_MODE_UPSERT:
+                model_objects = deduplicate_objects(self.model, model_objects)
             instances = self.model.objects.bulk_create(
                 model_objects,
-                ignore_conflicts=True,
+                **get_conflict_options(self.model, mode),
             )
             return Response(
                 self.serializer_class(instances, many=True).data,
@@ -107,24 +255,103 @@ class GetOrCreateViewSet(
         methods=["post"],
         detail=False,
         serializer_class=serializers.CSVFileSerializer,
+        permission_classes=(IsAuthenticated,),
     )
     def create_from_csv(self, request):
         """
         Upload forecasts data from a CSV file.
 
         This action allows users to upload forecasts data from a CSV file.
+        The file is imported asynchronously, its progress can be checked
+        with the returned task id.
         """
-        serializer = serializers.CSVFileSerializer(data=request.data)
+        serializer = serializers.CSVFileSerializer(
+            data=request.data,
+            context={"model": self.model},
+        )
         if serializer.is_valid():
-            csv_reader = read_csv_file(serializer.validated_data["csv_file"])
-            import_data(self.model, csv_reader)
+            job = import_tasks.start_import_job(
+                user_id=request.user.id,
+                model_label=self.model._meta.label,
+                engine=serializer.validated_data["engine"],
+                mode=serializer.validated_data["mode"],
+                source=serializer.validated_data["csv_file"],
+            )
             return Response(
-                {"message": "CSV is valid"}, status=status.HTTP_201_CREATED
+                {"task_id": job.task_id}, status=status.HTTP_201_CREATED
             )
         return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
 
+    @swagger_auto_schema(
+        manual_parameters=[
+            openapi.Parameter(
+                "task_id",
+                openapi.IN_QUERY,
+                description="Id of task to import file",
+                type=openapi.TYPE_STRING,
+            ),
+        ]
+    )
+    @action(
+        methods=["get"],
+        detail=False,
+        serializer_class=serializers.ImportJobSerializer,
+        permission_classes=(IsAuthenticated,),
+        filter_backends=None,
+        pagination_class=None,
+    )
+    def get_import_status(self, request):
+        """Return progress of the file import of the user."""
+        job = get_object_or_404(
+            ImportJob,
+            task_id=request.query_params.get("task_id", None),
+            model_label=self.model._meta.label,
+            user_id=request.user.id,
+        )
+        return Response(serializers.ImportJobSerializer(job).data)
+
+    @swagger_auto_schema(
+        manual_parameters=[
+            openapi.Parameter(
+                "export_format",
+                openapi.IN_QUERY,
+                description="Format of the exported file",
+                type=openapi.TYPE_STRING,
+                enum=list(EXPORT_FORMATS),
+                default=EXPORT_FORMAT_CSV,
+            ),
+        ]
+    )
+    @action(methods=["get"], detail=False, pagination_class=None)
+    def export(self, request):
+        """
+        Export filtered rows as a CSV or NDJSON file.
+
+        Rows are streamed by chunks of a database cursor. CSV files have
+        the columns of imported files.
+        """
+        export_format = request.query_params.get(
+            "export_format", EXPORT_FORMAT_CSV
+        )
+        if export_format not in EXPORT_FORMATS:
+            return Response(
+                {"export_format": [f"Unknown format {export_format}."]},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        response = StreamingHttpResponse(
+            stream_export(
+                self.model, self.get_export_queryset(), export_format
+            ),
+            content_type=EXPORT_CONTENT_TYPES[export_format],
+        )
+        response["Content-Disposition"] = (
+            "attachment; "
+            f'filename="{self.model._meta.model_name}.{export_format}"'
+        )
+        return response
+
 
-class SKUViewSet(GetOrCreateViewSet):
+class SKUViewSet(VersionedListMixin, GetOrCreateViewSet):
     """
     A view set for the SKU model.
 
@@ -135,6 +362,11 @@ class SKUViewSet(GetOrCreateViewSet):
     serializer_class = serializers.SKUSerializer
     filter_backends = (DjangoFilterBackend,)
     filterset_class = filters.SKUFilter
+    versioned_models = SKU_HIERARCHY_MODELS
+
+    def get_queryset(self):
+        """Return SKUs with their hierarchy dimensions."""
+        return self.model.objects.select_related(*models.SKU_DIMENSIONS)
 
     def get_serializer_class(self):
         """Return appropriate to method serializer."""
@@ -143,52 +375,55 @@ class SKUViewSet(GetOrCreateViewSet):
         return serializers.SKUPostSerializer
 
 
-class GroupViewSet(ListOnlyViewSet):
+class GroupViewSet(VersionedListMixin, ListOnlyViewSet):
     """
     A view set for the SKU groups.
 
     This view set provides read-only access to the SKU unique groups.
     """
 
-    queryset = models.SKU.objects.all()
+    queryset = models.SKUGroup.objects.all()
     serializer_class = serializers.GroupSerializer
     filter_backends = (DjangoFilterBackend,)
     filterset_class = filters.GroupFilter
     list_key = "groups"
-    model_field = "group"
+    model_field = "name"
+    versioned_models = HIERARCHY_LIST_MODELS
 
 
-class CategoryViewSet(ListOnlyViewSet):
+class CategoryViewSet(VersionedListMixin, ListOnlyViewSet):
     """
     A view set for the SKU groups.
 
     This view set provides read-only access to the SKU unique categories.
     """
 
-    queryset = models.SKU.objects.all()
+    queryset = models.SKUCategory.objects.all()
     serializer_class = serializers.CategorySerializer
     filter_backends = (DjangoFilterBackend,)
     filterset_class = filters.CategoryFilter
     list_key = "categories"
-    model_field = "category"
+    model_field = "name"
+    versioned_models = HIERARCHY_LIST_MODELS
 
 
-class SubcategoryViewSet(ListOnlyViewSet):
+class SubcategoryViewSet(VersionedListMixin, ListOnlyViewSet):
     """
     A view set for the SKU groups.
 
     This view set provides read-only access to the SKU unique subcategories.
     """
 
-    queryset = models.SKU.objects.all()
+    queryset = models.SKUSubcategory.objects.all()
     serializer_class = serializers.SubcategorySerializer
     filter_backends = (DjangoFilterBackend,)
     filterset_class = filters.SubcategoryFiler
     list_key = "subcategories"
-    model_field = "subcategory"
+    model_field = "name"
+    versioned_models = HIERARCHY_LIST_MODELS
 
 
-class StoreViewSet(GetOrCreateViewSet):
+class StoreViewSet(VersionedListMixin, GetOrCreateViewSet):
     """
     A view set for the Store model.
 
@@ -197,6 +432,7 @@ class StoreViewSet(GetOrCreateViewSet):
 
     model = models.Store
     serializer_class = serializers.StoreSerializer
+    versioned_models = (models.Store,)
 
     def get_serializer_class(self):
         """Return appropriate to method serializer."""
@@ -217,13 +453,35 @@ class SaleViewSet(GetOrCreateViewSet):
     serializer_class = serializers.SaleSerializer
     filter_backends = (DjangoFilterBackend,)
     filterset_class = filters.SaleFilter
+    # Natural key of sales is unique with the type of sales.
+    cursor_ordering = ("store", "sku", "date", "sales_type")
 
     def get_serializer_class(self):
         """Return appropriate to method serializer."""
+        if self.action == "weekly":
+            return serializers.GroupSaleWeeklySerializer
         if self.request.method in SAFE_METHODS:
             return serializers.SaleSerializer
         return serializers.SalePostSerializer
 
+    @action(
+        methods=["get"],
+        detail=False,
+        serializer_class=serializers.GroupSaleWeeklySerializer,
+        filterset_class=filters.GroupSaleWeeklyFilter,
+    )
+    def weekly(self, request):
+        """Return weekly sales of SKU groups in stores."""
+        queryset = self.filter_queryset(
+            models.GroupSaleWeekly.objects.select_related("group")
+        )
+        page = self.paginate_queryset(queryset)
+        if page is not None:
+            serializer = self.get_serializer(page, many=True)
+            return self.get_paginated_response(serializer.data)
+        serializer = self.get_serializer(queryset, many=True)
+        return Response(serializer.data)
+
 
 class ForecastViewSet(GetOrCreateViewSet):
     """
@@ -236,6 +494,7 @@ class ForecastViewSet(GetOrCreateViewSet):
     model = models.Forecast
     filter_backends = (DjangoFilterBackend,)
     filterset_class = filters.ForecastFilter
+    cursor_ordering = ("store", "sku")
 
     def get_serializer_class(self):
         """Return appropriate to method serializer."""
@@ -247,6 +506,12 @@ class ForecastViewSet(GetOrCreateViewSet):
         """Return queryset of unique pairs of SKU and Store."""
         return self.model.objects.values("sku", "store").distinct()
 
+    def get_export_queryset(self):
+        """Return filtered forecasts of every day."""
+        return self.filter_queryset(
+            self.model.objects.order_by("store", "sku", "date")
+        )
+
     def create(self, request, *args, **kwargs):
         """Bulk create forecasts."""
         serializer = self.get_serializer(data=request.data)
@@ -255,10 +520,13 @@ class ForecastViewSet(GetOrCreateViewSet):
                 Forecast(**attrs)
                 for attrs in serializer.validated_data.get("data")
             ]
-            Forecast.objects.bulk_create(
-                forecasts_objects,
-                ignore_conflicts=True,
+            # Forecasts of the same day replace earlier ones of the run.
+            run = ForecastRun.objects.get_open(
+                serializer.validated_data["model_version"]
             )
+            Forecast.objects.bulk_create(forecasts_objects, run=run)
+            if serializer.validated_data["publish"]:
+                run.publish()
             return Response(
                 {"message": "created"},
                 status=status.HTTP_201_CREATED,
@@ -366,6 +634,108 @@ class ForecastViewSet(GetOrCreateViewSet):
             )
 
 
+class UploadSessionViewSet(
+    mixins.CreateModelMixin,
+    mixins.RetrieveModelMixin,
+    GenericViewSet,
+):
+    """
+    A view set for chunked uploads of data files.
+
+    Upload session is opened for the model, then numbered chunks of the file
+    are uploaded and the session is finalized to import the file. Import
+    job may be created along with the session to know its task id early,
+    but it is started only when the session is finalized.
+    """
+
+    queryset = UploadSession.objects.select_related("import_job")
+    serializer_class = serializers.UploadSessionSerializer
+    permission_classes = (IsAuthenticated,)
+    pagination_class = None
+
+    def get_queryset(self):
+        """Return upload sessions of the user."""
+        return super().get_queryset().filter(user_id=self.request.user.id)
+
+    def perform_create(self, serializer):
+        """Open upload session and create its import job if required."""
+        start_import = serializer.validated_data["start_import"]
+        session = serializer.save(user_id=self.request.user.id)
+        if start_import:
+            self.create_import_job(session)
+
+    def create_import_job(self, session):
+        """Create import job of the upload session file."""
+        return import_tasks.create_import_job(
+            user_id=session.user_id,
+            model_label=session.model_label,
+            engine=session.engine,
+            mode=session.mode,
+            upload_session=session,
+        )
+
+    @swagger_auto_schema(
+        request_body=openapi.Schema(
+            type=openapi.TYPE_STRING,
+            format=openapi.FORMAT_BINARY,
+        ),
+    )
+    @action(
+        methods=["put"],
+        detail=True,
+        url_path=r"chunks/(?P<index>[0-9]+)",
+    )
+    def upload_chunk(self, request, index, pk=None):
+        """Upload chunk of the file with the given index."""
+        session = self.get_object()
+        try:
+            size = write_chunk(session, int(index), request.stream)
+        except UploadError as e:
+            return Response({"error": str(e)}, status=e.status_code)
+        return Response({"index": int(index), "size": size})
+
+    @action(
+        methods=["post"],
+        detail=True,
+        serializer_class=serializers.FinalizeUploadSessionSerializer,
+    )
+    def finalize(self, request, pk=None):
+        """Finalize upload session and import the uploaded file."""
+        session = self.get_object()
+        serializer = serializers.FinalizeUploadSessionSerializer(
+            data=request.data,
+        )
+        if not serializer.is_valid():
+            return Response(
+                serializer.errors,
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        if session.finalized:
+            return Response(
+                {"error": "Upload session is already finalized."},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        chunks_count = serializer.validated_data["chunks_count"]
+        missing_chunks = sorted(
+            set(range(chunks_count)) - set(get_received_chunks(session))
+        )
+        if missing_chunks:
+            return Response(
+                {"missing_chunks": missing_chunks},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        session.chunks_count = chunks_count
+        session.finalized_at = timezone.now()
+        session.save(update_fields=("chunks_count", "finalized_at"))
+        job = getattr(session, "import_job", None)
+        if job is None:
+            job = self.create_import_job(session)
+        import_tasks.run_import_job(job)
+        return Response(serializers.UploadSessionSerializer(session).data)
+
+
 class UserViewSet(viewsets.GenericViewSet):
     """User model view set."""
 
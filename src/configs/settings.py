@@ -16,6 +16,7 @@ from datetime import timedelta
 from pathlib import Path
 
 import environ
+from celery.schedules import crontab
 from dotenv import find_dotenv
 
 env = environ.Env()
@@ -56,6 +57,7 @@ MIDDLEWARE = [
     "django.contrib.auth.middleware.AuthenticationMiddleware",
     "django.contrib.messages.middleware.MessageMiddleware",
     "django.middleware.clickjacking.XFrameOptionsMiddleware",
+    "forecasts.utils.replica_utils.ReplicaMiddleware",
 ]
 
 ROOT_URLCONF = "configs.urls"
@@ -84,17 +86,38 @@ DATABASES = {
         "NAME": BASE_DIR / "db.sqlite3",
     },
     "default": {
-        "ENGINE": "django.db.backends.postgresql",
+        # Connections are kept in process pools instead of CONN_MAX_AGE.
+        "ENGINE": "forecasts.db.backends.postgresql",
         "HOST": env.str("POSTGRES_HOST"),
         "PORT": env.str("POSTGRES_PORT"),
         "NAME": env.str("POSTGRES_DB"),
         "USER": env.str("POSTGRES_USER"),
         "PASSWORD": env.str("POSTGRES_PASSWORD"),
+        "POOL": {
+            "MAX_SIZE": env.int("POSTGRES_POOL_SIZE", default=4),
+            "TIMEOUT": env.int("POSTGRES_POOL_TIMEOUT", default=10),
+        },
     },
 }
 
+# Streaming replicas of the default database as "host" or "host:port".
+REPLICA_DATABASES = []
+for number, replica in enumerate(env.list("POSTGRES_REPLICAS", default=[])):
+    host, _, port = replica.partition(":")
+    REPLICA_DATABASES.append(f"replica_{number}")
+    DATABASES[f"replica_{number}"] = {
+        **DATABASES["default"],
+        "HOST": host,
+        "PORT": port or DATABASES["default"]["PORT"],
+        "TEST": {"MIRROR": "default"},
+    }
+DATABASE_ROUTERS = ["forecasts.utils.replica_utils.ReplicaRouter"]
+# Seconds reads of clients go to the primary after their writes.
+REPLICA_PIN_SECONDS = env.int("REPLICA_PIN_SECONDS", default=10)
+
 if "test" in sys.argv:
     DATABASES["default"] = DATABASES["test"]
+    CELERY_TASK_ALWAYS_EAGER = True
 
 AUTH_USER_MODEL = "users.User"
 
@@ -151,6 +174,14 @@ REST_FRAMEWORK = {
     ],
 }
 
+# Counts of paginated lists with more estimated rows are estimated.
+PAGINATION_ESTIMATE_THRESHOLD = env.int(
+    "PAGINATION_ESTIMATE_THRESHOLD", default=10_000
+)
+
+# Reference lists are revalidated by their ETags after the seconds.
+REFERENCE_CACHE_MAX_AGE = env.int("REFERENCE_CACHE_MAX_AGE", default=0)
+
 SIMPLE_JWT = {
     "ACCESS_TOKEN_LIFETIME": timedelta(days=1),
     "AUTH_HEADER_TYPES": ("Bearer",),
@@ -167,6 +198,30 @@ SWAGGER_SETTINGS = {
 CORS_ALLOW_ALL_ORIGINS = True
 
 REDIS_URL = env.str("REDIS_URL", default="redis://redis:6379")
+CACHES = {
+    "default": {
+        "BACKEND": "django.core.cache.backends.redis.RedisCache",
+        "LOCATION": REDIS_URL,
+        "KEY_PREFIX": "cache",
+    },
+}
+if "test" in sys.argv:
+    CACHES["default"] = {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+    }
+LIST_CACHE_ALIAS = "default"
+# Lists are invalidated by table versions, stale ones expire after it.
+LIST_CACHE_SECONDS = env.int("LIST_CACHE_SECONDS", default=24 * 60 * 60)
 CELERY_BROKER_URL = REDIS_URL
 CELERY_RESULT_BACKEND = REDIS_URL
 CELERY_TIMEZONE = TIME_ZONE
+# Scheduled by the single celery beat service, not by the workers.
+CELERY_BEAT_SCHEDULE = {
+    "maintain-sale-partitions": {
+        "task": "forecasts.tasks.partition_tasks.maintain_sale_partitions",
+        "schedule": crontab(hour=1, minute=0),
+    },
+}
+
+# Sales older than the number of months are dropped, zero keeps all.
+SALES_RETENTION_MONTHS = env.int("SALES_RETENTION_MONTHS", default=0)
@@ -0,0 +1,80 @@
+import os
+from contextlib import suppress
+
+from django.db.backends.postgresql.base import Database
+from django.db.backends.postgresql.base import (
+    DatabaseWrapper as PostgreSQLDatabaseWrapper,
+)
+from django.db.backends.postgresql.base import IsolationLevel
+from psycopg2.extensions import TRANSACTION_STATUS_IDLE
+
+from forecasts.db.backends.postgresql.creation import DatabaseCreation
+from forecasts.utils.pool_utils import get_pool
+
+
+def is_connection_usable(connection):
+    """Check if the database connection answers queries."""
+    try:
+        with connection.cursor() as cursor:
+            cursor.execute("SELECT 1")
+    except Database.Error:
+        return False
+    return True
+
+
+class DatabaseWrapper(PostgreSQLDatabaseWrapper):
+    """
+    PostgreSQL database wrapper taking connections from process pools.
+
+    Closed connections are returned to the pool of their parameters, pool
+    options are given by the POOL setting of the database.
+    """
+
+    creation_class = DatabaseCreation
+
+    def get_new_connection(self, conn_params):
+        """Check out pooled connection of the parameters."""
+        options = {
+            option.lower(): value
+            for option, value in self.settings_dict.get("POOL", {}).items()
+        }
+        self.connection_pool = get_pool(
+            repr(sorted(conn_params.items())), **options
+        )
+        connection = self.connection_pool.checkout(
+            lambda: super(DatabaseWrapper, self).get_new_connection(
+                conn_params
+            ),
+            is_connection_usable,
+        )
+        self.isolation_level = IsolationLevel(
+            self.settings_dict["OPTIONS"].get(
+                "isolation_level", IsolationLevel.READ_COMMITTED
+            )
+        )
+        return connection
+
+    def _close(self):
+        """Return connection to the pool unless it is broken."""
+        connection = self.connection
+        if self.connection_pool.pid != os.getpid():
+            # Connections inherited by forked processes belong to parents,
+            # the inherited pool keeps them referenced and never used.
+            self.connection_pool.checkin(connection)
+            return
+        with suppress(Database.Error):
+            if connection.info.transaction_status != TRANSACTION_STATUS_IDLE:
+                connection.rollback()
+
+        # Connections closed in transactions are expected to be closed.
+        reusable = not connection.closed and not self.in_atomic_block
+        if reusable:
+            status = connection.info.transaction_status
+            reusable = status == TRANSACTION_STATUS_IDLE
+        if reusable and self.errors_occurred:
+            reusable = is_connection_usable(connection)
+
+        if reusable:
+            self.connection_pool.checkin(connection)
+        else:
+            self.connection_pool.discard(connection)
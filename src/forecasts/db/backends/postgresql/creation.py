@@ -0,0 +1,14 @@
+from django.db.backends.postgresql.creation import (
+    DatabaseCreation as PostgreSQLDatabaseCreation,
+)
+
+from forecasts.utils.pool_utils import close_pools
+
+
+class DatabaseCreation(PostgreSQLDatabaseCreation):
+    """PostgreSQL test databases creation closing pooled connections."""
+
+    def _destroy_test_db(self, test_database_name, verbosity):
+        """Close idle pooled connections before dropping the database."""
+        close_pools()
+        super()._destroy_test_db(test_database_name, verbosity)
@@ -5,3 +5,12 @@ class ReportGenerationError(Exception):
         """Exception initialization."""
         super().__init__(message)
         self.status_code = status_code
+
+
+class UploadError(Exception):
+    """Custom exception for chunked upload errors."""
+
+    def __init__(self, message, status_code):
+        """Exception initialization."""
+        super().__init__(message)
+        self.status_code = status_code
@@ -1,7 +1,13 @@
 from django.core.management.base import BaseCommand
 
-from forecasts.utils.constants import MODEL_FILE_MAPPING
-from forecasts.utils.csv_utils import import_data, read_csv_file
+from forecasts.utils.compression_utils import find_data_file
+from forecasts.utils.constants import (
+    IMPORT_ENGINE_ORM,
+    IMPORT_ENGINES,
+    MODEL_FILE_MAPPING,
+)
+from forecasts.utils.import_utils import run_import
+from forecasts.utils.parallel_utils import parallel_import
 
 
 class Command(BaseCommand):
@@ -9,18 +15,57 @@ class Command(BaseCommand):
 
     help = "Fill database with data."
 
+    def add_arguments(self, parser):
+        """Add command arguments."""
+        parser.add_argument(
+            "--engine",
+            choices=IMPORT_ENGINES,
+            default=IMPORT_ENGINE_ORM,
+            help=(
+                "Import engine. COPY is used for sales and forecasts "
+                "on PostgreSQL only, other tables are loaded with ORM. "
+                "Columnar engine converts whole columns of the data."
+            ),
+        )
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=1,
+            help=(
+                "Number of worker processes. Independent models and "
+                "chunks of large files are loaded in parallel."
+            ),
+        )
+
     def handle(self, *args, **options):
         """Command handler."""
-        for model, data in MODEL_FILE_MAPPING.items():
-            try:
-                csv_data = read_csv_file(data["path"])
-                import_data(model, csv_data)
+        if options["workers"] > 1:
+            results = parallel_import(
+                MODEL_FILE_MAPPING,
+                options["workers"],
+                options["engine"],
+            )
+        else:
+            results = self.sequential_import(options["engine"])
+
+        for model, error in results:
+            if error is None:
                 self.stdout.write(
                     self.style.SUCCESS(
                         f"{model.__name__} data successfully imported!",
                     )
                 )
-            except Exception as e:
+            else:
                 self.stderr.write(
-                    self.style.ERROR(f"Failed to import data:{e}")
+                    self.style.ERROR(f"Failed to import data:{error}")
                 )
+
+    def sequential_import(self, engine):
+        """Import models one by one in the current process."""
+        for model, data in MODEL_FILE_MAPPING.items():
+            try:
+                run_import(model, find_data_file(data["path"]), engine)
+            except Exception as e:
+                yield model, e
+            else:
+                yield model, None
@@ -0,0 +1,82 @@
+from django.core.management.base import BaseCommand
+
+from forecasts.models import SKU, Forecast, ForecastRun, Sale, Store
+from forecasts.utils.columnar_utils import columnar_import_data
+from forecasts.utils.constants import COLUMNAR_BATCH_SIZE
+from forecasts.utils.generation_utils import DatasetGenerator
+
+
+class Command(BaseCommand):
+    """Management command to fill the database with synthetic data."""
+
+    help = "Generate stores, SKUs, sales and forecasts of the given size."
+
+    def add_arguments(self, parser):
+        """Add command arguments."""
+        parser.add_argument("--stores", type=int, default=50)
+        parser.add_argument("--skus", type=int, default=1000)
+        parser.add_argument(
+            "--groups",
+            type=int,
+            default=10,
+            help="Number of SKU groups, each has 5 categories "
+            "of 4 subcategories.",
+        )
+        parser.add_argument("--start-date", default="2022-01-01")
+        parser.add_argument("--days", type=int, default=365)
+        parser.add_argument("--forecast-days", type=int, default=14)
+        parser.add_argument(
+            "--assortment",
+            type=float,
+            default=0.3,
+            help="Share of SKUs sold by every store.",
+        )
+        parser.add_argument(
+            "--sale-rate",
+            type=float,
+            default=0.4,
+            help="Probability of SKU to be sold by the store in a day.",
+        )
+        parser.add_argument(
+            "--promo-rate",
+            type=float,
+            default=0.1,
+            help="Probability of sales to be promo sales.",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=COLUMNAR_BATCH_SIZE,
+        )
+        parser.add_argument("--seed", type=int, default=0)
+
+    def handle(self, *args, **options):
+        """Command handler."""
+        generator = DatasetGenerator(
+            stores=options["stores"],
+            skus=options["skus"],
+            start_date=options["start_date"],
+            days=options["days"],
+            groups=options["groups"],
+            forecast_days=options["forecast_days"],
+            assortment=options["assortment"],
+            sale_rate=options["sale_rate"],
+            promo_rate=options["promo_rate"],
+            batch_size=options["batch_size"],
+            seed=options["seed"],
+        )
+        for model, frames in (
+            (Store, generator.generate_stores()),
+            (SKU, generator.generate_skus()),
+            (Sale, generator.generate_sales()),
+            (Forecast, generator.generate_forecasts()),
+        ):
+            inserted = columnar_import_data(model, frames)
+            if model is Forecast:
+                ForecastRun.objects.publish_open()
+            self.stdout.write(
+                self.style.SUCCESS(
+                    f"{model.__name__} data successfully generated: "
+                    f"{inserted} rows!",
+                )
+            )
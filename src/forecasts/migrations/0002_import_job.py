@@ -0,0 +1,86 @@
+# Generated by Django 4.2.5 on 2026-10-17 04:28
+
+import django.core.validators
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    """Add import jobs."""
+
+    dependencies = [
+        ("forecasts", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="ImportJob",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "task_id",
+                    models.CharField(
+                        max_length=255, unique=True, verbose_name="task id"
+                    ),
+                ),
+                (
+                    "user_id",
+                    models.PositiveIntegerField(
+                        blank=True,
+                        null=True,
+                        validators=[
+                            django.core.validators.MinValueValidator(1)
+                        ],
+                    ),
+                ),
+                (
+                    "model_label",
+                    models.CharField(
+                        max_length=255, verbose_name="imported model"
+                    ),
+                ),
+                (
+                    "engine",
+                    models.CharField(
+                        max_length=15, verbose_name="import engine"
+                    ),
+                ),
+                (
+                    "source",
+                    models.FileField(upload_to="files/imports/%Y/%m/%d/"),
+                ),
+                (
+                    "status",
+                    models.CharField(
+                        choices=[
+                            ("pending", "Pending"),
+                            ("started", "Started"),
+                            ("success", "Success"),
+                            ("failure", "Failure"),
+                        ],
+                        default="pending",
+                        max_length=15,
+                    ),
+                ),
+                ("rows_read", models.PositiveBigIntegerField(default=0)),
+                ("rows_inserted", models.PositiveBigIntegerField(default=0)),
+                ("rows_rejected", models.PositiveBigIntegerField(default=0)),
+                ("errors", models.JSONField(blank=True, null=True)),
+                (
+                    "created_at",
+                    models.DateTimeField(
+                        auto_now_add=True, verbose_name="date created"
+                    ),
+                ),
+                ("started_at", models.DateTimeField(blank=True, null=True)),
+                ("finished_at", models.DateTimeField(blank=True, null=True)),
+            ],
+        ),
+    ]
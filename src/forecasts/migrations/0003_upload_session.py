@@ -0,0 +1,87 @@
+# Generated by Django 4.2.5 on 2026-10-17 04:30
+
+import uuid
+
+import django.core.validators
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    """Add chunked upload sessions."""
+
+    dependencies = [
+        ("forecasts", "0002_import_job"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="UploadSession",
+            fields=[
+                (
+                    "id",
+                    models.UUIDField(
+                        default=uuid.uuid4,
+                        editable=False,
+                        primary_key=True,
+                        serialize=False,
+                    ),
+                ),
+                (
+                    "user_id",
+                    models.PositiveIntegerField(
+                        blank=True,
+                        null=True,
+                        validators=[
+                            django.core.validators.MinValueValidator(1)
+                        ],
+                    ),
+                ),
+                (
+                    "model_label",
+                    models.CharField(
+                        max_length=255, verbose_name="imported model"
+                    ),
+                ),
+                (
+                    "engine",
+                    models.CharField(
+                        max_length=15, verbose_name="import engine"
+                    ),
+                ),
+                (
+                    "file_name",
+                    models.CharField(max_length=255, verbose_name="file name"),
+                ),
+                (
+                    "chunks_count",
+                    models.PositiveIntegerField(blank=True, null=True),
+                ),
+                (
+                    "created_at",
+                    models.DateTimeField(
+                        auto_now_add=True, verbose_name="date created"
+                    ),
+                ),
+                ("finalized_at", models.DateTimeField(blank=True, null=True)),
+            ],
+        ),
+        migrations.AlterField(
+            model_name="importjob",
+            name="source",
+            field=models.FileField(
+                blank=True, upload_to="files/imports/%Y/%m/%d/"
+            ),
+        ),
+        migrations.AddField(
+            model_name="importjob",
+            name="upload_session",
+            field=models.OneToOneField(
+                blank=True,
+                null=True,
+                on_delete=django.db.models.deletion.SET_NULL,
+                related_name="import_job",
+                to="forecasts.uploadsession",
+            ),
+        ),
+    ]
@@ -0,0 +1,48 @@
+# Generated by Django 4.2.5 on 2026-10-17 04:37
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    """Add sales natural key and import modes."""
+
+    dependencies = [
+        ("forecasts", "0003_upload_session"),
+    ]
+
+    operations = [
+        # Only the latest of duplicated sales is kept.
+        migrations.RunSQL(
+            sql=(
+                "DELETE FROM forecasts_sale WHERE id NOT IN ("
+                "SELECT MAX(id) FROM forecasts_sale "
+                "GROUP BY store_id, sku_id, date, sales_type)"
+            ),
+            reverse_sql=migrations.RunSQL.noop,
+        ),
+        migrations.AddField(
+            model_name="importjob",
+            name="mode",
+            field=models.CharField(
+                default="insert", max_length=15, verbose_name="import mode"
+            ),
+        ),
+        migrations.AddField(
+            model_name="uploadsession",
+            name="mode",
+            field=models.CharField(
+                default="insert", max_length=15, verbose_name="import mode"
+            ),
+        ),
+        migrations.AddConstraint(
+            model_name="sale",
+            constraint=models.UniqueConstraint(
+                fields=("store", "sku", "date", "sales_type"),
+                name="unique_sales",
+            ),
+        ),
+        migrations.RemoveIndex(
+            model_name="sale",
+            name="forecasts_s_store_i_c29058_idx",
+        ),
+    ]
@@ -0,0 +1,148 @@
+import re
+from datetime import datetime, timezone
+
+from django.db import migrations, transaction
+
+SALE_TABLE = "forecasts_sale"
+OLD_SALE_TABLE = "forecasts_sale_old"
+PARTITIONS_AHEAD = 3
+# Rebuild fails instead of queueing queries behind its table lock.
+LOCK_TIMEOUT = "10s"
+
+
+def add_months(month, count):
+    """Return start of the month shifted by the number of months."""
+    years, month_index = divmod(month.month - 1 + count, 12)
+    return month.replace(year=month.year + years, month=month_index + 1)
+
+
+def create_partitions(cursor, first, last):
+    """Create monthly partitions from the first to the last date."""
+    month = datetime(first.year, first.month, 1, tzinfo=timezone.utc)
+    while month <= last:
+        end = add_months(month, 1)
+        cursor.execute(
+            f"CREATE TABLE {SALE_TABLE}_p{month:%Y_%m} "
+            f"PARTITION OF {SALE_TABLE} FOR VALUES FROM (%s) TO (%s)",
+            [month, end],
+        )
+        month = end
+    cursor.execute(
+        f"CREATE TABLE {SALE_TABLE}_default PARTITION OF {SALE_TABLE} DEFAULT"
+    )
+
+
+def rebuild_sale_table(cursor, partitioned):
+    """
+    Rebuild the sales table as a partitioned or a plain table.
+
+    Rows, identity, constraints and indexes of the table are kept,
+    primary key of the partitioned table includes the date, as unique
+    constraints must contain the partition key.
+    """
+    cursor.execute(f"ALTER TABLE {SALE_TABLE} RENAME TO {OLD_SALE_TABLE}")
+    cursor.execute(
+        "SELECT conname, contype, pg_get_constraintdef(oid) "
+        "FROM pg_constraint WHERE conrelid = %s::regclass",
+        [OLD_SALE_TABLE],
+    )
+    constraints = cursor.fetchall()
+    cursor.execute(
+        "SELECT indexname, indexdef FROM pg_indexes WHERE tablename = %s "
+        "AND indexname NOT IN "
+        "(SELECT conname FROM pg_constraint WHERE conrelid = %s::regclass)",
+        [OLD_SALE_TABLE, OLD_SALE_TABLE],
+    )
+    indexes = cursor.fetchall()
+    cursor.execute("SELECT pg_get_serial_sequence(%s, 'id')", [OLD_SALE_TABLE])
+    (sequence,) = cursor.fetchone()
+
+    partition_by = " PARTITION BY RANGE (date)" if partitioned else ""
+    cursor.execute(
+        f"CREATE TABLE {SALE_TABLE} "
+        f"(LIKE {OLD_SALE_TABLE} INCLUDING DEFAULTS INCLUDING IDENTITY)"
+        f"{partition_by}"
+    )
+    if partitioned:
+        now = datetime.now(timezone.utc)
+        cursor.execute(f"SELECT MIN(date), MAX(date) FROM {OLD_SALE_TABLE}")
+        first, last = cursor.fetchone()
+        create_partitions(
+            cursor,
+            min(first or now, now),
+            max(last or now, add_months(now, PARTITIONS_AHEAD)),
+        )
+    cursor.execute(f"INSERT INTO {SALE_TABLE} SELECT * FROM {OLD_SALE_TABLE}")
+    cursor.execute(
+        "SELECT setval(pg_get_serial_sequence(%s, 'id'), "
+        f"COALESCE(MAX(id), 1), MAX(id) IS NOT NULL) FROM {SALE_TABLE}",
+        [SALE_TABLE],
+    )
+    cursor.execute(f"DROP TABLE {OLD_SALE_TABLE}")
+    cursor.execute("SELECT pg_get_serial_sequence(%s, 'id')", [SALE_TABLE])
+    cursor.execute(
+        f"ALTER SEQUENCE {cursor.fetchone()[0]} RENAME TO "
+        f"{sequence.split('.')[-1]}"
+    )
+
+    for name, constraint_type, definition in constraints:
+        if constraint_type == "p":
+            definition = (
+                "PRIMARY KEY (id, date)" if partitioned else "PRIMARY KEY (id)"
+            )
+        cursor.execute(
+            f"ALTER TABLE {SALE_TABLE} ADD CONSTRAINT {name} {definition}"
+        )
+    for _, definition in indexes:
+        cursor.execute(
+            re.sub(
+                r" ON (ONLY )?\S+ USING ",
+                f" ON {SALE_TABLE} USING ",
+                definition,
+            )
+        )
+    cursor.execute(f"ANALYZE {SALE_TABLE}")
+
+
+def run_rebuild(schema_editor, partitioned):
+    """Rebuild the sales table in its own transaction on PostgreSQL."""
+    connection = schema_editor.connection
+    if connection.vendor != "postgresql":
+        return
+    with transaction.atomic(using=connection.alias):
+        with connection.cursor() as cursor:
+            cursor.execute(f"SET LOCAL lock_timeout = '{LOCK_TIMEOUT}'")
+            rebuild_sale_table(cursor, partitioned)
+
+
+def partition_sales(apps, schema_editor):
+    """Partition the sales table by months on PostgreSQL."""
+    run_rebuild(schema_editor, partitioned=True)
+
+
+def unpartition_sales(apps, schema_editor):
+    """Turn the partitioned sales table into a plain table."""
+    run_rebuild(schema_editor, partitioned=False)
+
+
+class Migration(migrations.Migration):
+    """
+    Partition sales by months of the sale date.
+
+    Partitions of all months of existing sales are created before rows
+    are copied, so none of them land in the default partition. The copy
+    holds an exclusive lock of the sales table, so sales can not be read
+    or written until the migration is finished and imports should be
+    stopped while it runs. The rebuild manages its own transaction and
+    gives up when the lock is not acquired within the lock timeout.
+    """
+
+    atomic = False
+
+    dependencies = [
+        ("forecasts", "0004_sale_natural_key"),
+    ]
+
+    operations = [
+        migrations.RunPython(partition_sales, unpartition_sales),
+    ]
@@ -0,0 +1,317 @@
+from datetime import timedelta
+from itertools import groupby
+
+import django.db.models.deletion
+from django.db import migrations, models
+from django.db.models import Min
+from django.db.models.functions import TruncDate
+
+SERIES_BATCH_SIZE = 1000
+
+POSTGRESQL_FORECAST_VIEW = """
+CREATE VIEW forecasts_forecast AS
+SELECT
+    series.id * 100000 + (series.start_date - DATE '1970-01-01')
+        + point.day_offset AS id,
+    series.run_id,
+    series.store_id,
+    series.sku_id,
+    run.created_at AS forecast_date,
+    series.start_date + point.day_offset AS date,
+    point.target
+FROM forecasts_forecastseries series
+JOIN forecasts_forecastrun run ON run.id = series.run_id
+CROSS JOIN LATERAL (
+    SELECT
+        (ordinality - 1)::integer AS day_offset,
+        value::integer AS target
+    FROM jsonb_array_elements_text(series.targets) WITH ORDINALITY
+) point
+WHERE point.target IS NOT NULL
+"""
+
+SQLITE_FORECAST_VIEW = """
+CREATE VIEW forecasts_forecast AS
+SELECT
+    series.id * 100000
+        + CAST(julianday(series.start_date) - 2440587.5 AS INTEGER)
+        + point.key AS id,
+    series.run_id,
+    series.store_id,
+    series.sku_id,
+    run.created_at AS forecast_date,
+    date(series.start_date, '+' || point.key || ' days') AS date,
+    point.value AS target
+FROM forecasts_forecastseries series
+JOIN forecasts_forecastrun run ON run.id = series.run_id,
+json_each(series.targets) point
+WHERE point.value IS NOT NULL
+"""
+
+
+def get_targets_list(targets):
+    """Return start date and list of targets of consecutive days."""
+    start_date = min(targets)
+    targets_list = [None] * ((max(targets) - start_date).days + 1)
+    for day, target in targets.items():
+        targets_list[(day - start_date).days] = target
+    return start_date, targets_list
+
+
+def series_from_forecasts(apps, schema_editor):
+    """Merge forecasts into series of runs by forecast dates."""
+    Forecast = apps.get_model("forecasts", "Forecast")
+    ForecastRun = apps.get_model("forecasts", "ForecastRun")
+    ForecastSeries = apps.get_model("forecasts", "ForecastSeries")
+
+    forecasts = Forecast.objects.annotate(day=TruncDate("forecast_date"))
+    runs = {}
+    for run_day in forecasts.values("day").annotate(
+        created_at=Min("forecast_date")
+    ):
+        run = ForecastRun.objects.create()
+        ForecastRun.objects.filter(pk=run.pk).update(
+            created_at=run_day["created_at"]
+        )
+        runs[run_day["day"]] = run.pk
+
+    rows = (
+        forecasts.order_by("day", "store_id", "sku_id", "date")
+        .values_list("day", "store_id", "sku_id", "date", "target")
+        .iterator(chunk_size=SERIES_BATCH_SIZE * 14)
+    )
+    series = []
+    for (day, store_id, sku_id), group in groupby(
+        rows, key=lambda row: row[:3]
+    ):
+        start_date, targets = get_targets_list(
+            {row[3]: row[4] for row in group}
+        )
+        series.append(
+            ForecastSeries(
+                run_id=runs[day],
+                store_id=store_id,
+                sku_id=sku_id,
+                start_date=start_date,
+                targets=targets,
+            )
+        )
+        if len(series) == SERIES_BATCH_SIZE:
+            ForecastSeries.objects.bulk_create(series)
+            series = []
+    ForecastSeries.objects.bulk_create(series)
+
+
+def forecasts_from_series(apps, schema_editor):
+    """Expand series into forecasts of days."""
+    ForecastSeries = apps.get_model("forecasts", "ForecastSeries")
+    table = schema_editor.quote_name("forecasts_forecast")
+    with schema_editor.connection.cursor() as cursor:
+        for series in ForecastSeries.objects.select_related("run").iterator(
+            chunk_size=SERIES_BATCH_SIZE
+        ):
+            # Forecast dates of a series must differ to keep them unique.
+            cursor.executemany(
+                f"INSERT INTO {table} "
+                "(store_id, sku_id, forecast_date, date, target) "
+                "VALUES (%s, %s, %s, %s, %s)",
+                [
+                    (
+                        series.store_id,
+                        series.sku_id,
+                        series.run.created_at + timedelta(microseconds=offset),
+                        series.start_date + timedelta(days=offset),
+                        target,
+                    )
+                    for offset, target in enumerate(series.targets)
+                    if target is not None
+                ],
+            )
+
+
+def create_forecast_view(apps, schema_editor):
+    """Replace forecasts table with the view of series forecasts."""
+    schema_editor.delete_model(apps.get_model("forecasts", "Forecast"))
+    if schema_editor.connection.vendor == "postgresql":
+        schema_editor.execute(POSTGRESQL_FORECAST_VIEW)
+    else:
+        schema_editor.execute(SQLITE_FORECAST_VIEW)
+
+
+def create_forecast_table(apps, schema_editor):
+    """Replace the view of series forecasts with forecasts table."""
+    schema_editor.execute("DROP VIEW forecasts_forecast")
+    schema_editor.create_model(apps.get_model("forecasts", "Forecast"))
+
+
+class Migration(migrations.Migration):
+    """Store forecasts as series of forecast runs."""
+
+    dependencies = [
+        ("forecasts", "0005_sale_partitioning"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="ForecastRun",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "created_at",
+                    models.DateTimeField(
+                        auto_now_add=True, verbose_name="Дата прогноза"
+                    ),
+                ),
+                (
+                    "model_version",
+                    models.CharField(
+                        blank=True,
+                        default="",
+                        max_length=255,
+                        verbose_name="Версия модели",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Запуск прогноза",
+                "verbose_name_plural": "Запуски прогнозов",
+                "ordering": ("id",),
+            },
+        ),
+        migrations.CreateModel(
+            name="ForecastSeries",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "start_date",
+                    models.DateField(verbose_name="Дата начала прогноза"),
+                ),
+                ("targets", models.JSONField(verbose_name="Прогноз")),
+                (
+                    "run",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="series",
+                        to="forecasts.forecastrun",
+                        verbose_name="Запуск прогноза",
+                    ),
+                ),
+                (
+                    "sku",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.DO_NOTHING,
+                        related_name="sku_forecast_series",
+                        to="forecasts.sku",
+                        verbose_name="Товар",
+                    ),
+                ),
+                (
+                    "store",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.DO_NOTHING,
+                        related_name="store_forecast_series",
+                        to="forecasts.store",
+                        verbose_name="Название магазина",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Серия прогнозов",
+                "verbose_name_plural": "Серии прогнозов",
+                "ordering": ("id",),
+            },
+        ),
+        migrations.AddConstraint(
+            model_name="forecastseries",
+            constraint=models.UniqueConstraint(
+                fields=("store", "sku", "run"), name="unique_forecast_series"
+            ),
+        ),
+        migrations.RunPython(series_from_forecasts, forecasts_from_series),
+        migrations.SeparateDatabaseAndState(
+            database_operations=[
+                migrations.RunPython(
+                    create_forecast_view,
+                    create_forecast_table,
+                ),
+            ],
+            state_operations=[
+                migrations.DeleteModel(
+                    name="Forecast",
+                ),
+                migrations.CreateModel(
+                    name="Forecast",
+                    fields=[
+                        (
+                            "id",
+                            models.BigIntegerField(
+                                primary_key=True,
+                                serialize=False,
+                            ),
+                        ),
+                        (
+                            "forecast_date",
+                            models.DateTimeField(
+                                verbose_name="Дата прогноза",
+                            ),
+                        ),
+                        ("date", models.DateField(verbose_name="Дата")),
+                        (
+                            "target",
+                            models.IntegerField(verbose_name="Прогноз"),
+                        ),
+                        (
+                            "run",
+                            models.ForeignKey(
+                                on_delete=django.db.models.deletion.DO_NOTHING,
+                                related_name="forecasts",
+                                to="forecasts.forecastrun",
+                                verbose_name="Запуск прогноза",
+                            ),
+                        ),
+                        (
+                            "sku",
+                            models.ForeignKey(
+                                on_delete=django.db.models.deletion.DO_NOTHING,
+                                related_name="sku_forecasts",
+                                to="forecasts.sku",
+                                verbose_name="Товар",
+                            ),
+                        ),
+                        (
+                            "store",
+                            models.ForeignKey(
+                                on_delete=django.db.models.deletion.DO_NOTHING,
+                                related_name="store_forecasts",
+                                to="forecasts.store",
+                                verbose_name="Название магазина",
+                            ),
+                        ),
+                    ],
+                    options={
+                        "verbose_name": "Прогноз",
+                        "verbose_name_plural": "Прогнозы",
+                        "ordering": ("id",),
+                        "managed": False,
+                        "db_table": "forecasts_forecast",
+                    },
+                ),
+            ],
+        ),
+    ]
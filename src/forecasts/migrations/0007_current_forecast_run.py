@@ -0,0 +1,116 @@
+# Generated by Django 4.2.5 on 2026-10-17 04:59
+
+import django.db.models.deletion
+import django.utils.timezone
+from django.db import migrations, models
+from django.db.models import Max
+
+SQLITE_FORECAST_VIEW = """
+CREATE VIEW forecasts_forecast AS
+SELECT
+    series.id * 100000
+        + CAST(julianday(series.start_date) - 2440587.5 AS INTEGER)
+        + point.key AS id,
+    series.run_id,
+    series.store_id,
+    series.sku_id,
+    run.created_at AS forecast_date,
+    date(series.start_date, '+' || point.key || ' days') AS date,
+    point.value AS target
+FROM forecasts_forecastseries series
+JOIN forecasts_forecastrun run ON run.id = series.run_id,
+json_each(series.targets) point
+WHERE point.value IS NOT NULL
+"""
+
+
+def drop_sqlite_view(apps, schema_editor):
+    """Drop forecasts view on SQLite, which remakes tables of the view."""
+    if schema_editor.connection.vendor == "sqlite":
+        schema_editor.execute("DROP VIEW forecasts_forecast")
+
+
+def create_sqlite_view(apps, schema_editor):
+    """Create forecasts view on SQLite after its tables are remade."""
+    if schema_editor.connection.vendor == "sqlite":
+        schema_editor.execute(SQLITE_FORECAST_VIEW)
+
+
+def publish_runs(apps, schema_editor):
+    """Publish existing runs, the latest ones become current for stores."""
+    ForecastRun = apps.get_model("forecasts", "ForecastRun")
+    ForecastSeries = apps.get_model("forecasts", "ForecastSeries")
+    CurrentForecastRun = apps.get_model("forecasts", "CurrentForecastRun")
+
+    runs = list(ForecastRun.objects.all())
+    for run in runs:
+        run.run_date = django.utils.timezone.localdate(run.created_at)
+        run.published_at = run.created_at
+    ForecastRun.objects.bulk_update(runs, ["run_date", "published_at"])
+    CurrentForecastRun.objects.bulk_create(
+        [
+            CurrentForecastRun(store_id=store["store_id"], run_id=store["run"])
+            for store in ForecastSeries.objects.values("store_id").annotate(
+                run=Max("run_id")
+            )
+        ]
+    )
+
+
+class Migration(migrations.Migration):
+    """Add forecast runs dates and current runs of stores."""
+
+    dependencies = [
+        ("forecasts", "0006_forecast_series"),
+    ]
+
+    operations = [
+        migrations.RunPython(drop_sqlite_view, create_sqlite_view),
+        migrations.AddField(
+            model_name="forecastrun",
+            name="published_at",
+            field=models.DateTimeField(
+                blank=True, null=True, verbose_name="Дата публикации"
+            ),
+        ),
+        migrations.AddField(
+            model_name="forecastrun",
+            name="run_date",
+            field=models.DateField(
+                db_index=True,
+                default=django.utils.timezone.localdate,
+                verbose_name="Дата запуска",
+            ),
+        ),
+        migrations.CreateModel(
+            name="CurrentForecastRun",
+            fields=[
+                (
+                    "store",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        primary_key=True,
+                        related_name="current_forecast_run",
+                        serialize=False,
+                        to="forecasts.store",
+                        verbose_name="Название магазина",
+                    ),
+                ),
+                (
+                    "run",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="current_stores",
+                        to="forecasts.forecastrun",
+                        verbose_name="Запуск прогноза",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Текущий запуск прогноза",
+                "verbose_name_plural": "Текущие запуски прогнозов",
+            },
+        ),
+        migrations.RunPython(create_sqlite_view, drop_sqlite_view),
+        migrations.RunPython(publish_runs, migrations.RunPython.noop),
+    ]
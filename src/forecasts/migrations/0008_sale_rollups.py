@@ -0,0 +1,324 @@
+# Generated by Django 4.2.5 on 2026-10-17 05:04
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+ROLLUP_TOTALS = (
+    "sales_units",
+    "sales_units_promo",
+    "sales_rub",
+    "sales_rub_promo",
+)
+ROLLUP_OPERATIONS = ("insert", "update", "delete")
+
+# Day and week start of sales dates in UTC.
+POSTGRESQL_DAY = "(changes.date AT TIME ZONE 'UTC')::date"
+POSTGRESQL_WEEK = "date_trunc('week', changes.date AT TIME ZONE 'UTC')::date"
+SQLITE_DAY = "date(changes.date)"
+SQLITE_WEEK = "date(changes.date, 'weekday 0', '-6 days')"
+
+# Conditions resolve the SQLite parsing ambiguity of upserts from selects.
+ROLLUP_SQL = """
+INSERT INTO forecasts_saledaily
+    (store_id, sku_id, date, {totals})
+SELECT changes.store_id, changes.sku_id, {day}, {sums}
+FROM {changes}
+WHERE true
+GROUP BY 1, 2, 3
+ON CONFLICT (store_id, sku_id, date) DO UPDATE SET {daily_updates};
+INSERT INTO forecasts_groupsaleweekly
+    (store_id, "group", week, {totals})
+SELECT changes.store_id, sku."group", {week}, {sums}
+FROM {changes}
+JOIN forecasts_sku sku ON sku.id = changes.sku_id
+WHERE true
+GROUP BY 1, 2, 3
+ON CONFLICT (store_id, "group", week) DO UPDATE SET {weekly_updates};
+"""
+
+POSTGRESQL_ROLLUP_TRIGGER = """
+CREATE FUNCTION forecasts_sale_rollups_{operation}() RETURNS trigger
+LANGUAGE plpgsql AS $$
+BEGIN
+{rollups}
+RETURN NULL;
+END
+$$;
+CREATE TRIGGER forecasts_sale_rollups_{operation}
+AFTER {operation} ON forecasts_sale
+REFERENCING {tables}
+FOR EACH STATEMENT EXECUTE FUNCTION forecasts_sale_rollups_{operation}()
+"""
+
+SQLITE_ROLLUP_TRIGGER = """
+CREATE TRIGGER forecasts_sale_rollups_{operation}
+AFTER {operation} ON forecasts_sale
+FOR EACH ROW BEGIN
+{rollups}
+END
+"""
+
+
+def get_rollup_sql(changes, day, week):
+    """Return SQL adding totals of the changes relation to the rollups."""
+    return ROLLUP_SQL.format(
+        changes=changes,
+        day=day,
+        week=week,
+        totals=", ".join(ROLLUP_TOTALS),
+        sums=", ".join(f"SUM(changes.{total})" for total in ROLLUP_TOTALS),
+        daily_updates=", ".join(
+            f"{total} = forecasts_saledaily.{total} + excluded.{total}"
+            for total in ROLLUP_TOTALS
+        ),
+        weekly_updates=", ".join(
+            f"{total} = forecasts_groupsaleweekly.{total} + excluded.{total}"
+            for total in ROLLUP_TOTALS
+        ),
+    )
+
+
+def select_changes(rows, sign="", source=None):
+    """Return SQL selecting sales of the rows with signed totals."""
+    columns = ", ".join(
+        [f"{rows}.{column} AS {column}" for column in ("store_id", "sku_id")]
+        + [f"{rows}.date AS date"]
+        + [f"{sign}{rows}.{total} AS {total}" for total in ROLLUP_TOTALS]
+    )
+    return f"SELECT {columns}" + (f" FROM {source}" if source else "")
+
+
+def create_postgresql_triggers(schema_editor):
+    """Create statement triggers adding changed sales to the rollups."""
+    new_rows = select_changes("new_rows", source="new_rows")
+    old_rows = select_changes("old_rows", "-", source="old_rows")
+    changes = {
+        "insert": (new_rows, "NEW TABLE AS new_rows"),
+        "update": (
+            f"{new_rows} UNION ALL {old_rows}",
+            "OLD TABLE AS old_rows NEW TABLE AS new_rows",
+        ),
+        "delete": (old_rows, "OLD TABLE AS old_rows"),
+    }
+    for operation in ROLLUP_OPERATIONS:
+        rows, tables = changes[operation]
+        schema_editor.execute(
+            POSTGRESQL_ROLLUP_TRIGGER.format(
+                operation=operation,
+                tables=tables,
+                rollups=get_rollup_sql(
+                    f"({rows}) changes", POSTGRESQL_DAY, POSTGRESQL_WEEK
+                ),
+            )
+        )
+
+
+def create_sqlite_triggers(schema_editor):
+    """Create row triggers adding changed sales to the rollups."""
+    new_row = select_changes("NEW")
+    old_row = select_changes("OLD", "-")
+    changes = {
+        "insert": new_row,
+        "update": f"{new_row} UNION ALL {old_row}",
+        "delete": old_row,
+    }
+    for operation in ROLLUP_OPERATIONS:
+        schema_editor.execute(
+            SQLITE_ROLLUP_TRIGGER.format(
+                operation=operation,
+                rollups=get_rollup_sql(
+                    f"({changes[operation]}) changes", SQLITE_DAY, SQLITE_WEEK
+                ),
+            )
+        )
+
+
+def create_rollups(apps, schema_editor):
+    """Fill rollups with existing sales and keep them by triggers."""
+    if schema_editor.connection.vendor == "postgresql":
+        rollups = get_rollup_sql(
+            "forecasts_sale changes", POSTGRESQL_DAY, POSTGRESQL_WEEK
+        )
+        create_triggers = create_postgresql_triggers
+    else:
+        rollups = get_rollup_sql(
+            "forecasts_sale changes", SQLITE_DAY, SQLITE_WEEK
+        )
+        create_triggers = create_sqlite_triggers
+    for statement in rollups.split(";"):
+        if statement.strip():
+            schema_editor.execute(statement)
+    create_triggers(schema_editor)
+
+
+def drop_rollup_triggers(apps, schema_editor):
+    """Drop triggers keeping the rollups."""
+    for operation in ROLLUP_OPERATIONS:
+        if schema_editor.connection.vendor == "postgresql":
+            schema_editor.execute(
+                f"DROP FUNCTION forecasts_sale_rollups_{operation}() CASCADE"
+            )
+        else:
+            schema_editor.execute(
+                f"DROP TRIGGER forecasts_sale_rollups_{operation}"
+            )
+
+
+class Migration(migrations.Migration):
+    """Add daily and weekly group sales rollups."""
+
+    dependencies = [
+        ("forecasts", "0007_current_forecast_run"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="SaleDaily",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "sales_units",
+                    models.BigIntegerField(
+                        default=0,
+                        verbose_name="Число проданных товаров без промо",
+                    ),
+                ),
+                (
+                    "sales_units_promo",
+                    models.BigIntegerField(
+                        default=0,
+                        verbose_name="Число проданных товаров c промо",
+                    ),
+                ),
+                (
+                    "sales_rub",
+                    models.DecimalField(
+                        decimal_places=2,
+                        default=0,
+                        max_digits=16,
+                        verbose_name="Сумма продаж без промо в рублях",
+                    ),
+                ),
+                (
+                    "sales_rub_promo",
+                    models.DecimalField(
+                        decimal_places=2,
+                        default=0,
+                        max_digits=16,
+                        verbose_name="Сумма продаж c промо в рублях",
+                    ),
+                ),
+                ("date", models.DateField(verbose_name="Дата продажи")),
+                (
+                    "sku",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.DO_NOTHING,
+                        related_name="sku_daily_sales",
+                        to="forecasts.sku",
+                        verbose_name="Наименование товара",
+                    ),
+                ),
+                (
+                    "store",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.DO_NOTHING,
+                        related_name="store_daily_sales",
+                        to="forecasts.store",
+                        verbose_name="Магазин",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Продажи за день",
+                "verbose_name_plural": "Продажи по дням",
+                "ordering": ("id",),
+            },
+        ),
+        migrations.CreateModel(
+            name="GroupSaleWeekly",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "sales_units",
+                    models.BigIntegerField(
+                        default=0,
+                        verbose_name="Число проданных товаров без промо",
+                    ),
+                ),
+                (
+                    "sales_units_promo",
+                    models.BigIntegerField(
+                        default=0,
+                        verbose_name="Число проданных товаров c промо",
+                    ),
+                ),
+                (
+                    "sales_rub",
+                    models.DecimalField(
+                        decimal_places=2,
+                        default=0,
+                        max_digits=16,
+                        verbose_name="Сумма продаж без промо в рублях",
+                    ),
+                ),
+                (
+                    "sales_rub_promo",
+                    models.DecimalField(
+                        decimal_places=2,
+                        default=0,
+                        max_digits=16,
+                        verbose_name="Сумма продаж c промо в рублях",
+                    ),
+                ),
+                (
+                    "group",
+                    models.CharField(max_length=255, verbose_name="Группа"),
+                ),
+                ("week", models.DateField(verbose_name="Начало недели")),
+                (
+                    "store",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.DO_NOTHING,
+                        related_name="store_weekly_group_sales",
+                        to="forecasts.store",
+                        verbose_name="Магазин",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Продажи группы за неделю",
+                "verbose_name_plural": "Продажи групп по неделям",
+                "ordering": ("id",),
+            },
+        ),
+        migrations.AddConstraint(
+            model_name="saledaily",
+            constraint=models.UniqueConstraint(
+                fields=("store", "sku", "date"), name="unique_daily_sales"
+            ),
+        ),
+        migrations.AddConstraint(
+            model_name="groupsaleweekly",
+            constraint=models.UniqueConstraint(
+                fields=("store", "group", "week"),
+                name="unique_weekly_group_sales",
+            ),
+        ),
+        migrations.RunPython(create_rollups, drop_rollup_triggers),
+    ]
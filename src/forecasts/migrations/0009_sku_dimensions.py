@@ -0,0 +1,306 @@
+# Generated by Django 4.2.5 on 2026-10-17 05:41
+
+from importlib import import_module
+
+import django.db.models.deletion
+from django.db import migrations, models
+from django.db.models import OuterRef, Subquery
+
+sale_rollups = import_module("forecasts.migrations.0008_sale_rollups")
+
+DIMENSIONS = (
+    ("sku", "group", "SKUGroup"),
+    ("sku", "category", "SKUCategory"),
+    ("sku", "subcategory", "SKUSubcategory"),
+    ("groupsaleweekly", "group", "SKUGroup"),
+)
+
+VERBOSE_NAMES = {
+    "skugroup": "Группа",
+    "skucategory": "Категория",
+    "skusubcategory": "Подкатегория",
+}
+
+# Lengths of the hierarchy name fields replaced by the dimensions.
+NAME_LENGTHS = {"group": 255, "category": 255, "subcategory": 256}
+
+# Weekly rollups are kept by integer keys of SKU groups.
+ROLLUP_SQL = sale_rollups.ROLLUP_SQL.replace(
+    '"group", week', "group_id, week"
+).replace('sku."group"', "sku.group_id")
+
+
+def get_rollup_sql(changes, day, week):
+    """Return SQL adding totals of the changes relation to the rollups."""
+    totals = sale_rollups.ROLLUP_TOTALS
+    return ROLLUP_SQL.format(
+        changes=changes,
+        day=day,
+        week=week,
+        totals=", ".join(totals),
+        sums=", ".join(f"SUM(changes.{total})" for total in totals),
+        daily_updates=", ".join(
+            f"{total} = forecasts_saledaily.{total} + excluded.{total}"
+            for total in totals
+        ),
+        weekly_updates=", ".join(
+            f"{total} = forecasts_groupsaleweekly.{total} + excluded.{total}"
+            for total in totals
+        ),
+    )
+
+
+def create_rollup_triggers(apps, schema_editor):
+    """Create triggers adding changed sales to the rollups by group keys."""
+    select_changes = sale_rollups.select_changes
+    if schema_editor.connection.vendor == "postgresql":
+        new_rows = select_changes("new_rows", source="new_rows")
+        old_rows = select_changes("old_rows", "-", source="old_rows")
+        changes = {
+            "insert": (new_rows, "NEW TABLE AS new_rows"),
+            "update": (
+                f"{new_rows} UNION ALL {old_rows}",
+                "OLD TABLE AS old_rows NEW TABLE AS new_rows",
+            ),
+            "delete": (old_rows, "OLD TABLE AS old_rows"),
+        }
+        for operation in sale_rollups.ROLLUP_OPERATIONS:
+            rows, tables = changes[operation]
+            schema_editor.execute(
+                sale_rollups.POSTGRESQL_ROLLUP_TRIGGER.format(
+                    operation=operation,
+                    tables=tables,
+                    rollups=get_rollup_sql(
+                        f"({rows}) changes",
+                        sale_rollups.POSTGRESQL_DAY,
+                        sale_rollups.POSTGRESQL_WEEK,
+                    ),
+                )
+            )
+    else:
+        new_row = select_changes("NEW")
+        old_row = select_changes("OLD", "-")
+        changes = {
+            "insert": new_row,
+            "update": f"{new_row} UNION ALL {old_row}",
+            "delete": old_row,
+        }
+        for operation in sale_rollups.ROLLUP_OPERATIONS:
+            schema_editor.execute(
+                sale_rollups.SQLITE_ROLLUP_TRIGGER.format(
+                    operation=operation,
+                    rollups=get_rollup_sql(
+                        f"({changes[operation]}) changes",
+                        sale_rollups.SQLITE_DAY,
+                        sale_rollups.SQLITE_WEEK,
+                    ),
+                )
+            )
+
+
+def create_named_rollup_triggers(apps, schema_editor):
+    """Create triggers adding changed sales to the rollups by group names."""
+    if schema_editor.connection.vendor == "postgresql":
+        sale_rollups.create_postgresql_triggers(schema_editor)
+    else:
+        sale_rollups.create_sqlite_triggers(schema_editor)
+
+
+def check_constraints(schema_editor):
+    """Run deferred checks of the updated rows before altering tables."""
+    if schema_editor.connection.vendor == "postgresql":
+        schema_editor.execute("SET CONSTRAINTS ALL IMMEDIATE")
+        schema_editor.execute("SET CONSTRAINTS ALL DEFERRED")
+
+
+def fill_dimensions(apps, schema_editor):
+    """Create dimensions of the hierarchy names and reference them."""
+    for model_name, field, dimension_name in DIMENSIONS:
+        model = apps.get_model("forecasts", model_name)
+        dimension = apps.get_model("forecasts", dimension_name)
+        names = set(model.objects.values_list(field, flat=True).distinct())
+        names -= set(dimension.objects.values_list("name", flat=True))
+        dimension.objects.bulk_create([dimension(name=name) for name in names])
+        model.objects.update(
+            **{
+                f"{field}_dimension": Subquery(
+                    dimension.objects.filter(name=OuterRef(field)).values(
+                        "pk"
+                    )[:1]
+                )
+            }
+        )
+    check_constraints(schema_editor)
+
+
+def fill_names(apps, schema_editor):
+    """Fill hierarchy names from the referenced dimensions."""
+    for model_name, field, dimension_name in DIMENSIONS:
+        model = apps.get_model("forecasts", model_name)
+        dimension = apps.get_model("forecasts", dimension_name)
+        model.objects.update(
+            **{
+                field: Subquery(
+                    dimension.objects.filter(
+                        pk=OuterRef(f"{field}_dimension")
+                    ).values("name")[:1]
+                )
+            }
+        )
+    check_constraints(schema_editor)
+
+
+def get_dimension_model(name, verbose_name, verbose_name_plural):
+    """Return operation creating the SKU hierarchy dimension model."""
+    return migrations.CreateModel(
+        name=name,
+        fields=[
+            (
+                "id",
+                models.BigAutoField(
+                    auto_created=True,
+                    primary_key=True,
+                    serialize=False,
+                    verbose_name="ID",
+                ),
+            ),
+            (
+                "name",
+                models.CharField(
+                    max_length=256, unique=True, verbose_name="Название"
+                ),
+            ),
+        ],
+        options={
+            "verbose_name": verbose_name,
+            "verbose_name_plural": verbose_name_plural,
+            "ordering": ("id",),
+            "abstract": False,
+        },
+    )
+
+
+def get_dimension_field(
+    dimension_name, related_name, on_delete, null=False, db_index=True
+):
+    """Return foreign key field of the SKU hierarchy dimension."""
+    return models.ForeignKey(
+        db_index=db_index,
+        null=null,
+        on_delete=on_delete,
+        related_name=related_name,
+        to=f"forecasts.{dimension_name}",
+        verbose_name=VERBOSE_NAMES[dimension_name],
+    )
+
+
+class Migration(migrations.Migration):
+    """Move SKU hierarchy names into dimension tables."""
+
+    dependencies = [
+        ("forecasts", "0008_sale_rollups"),
+    ]
+
+    operations = [
+        migrations.RunPython(
+            sale_rollups.drop_rollup_triggers,
+            create_named_rollup_triggers,
+        ),
+        get_dimension_model("SKUGroup", "Группа", "Группы"),
+        get_dimension_model("SKUCategory", "Категория", "Категории"),
+        get_dimension_model("SKUSubcategory", "Подкатегория", "Подкатегории"),
+        migrations.RemoveIndex(
+            model_name="sku",
+            name="forecasts_s_group_9b9b90_idx",
+        ),
+        migrations.RemoveConstraint(
+            model_name="sku",
+            name="unique_SKUs",
+        ),
+        migrations.RemoveConstraint(
+            model_name="groupsaleweekly",
+            name="unique_weekly_group_sales",
+        ),
+        *(
+            migrations.AddField(
+                model_name=model_name,
+                name=f"{field}_dimension",
+                field=get_dimension_field(
+                    dimension_name.lower(),
+                    "+",
+                    django.db.models.deletion.DO_NOTHING,
+                    null=True,
+                    db_index=(model_name, field) != ("sku", "group"),
+                ),
+            )
+            for model_name, field, dimension_name in DIMENSIONS
+        ),
+        # Names are nullable while being filled back on reversal.
+        *(
+            migrations.AlterField(
+                model_name=model_name,
+                name=field,
+                field=models.CharField(
+                    max_length=NAME_LENGTHS[field],
+                    null=True,
+                    verbose_name=VERBOSE_NAMES[dimension_name.lower()],
+                ),
+            )
+            for model_name, field, dimension_name in DIMENSIONS
+        ),
+        migrations.RunPython(fill_dimensions, fill_names),
+        *(
+            migrations.RemoveField(model_name=model_name, name=field)
+            for model_name, field, _ in DIMENSIONS
+        ),
+        *(
+            migrations.RenameField(
+                model_name=model_name,
+                old_name=f"{field}_dimension",
+                new_name=field,
+            )
+            for model_name, field, _ in DIMENSIONS
+        ),
+        *(
+            migrations.AlterField(
+                model_name="sku",
+                name=field,
+                field=get_dimension_field(
+                    dimension_name.lower(),
+                    "skus",
+                    django.db.models.deletion.PROTECT,
+                    # Unique constraint of the hierarchy serves groups.
+                    db_index=field != "group",
+                ),
+            )
+            for model_name, field, dimension_name in DIMENSIONS
+            if model_name == "sku"
+        ),
+        migrations.AlterField(
+            model_name="groupsaleweekly",
+            name="group",
+            field=get_dimension_field(
+                "skugroup",
+                "weekly_sales",
+                django.db.models.deletion.DO_NOTHING,
+            ),
+        ),
+        migrations.AddConstraint(
+            model_name="sku",
+            constraint=models.UniqueConstraint(
+                fields=("group", "category", "subcategory", "sku", "uom"),
+                name="unique_SKUs",
+            ),
+        ),
+        migrations.AddConstraint(
+            model_name="groupsaleweekly",
+            constraint=models.UniqueConstraint(
+                fields=("store", "group", "week"),
+                name="unique_weekly_group_sales",
+            ),
+        ),
+        migrations.RunPython(
+            create_rollup_triggers,
+            sale_rollups.drop_rollup_triggers,
+        ),
+    ]
@@ -0,0 +1,245 @@
+# Generated by Django 4.2.5 on 2026-10-17 05:17
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+ASSORTMENT_OPERATIONS = ("insert", "update", "delete")
+
+# Days of sales dates in UTC.
+POSTGRESQL_DAY = "({date} AT TIME ZONE 'UTC')::date"
+SQLITE_DAY = "date({date})"
+
+# Conditions resolve the SQLite parsing ambiguity of upserts from selects.
+EXTEND_SQL = """
+INSERT INTO forecasts_storeassortment
+    (store_id, sku_id, first_sale, last_sale)
+SELECT changes.store_id, changes.sku_id, {first_sale}, {last_sale}
+FROM {changes}
+WHERE true
+GROUP BY 1, 2
+ON CONFLICT (store_id, sku_id) DO UPDATE SET
+    first_sale = CASE
+        WHEN excluded.first_sale < forecasts_storeassortment.first_sale
+        THEN excluded.first_sale
+        ELSE forecasts_storeassortment.first_sale
+    END,
+    last_sale = CASE
+        WHEN excluded.last_sale > forecasts_storeassortment.last_sale
+        THEN excluded.last_sale
+        ELSE forecasts_storeassortment.last_sale
+    END;
+"""
+
+# Store SKUs of removed sales are recounted from the sales left.
+RECOUNT_SQL = """
+DELETE FROM forecasts_storeassortment
+WHERE (store_id, sku_id) IN (SELECT store_id, sku_id FROM {changes})
+AND NOT EXISTS (
+    SELECT 1 FROM forecasts_sale changes WHERE {same_sku}
+);
+UPDATE forecasts_storeassortment SET
+    first_sale = (
+        SELECT {first_sale} FROM forecasts_sale changes WHERE {same_sku}
+    ),
+    last_sale = (
+        SELECT {last_sale} FROM forecasts_sale changes WHERE {same_sku}
+    )
+WHERE (store_id, sku_id) IN (SELECT store_id, sku_id FROM {changes});
+"""
+
+POSTGRESQL_ASSORTMENT_TRIGGER = """
+CREATE FUNCTION forecasts_sale_assortment_{operation}() RETURNS trigger
+LANGUAGE plpgsql AS $$
+BEGIN
+{assortment}
+RETURN NULL;
+END
+$$;
+CREATE TRIGGER forecasts_sale_assortment_{operation}
+AFTER {operation} ON forecasts_sale
+REFERENCING {tables}
+FOR EACH STATEMENT EXECUTE FUNCTION forecasts_sale_assortment_{operation}()
+"""
+
+SQLITE_ASSORTMENT_TRIGGER = """
+CREATE TRIGGER forecasts_sale_assortment_{operation}
+AFTER {operation} ON forecasts_sale
+FOR EACH ROW BEGIN
+{assortment}
+END
+"""
+
+
+def get_assortment_sql(sql, changes, day):
+    """Return SQL changing the assortment of the changes relation."""
+    return sql.format(
+        changes=changes,
+        first_sale=day.format(date="MIN(changes.date)"),
+        last_sale=day.format(date="MAX(changes.date)"),
+        same_sku=(
+            "changes.store_id = forecasts_storeassortment.store_id"
+            " AND changes.sku_id = forecasts_storeassortment.sku_id"
+        ),
+    )
+
+
+def select_changes(rows, source=None):
+    """Return SQL selecting store SKUs and dates of the sales rows."""
+    columns = ", ".join(
+        f"{rows}.{column} AS {column}"
+        for column in ("store_id", "sku_id", "date")
+    )
+    return f"SELECT {columns}" + (f" FROM {source}" if source else "")
+
+
+def get_trigger_sql(new_rows, old_rows, day):
+    """
+    Return assortment SQL of the triggers by operations.
+
+    Updated sales keeping their store SKUs and dates are not recounted,
+    so upserts of imports only extend the assortment.
+    """
+    moved_rows = f"{old_rows} EXCEPT {new_rows}"
+    return {
+        "insert": get_assortment_sql(EXTEND_SQL, f"({new_rows}) changes", day),
+        "update": get_assortment_sql(EXTEND_SQL, f"({new_rows}) changes", day)
+        + get_assortment_sql(RECOUNT_SQL, f"({moved_rows}) changes", day),
+        "delete": get_assortment_sql(
+            RECOUNT_SQL, f"({old_rows}) changes", day
+        ),
+    }
+
+
+def create_postgresql_triggers(schema_editor):
+    """Create statement triggers keeping the assortment of sales."""
+    assortment = get_trigger_sql(
+        select_changes("new_rows", source="new_rows"),
+        select_changes("old_rows", source="old_rows"),
+        POSTGRESQL_DAY,
+    )
+    tables = {
+        "insert": "NEW TABLE AS new_rows",
+        "update": "OLD TABLE AS old_rows NEW TABLE AS new_rows",
+        "delete": "OLD TABLE AS old_rows",
+    }
+    for operation in ASSORTMENT_OPERATIONS:
+        schema_editor.execute(
+            POSTGRESQL_ASSORTMENT_TRIGGER.format(
+                operation=operation,
+                tables=tables[operation],
+                assortment=assortment[operation],
+            )
+        )
+
+
+def create_sqlite_triggers(schema_editor):
+    """Create row triggers keeping the assortment of sales."""
+    assortment = get_trigger_sql(
+        select_changes("NEW"), select_changes("OLD"), SQLITE_DAY
+    )
+    for operation in ASSORTMENT_OPERATIONS:
+        schema_editor.execute(
+            SQLITE_ASSORTMENT_TRIGGER.format(
+                operation=operation, assortment=assortment[operation]
+            )
+        )
+
+
+def create_assortment(apps, schema_editor):
+    """Fill assortment with existing sales and keep it by triggers."""
+    if schema_editor.connection.vendor == "postgresql":
+        day = POSTGRESQL_DAY
+        create_triggers = create_postgresql_triggers
+    else:
+        day = SQLITE_DAY
+        create_triggers = create_sqlite_triggers
+    schema_editor.execute(
+        get_assortment_sql(EXTEND_SQL, "forecasts_sale changes", day)
+    )
+    create_triggers(schema_editor)
+
+
+def drop_assortment_triggers(apps, schema_editor):
+    """Drop triggers keeping the assortment."""
+    for operation in ASSORTMENT_OPERATIONS:
+        if schema_editor.connection.vendor == "postgresql":
+            schema_editor.execute(
+                f"DROP FUNCTION forecasts_sale_assortment_{operation}()"
+                " CASCADE"
+            )
+        else:
+            schema_editor.execute(
+                f"DROP TRIGGER forecasts_sale_assortment_{operation}"
+            )
+
+
+class Migration(migrations.Migration):
+    """Add store assortment kept from sales."""
+
+    dependencies = [
+        ("forecasts", "0009_sku_dimensions"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="StoreAssortment",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "first_sale",
+                    models.DateField(verbose_name="Дата первой продажи"),
+                ),
+                (
+                    "last_sale",
+                    models.DateField(verbose_name="Дата последней продажи"),
+                ),
+                (
+                    "sku",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.DO_NOTHING,
+                        related_name="assortment",
+                        to="forecasts.sku",
+                        verbose_name="Наименование товара",
+                    ),
+                ),
+                (
+                    "store",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.DO_NOTHING,
+                        related_name="assortment",
+                        to="forecasts.store",
+                        verbose_name="Магазин",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Ассортимент магазина",
+                "verbose_name_plural": "Ассортименты магазинов",
+                "ordering": ("id",),
+            },
+        ),
+        migrations.AlterField(
+            model_name="store",
+            name="skus",
+            field=models.ManyToManyField(
+                related_name="stores",
+                through="forecasts.StoreAssortment",
+                to="forecasts.sku",
+            ),
+        ),
+        migrations.AddConstraint(
+            model_name="storeassortment",
+            constraint=models.UniqueConstraint(
+                fields=("store", "sku"), name="unique_store_assortment"
+            ),
+        ),
+        migrations.RunPython(create_assortment, drop_assortment_triggers),
+    ]
@@ -0,0 +1,147 @@
+# Generated by Django 4.2.5 on 2026-10-17 05:38
+
+import django.utils.timezone
+from django.db import migrations, models
+
+ALL_OPERATIONS = ("insert", "update", "delete")
+
+# Writes of the tables bumping their versions, dates of the assortment
+# are not listed by reference endpoints.
+VERSIONED_TABLES = {
+    "forecasts_store": ALL_OPERATIONS,
+    "forecasts_sku": ALL_OPERATIONS,
+    "forecasts_skugroup": ALL_OPERATIONS,
+    "forecasts_skucategory": ALL_OPERATIONS,
+    "forecasts_skusubcategory": ALL_OPERATIONS,
+    "forecasts_storeassortment": ("insert", "delete"),
+}
+
+BUMP_SQL = """
+INSERT INTO forecasts_tableversion (name, version, updated_at)
+VALUES ({name}, 1, {now})
+ON CONFLICT (name) DO UPDATE SET
+    version = forecasts_tableversion.version + 1,
+    updated_at = excluded.updated_at;
+"""
+
+# Statements not changing rows, such as upserts of existing assortment,
+# keep the versions.
+POSTGRESQL_VERSION_FUNCTION = """
+CREATE FUNCTION forecasts_bump_table_version() RETURNS trigger
+LANGUAGE plpgsql AS $$
+BEGIN
+IF EXISTS (SELECT 1 FROM changes) THEN
+{bump}
+END IF;
+RETURN NULL;
+END
+$$
+"""
+
+POSTGRESQL_VERSION_TRIGGER = """
+CREATE TRIGGER {table}_version_{operation}
+AFTER {operation} ON {table}
+REFERENCING {rows} TABLE AS changes
+FOR EACH STATEMENT EXECUTE FUNCTION forecasts_bump_table_version()
+"""
+
+SQLITE_VERSION_TRIGGER = """
+CREATE TRIGGER {table}_version_{operation}
+AFTER {operation} ON {table}
+FOR EACH ROW BEGIN
+{bump}
+END
+"""
+
+
+def create_version_triggers(apps, schema_editor):
+    """Create versions of the tables and triggers bumping them."""
+    TableVersion = apps.get_model("forecasts", "TableVersion")
+    TableVersion.objects.bulk_create(
+        [TableVersion(name=table) for table in VERSIONED_TABLES]
+    )
+    if schema_editor.connection.vendor == "postgresql":
+        schema_editor.execute(
+            POSTGRESQL_VERSION_FUNCTION.format(
+                bump=BUMP_SQL.format(name="TG_TABLE_NAME", now="now()")
+            )
+        )
+        for table, operations in VERSIONED_TABLES.items():
+            for operation in operations:
+                schema_editor.execute(
+                    POSTGRESQL_VERSION_TRIGGER.format(
+                        table=table,
+                        operation=operation,
+                        rows="OLD" if operation == "delete" else "NEW",
+                    )
+                )
+    else:
+        for table, operations in VERSIONED_TABLES.items():
+            for operation in operations:
+                schema_editor.execute(
+                    SQLITE_VERSION_TRIGGER.format(
+                        table=table,
+                        operation=operation,
+                        bump=BUMP_SQL.format(
+                            name=f"'{table}'", now="CURRENT_TIMESTAMP"
+                        ),
+                    )
+                )
+
+
+def drop_version_triggers(apps, schema_editor):
+    """Drop triggers bumping versions of the tables."""
+    if schema_editor.connection.vendor == "postgresql":
+        schema_editor.execute(
+            "DROP FUNCTION forecasts_bump_table_version() CASCADE"
+        )
+        return
+    for table, operations in VERSIONED_TABLES.items():
+        for operation in operations:
+            schema_editor.execute(
+                f"DROP TRIGGER {table}_version_{operation}"
+            )
+
+
+class Migration(migrations.Migration):
+    """Add versions of reference tables kept by triggers."""
+
+    dependencies = [
+        ("forecasts", "0010_store_assortment"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="TableVersion",
+            fields=[
+                (
+                    "name",
+                    models.CharField(
+                        max_length=63,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="Таблица",
+                    ),
+                ),
+                (
+                    "version",
+                    models.BigIntegerField(
+                        default=0, verbose_name="Версия"
+                    ),
+                ),
+                (
+                    "updated_at",
+                    models.DateTimeField(
+                        default=django.utils.timezone.now,
+                        verbose_name="Дата изменения",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Версия таблицы",
+                "verbose_name_plural": "Версии таблиц",
+                "ordering": ("name",),
+            },
+        ),
+        migrations.RunPython(create_version_triggers, drop_version_triggers),
+    ]
@@ -0,0 +1,22 @@
+# Generated by Django 4.2.5 on 2026-10-17 05:56
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    """Allow one open forecast run of the model version a day."""
+
+    dependencies = [
+        ("forecasts", "0011_table_versions"),
+    ]
+
+    operations = [
+        migrations.AddConstraint(
+            model_name="forecastrun",
+            constraint=models.UniqueConstraint(
+                condition=models.Q(("published_at__isnull", True)),
+                fields=("run_date", "model_version"),
+                name="unique_open_forecast_run",
+            ),
+        ),
+    ]
@@ -1,11 +1,132 @@
 import os
+import uuid
+from collections import defaultdict
+from datetime import date, timedelta
 
 import pytz
 from django.core.validators import MinValueValidator
-from django.db import models
+from django.db import IntegrityError, NotSupportedError, models, transaction
+from django.db.models import Exists, OuterRef, Q
+from django.utils import timezone
 from django.utils.translation import gettext_lazy as _
 
 
+class SKUDimensionQuerySet(models.QuerySet):
+    """SKU hierarchy dimensions queryset."""
+
+    def get_ids(self, names):
+        """Return ids of the dimensions by names creating missing ones."""
+        names = set(names)
+        ids = dict(self.filter(name__in=names).values_list("name", "pk"))
+        if missing := names - ids.keys():
+            # Concurrent imports may create the same dimensions.
+            self.bulk_create(
+                [self.model(name=name) for name in missing],
+                ignore_conflicts=True,
+            )
+            ids.update(self.filter(name__in=missing).values_list("name", "pk"))
+        return ids
+
+
+class SKUDimension(models.Model):
+    """Abstract model of a level of the SKU hierarchy."""
+
+    name = models.CharField(
+        max_length=256,
+        unique=True,
+        verbose_name="Название",
+    )
+
+    objects = SKUDimensionQuerySet.as_manager()
+
+    def __str__(self):
+        """Return dimension name."""
+        return self.name
+
+    class Meta:
+        """SKU dimension model meta data."""
+
+        abstract = True
+        ordering = ("id",)
+
+
+class SKUGroup(SKUDimension):
+    """Model representing SKU groups."""
+
+    class Meta(SKUDimension.Meta):
+        """SKU group model meta data."""
+
+        verbose_name = _(
+            "Группа",
+        )
+        verbose_name_plural = _(
+            "Группы",
+        )
+
+
+class SKUCategory(SKUDimension):
+    """Model representing SKU categories."""
+
+    class Meta(SKUDimension.Meta):
+        """SKU category model meta data."""
+
+        verbose_name = _(
+            "Категория",
+        )
+        verbose_name_plural = _(
+            "Категории",
+        )
+
+
+class SKUSubcategory(SKUDimension):
+    """Model representing SKU subcategories."""
+
+    class Meta(SKUDimension.Meta):
+        """SKU subcategory model meta data."""
+
+        verbose_name = _(
+            "Подкатегория",
+        )
+        verbose_name_plural = _(
+            "Подкатегории",
+        )
+
+
+SKU_DIMENSIONS = ("group", "category", "subcategory")
+
+
+class SKUQuerySet(models.QuerySet):
+    """SKUs queryset."""
+
+    def resolve_dimensions(self, skus):
+        """
+        Save unsaved hierarchy dimensions of the SKUs.
+
+        Dimensions are looked up by names, so SKUs can be built
+        with unsaved dimension instances holding names only.
+        """
+        for field_name in SKU_DIMENSIONS:
+            field = SKU._meta.get_field(field_name)
+            unsaved = []
+            for sku in skus:
+                dimension = field.get_cached_value(sku, None)
+                if dimension is not None and dimension.pk is None:
+                    unsaved.append((sku, dimension))
+            if unsaved:
+                ids = field.related_model.objects.get_ids(
+                    dimension.name for _, dimension in unsaved
+                )
+                for sku, dimension in unsaved:
+                    dimension.pk = ids[dimension.name]
+                    setattr(sku, field_name, dimension)
+
+    def bulk_create(self, objs, *args, **kwargs):
+        """Bulk create SKUs saving their hierarchy dimensions before."""
+        objs = list(objs)
+        self.resolve_dimensions(objs)
+        return super().bulk_create(objs, *args, **kwargs)
+
+
 class SKU(models.Model):
     """Model representing SKUs information."""
 
@@ -15,16 +136,24 @@ class SKU(models.Model):
         BY_WEIGHT = 17
         BY_PIECE = 1
 
-    group = models.CharField(
-        max_length=255,
+    # Unique constraint of the hierarchy serves group lookups.
+    group = models.ForeignKey(
+        SKUGroup,
+        related_name="skus",
+        on_delete=models.PROTECT,
+        db_index=False,
         verbose_name="Группа",
     )
-    category = models.CharField(
-        max_length=255,
+    category = models.ForeignKey(
+        SKUCategory,
+        related_name="skus",
+        on_delete=models.PROTECT,
         verbose_name="Категория",
     )
-    subcategory = models.CharField(
-        max_length=256,
+    subcategory = models.ForeignKey(
+        SKUSubcategory,
+        related_name="skus",
+        on_delete=models.PROTECT,
         verbose_name="Подкатегория",
     )
     sku = models.CharField(
@@ -36,6 +165,8 @@ class SKU(models.Model):
         choices=UOMChoices.choices,
     )
 
+    objects = SKUQuerySet.as_manager()
+
     class Meta:
         """SKU model metadata."""
 
@@ -58,22 +189,16 @@ class SKU(models.Model):
                 name="unique_SKUs",
             )
         ]
-        indexes = [
-            models.Index(
-                fields=(
-                    "group",
-                    "category",
-                    "subcategory",
-                    "sku",
-                    "uom",
-                )
-            ),
-        ]
 
     def __str__(self):
         """Return capitalized SKU name."""
         return self.sku.capitalize()
 
+    def save(self, *args, **kwargs):
+        """Save SKU with its hierarchy dimensions."""
+        SKU.objects.resolve_dimensions([self])
+        super().save(*args, **kwargs)
+
 
 class Store(models.Model):
     """Model representing stores information."""
@@ -96,7 +221,7 @@ class Store(models.Model):
     skus = models.ManyToManyField(
         SKU,
         related_name="stores",
-        through="Sale",
+        through="StoreAssortment",
     )
 
     store = models.CharField(
@@ -221,20 +346,536 @@ class Sale(models.Model):
         )
         ordering = ("id",)
 
-        indexes = [
-            models.Index(
+        # Index of the natural key serves store, SKU and date lookups too.
+        constraints = [
+            models.UniqueConstraint(
+                fields=(
+                    "store",
+                    "sku",
+                    "date",
+                    "sales_type",
+                ),
+                name="unique_sales",
+            )
+        ]
+
+
+class SaleRollup(models.Model):
+    """
+    Abstract model of sales totals.
+
+    Rollups are kept by database triggers on sales, so rows written by
+    any import path or the API are counted.
+    """
+
+    sales_units = models.BigIntegerField(
+        default=0,
+        verbose_name="Число проданных товаров без промо",
+    )
+    sales_units_promo = models.BigIntegerField(
+        default=0,
+        verbose_name="Число проданных товаров c промо",
+    )
+    sales_rub = models.DecimalField(
+        max_digits=16,
+        decimal_places=2,
+        default=0,
+        verbose_name="Сумма продаж без промо в рублях",
+    )
+    sales_rub_promo = models.DecimalField(
+        max_digits=16,
+        decimal_places=2,
+        default=0,
+        verbose_name="Сумма продаж c промо в рублях",
+    )
+
+    class Meta:
+        """Sale rollup model meta data."""
+
+        abstract = True
+
+
+class SaleDaily(SaleRollup):
+    """Model representing sales totals of a store SKU by UTC days."""
+
+    store = models.ForeignKey(
+        Store,
+        related_name="store_daily_sales",
+        on_delete=models.DO_NOTHING,
+        verbose_name="Магазин",
+    )
+    sku = models.ForeignKey(
+        SKU,
+        related_name="sku_daily_sales",
+        on_delete=models.DO_NOTHING,
+        verbose_name="Наименование товара",
+    )
+    date = models.DateField(verbose_name="Дата продажи")
+
+    def __str__(self):
+        """Return daily sales data as str."""
+        return f"{self.sku} sales in {self.store} on {self.date}"
+
+    class Meta:
+        """Daily sales model meta data."""
+
+        verbose_name = _(
+            "Продажи за день",
+        )
+        verbose_name_plural = _(
+            "Продажи по дням",
+        )
+        ordering = ("id",)
+        constraints = [
+            models.UniqueConstraint(
                 fields=(
                     "store",
                     "sku",
                     "date",
+                ),
+                name="unique_daily_sales",
+            )
+        ]
+
+
+class GroupSaleWeekly(SaleRollup):
+    """Model representing sales totals of a store SKU group by weeks."""
+
+    store = models.ForeignKey(
+        Store,
+        related_name="store_weekly_group_sales",
+        on_delete=models.DO_NOTHING,
+        verbose_name="Магазин",
+    )
+    group = models.ForeignKey(
+        SKUGroup,
+        related_name="weekly_sales",
+        on_delete=models.DO_NOTHING,
+        verbose_name="Группа",
+    )
+    week = models.DateField(verbose_name="Начало недели")
+
+    def __str__(self):
+        """Return weekly group sales data as str."""
+        return f"{self.group} sales in {self.store} on week of {self.week}"
+
+    class Meta:
+        """Weekly group sales model meta data."""
+
+        verbose_name = _(
+            "Продажи группы за неделю",
+        )
+        verbose_name_plural = _(
+            "Продажи групп по неделям",
+        )
+        ordering = ("id",)
+        constraints = [
+            models.UniqueConstraint(
+                fields=(
+                    "store",
+                    "group",
+                    "week",
+                ),
+                name="unique_weekly_group_sales",
+            )
+        ]
+
+
+class StoreAssortment(models.Model):
+    """
+    Model representing SKUs sold in a store with the first and last sales.
+
+    Assortment is kept by database triggers on sales the same way as
+    sales rollups.
+    """
+
+    store = models.ForeignKey(
+        Store,
+        related_name="assortment",
+        on_delete=models.DO_NOTHING,
+        verbose_name="Магазин",
+    )
+    sku = models.ForeignKey(
+        SKU,
+        related_name="assortment",
+        on_delete=models.DO_NOTHING,
+        verbose_name="Наименование товара",
+    )
+    first_sale = models.DateField(verbose_name="Дата первой продажи")
+    last_sale = models.DateField(verbose_name="Дата последней продажи")
+
+    def __str__(self):
+        """Return store assortment data as str."""
+        return f"{self.sku} sold in {self.store}"
+
+    class Meta:
+        """Store assortment model meta data."""
+
+        verbose_name = _(
+            "Ассортимент магазина",
+        )
+        verbose_name_plural = _(
+            "Ассортименты магазинов",
+        )
+        ordering = ("id",)
+        constraints = [
+            models.UniqueConstraint(
+                fields=(
+                    "store",
+                    "sku",
+                ),
+                name="unique_store_assortment",
+            )
+        ]
+
+
+# Forecast ids are unique by the series and the days since the epoch.
+FORECAST_ID_FACTOR = 100_000
+EPOCH_DATE = date(1970, 1, 1)
+FORECAST_VIEW_WRITE_ERROR = (
+    "Forecasts are read from a view of forecast series, "
+    "update or delete ForecastSeries instead."
+)
+
+
+class ForecastRunQuerySet(models.QuerySet):
+    """Forecast runs queryset."""
+
+    def open(self, model_version=""):
+        """Return unpublished runs of the model version made today."""
+        return self.filter(
+            run_date=timezone.localdate(),
+            model_version=model_version,
+            published_at__isnull=True,
+        ).order_by("-id")
+
+    def get_open(self, model_version=""):
+        """Return today unpublished run of the model version or create it."""
+        if run := self.open(model_version).first():
+            return run
+        try:
+            with transaction.atomic():
+                return self.create(model_version=model_version)
+        except IntegrityError:
+            # Concurrent import has created the open run first.
+            return self.open(model_version).get()
+
+    def publish_open(self, model_version=""):
+        """Publish today unpublished runs of the model version."""
+        for run in self.open(model_version):
+            run.publish()
+
+
+class ForecastRun(models.Model):
+    """Model representing a run of the forecasting model."""
+
+    created_at = models.DateTimeField(
+        verbose_name="Дата прогноза",
+        auto_now_add=True,
+    )
+    run_date = models.DateField(
+        verbose_name="Дата запуска",
+        default=timezone.localdate,
+        db_index=True,
+    )
+    model_version = models.CharField(
+        max_length=255,
+        blank=True,
+        default="",
+        verbose_name="Версия модели",
+    )
+    published_at = models.DateTimeField(
+        verbose_name="Дата публикации",
+        blank=True,
+        null=True,
+    )
+
+    objects = ForecastRunQuerySet.as_manager()
+
+    def __str__(self):
+        """Return forecast run data as str."""
+        return f"Forecast run {self.pk} at {self.created_at}"
+
+    def publish(self):
+        """
+        Publish the run making it current for stores of its series.
+
+        Current runs of all the stores are swapped in one transaction,
+        so readers see either previous or the whole published run.
+        """
+        stores = (
+            self.series.order_by()
+            .values_list("store_id", flat=True)
+            .distinct()
+        )
+        with transaction.atomic():
+            self.published_at = timezone.now()
+            self.save(update_fields=["published_at"])
+            CurrentForecastRun.objects.bulk_create(
+                [
+                    CurrentForecastRun(store_id=store_id, run=self)
+                    for store_id in stores
+                ],
+                update_conflicts=True,
+                unique_fields=["store"],
+                update_fields=["run"],
+            )
+
+    class Meta:
+        """Forecast run model meta data."""
+
+        verbose_name = _(
+            "Запуск прогноза",
+        )
+        verbose_name_plural = _(
+            "Запуски прогнозов",
+        )
+        ordering = ("id",)
+        constraints = [
+            models.UniqueConstraint(
+                fields=(
+                    "run_date",
+                    "model_version",
+                ),
+                condition=Q(published_at__isnull=True),
+                name="unique_open_forecast_run",
+            )
+        ]
+
+
+class CurrentForecastRun(models.Model):
+    """Model representing the published forecast run of a store."""
+
+    store = models.OneToOneField(
+        Store,
+        primary_key=True,
+        related_name="current_forecast_run",
+        on_delete=models.CASCADE,
+        verbose_name="Название магазина",
+    )
+    run = models.ForeignKey(
+        ForecastRun,
+        related_name="current_stores",
+        on_delete=models.CASCADE,
+        verbose_name="Запуск прогноза",
+    )
+
+    def __str__(self):
+        """Return current forecast run data as str."""
+        return f"Forecast run {self.run_id} of {self.store}"
+
+    class Meta:
+        """Current forecast run model meta data."""
+
+        verbose_name = _(
+            "Текущий запуск прогноза",
+        )
+        verbose_name_plural = _(
+            "Текущие запуски прогнозов",
+        )
+
+
+class ForecastSeriesQuerySet(models.QuerySet):
+    """Forecast series queryset."""
+
+    def add_forecasts(self, run, forecasts, overwrite=True):
+        """
+        Merge forecasts of days into the series of the run.
+
+        Forecasts of days already present in a series replace them only
+        when overwriting. Forecasts get ids, run and date of the run.
+        """
+        date_field = Forecast._meta.get_field("date")
+        target_field = Forecast._meta.get_field("target")
+        series_targets = defaultdict(dict)
+        for forecast in forecasts:
+            forecast.date = date_field.to_python(forecast.date)
+            forecast.target = target_field.to_python(forecast.target)
+            key = (forecast.store_id, forecast.sku_id)
+            series_targets[key][forecast.date] = forecast.target
+
+        with transaction.atomic():
+            # Writers of the same run are serialized to merge its series.
+            list(ForecastRun.objects.select_for_update().filter(pk=run.pk))
+            existing = {
+                (series.store_id, series.sku_id): series
+                for series in self.filter(
+                    run=run,
+                    store_id__in={key[0] for key in series_targets},
+                    sku_id__in={key[1] for key in series_targets},
                 )
-            ),
+            }
+            created, updated = [], []
+            for key, targets in series_targets.items():
+                series = existing.get(key)
+                if series is None:
+                    series = self.model(
+                        run=run, store_id=key[0], sku_id=key[1]
+                    )
+                    created.append(series)
+                elif overwrite:
+                    targets = {**series.get_targets(), **targets}
+                    updated.append(series)
+                else:
+                    targets = {**targets, **series.get_targets()}
+                    updated.append(series)
+                series.set_targets(targets)
+                existing[key] = series
+            self.bulk_create(created)
+            self.bulk_update(updated, ["start_date", "targets"])
+
+        for forecast in forecasts:
+            series = existing[(forecast.store_id, forecast.sku_id)]
+            forecast.pk = series.get_forecast_id(forecast.date)
+            forecast.run = run
+            forecast.forecast_date = run.created_at
+            forecast._state.adding = False
+        return forecasts
+
+
+class ForecastSeries(models.Model):
+    """Model representing forecast horizon of SKU in store for a run."""
+
+    run = models.ForeignKey(
+        ForecastRun,
+        related_name="series",
+        on_delete=models.CASCADE,
+        verbose_name="Запуск прогноза",
+    )
+    store = models.ForeignKey(
+        Store,
+        related_name="store_forecast_series",
+        on_delete=models.DO_NOTHING,
+        verbose_name="Название магазина",
+    )
+    sku = models.ForeignKey(
+        SKU,
+        related_name="sku_forecast_series",
+        on_delete=models.DO_NOTHING,
+        verbose_name="Товар",
+    )
+    start_date = models.DateField(
+        verbose_name="Дата начала прогноза",
+    )
+    # Targets of consecutive days from the start date, null if missing.
+    targets = models.JSONField(
+        verbose_name="Прогноз",
+    )
+
+    objects = ForecastSeriesQuerySet.as_manager()
+
+    def __str__(self):
+        """Return forecast series data as str."""
+        return f"{self.sku} forecasts for {self.store} of run {self.run_id}"
+
+    def get_targets(self):
+        """Return targets by forecast dates."""
+        return {
+            self.start_date + timedelta(days=offset): target
+            for offset, target in enumerate(self.targets)
+            if target is not None
+        }
+
+    def set_targets(self, targets):
+        """Set targets and start date from targets by forecast dates."""
+        self.start_date = min(targets)
+        targets_list = [None] * ((max(targets) - self.start_date).days + 1)
+        for day, target in targets.items():
+            targets_list[(day - self.start_date).days] = target
+        self.targets = targets_list
+
+    def get_forecast_id(self, day):
+        """Return id of the series forecast of the day."""
+        return self.pk * FORECAST_ID_FACTOR + (day - EPOCH_DATE).days
+
+    class Meta:
+        """Forecast series model meta data."""
+
+        verbose_name = _(
+            "Серия прогнозов",
+        )
+        verbose_name_plural = _(
+            "Серии прогнозов",
+        )
+        ordering = ("id",)
+
+        # Whole horizon of SKU in store is read with a single index lookup.
+        constraints = [
+            models.UniqueConstraint(
+                fields=(
+                    "store",
+                    "sku",
+                    "run",
+                ),
+                name="unique_forecast_series",
+            )
         ]
 
 
+class ForecastQuerySet(models.QuerySet):
+    """Forecasts queryset writing forecasts into forecast series."""
+
+    def current(self):
+        """Return forecasts of the current runs of their stores."""
+        return self.filter(
+            Exists(
+                CurrentForecastRun.objects.filter(
+                    store=OuterRef("store"),
+                    run=OuterRef("run"),
+                )
+            )
+        )
+
+    def published(self, run_date):
+        """Return forecasts of runs of the date which are published."""
+        return self.filter(
+            run__run_date=run_date,
+            run__published_at__isnull=False,
+        )
+
+    def bulk_create(
+        self,
+        objs,
+        batch_size=None,
+        ignore_conflicts=False,
+        update_conflicts=False,
+        update_fields=None,
+        unique_fields=None,
+        run=None,
+    ):
+        """Add forecasts to the series of the run, today open by default."""
+        if run is None:
+            run = ForecastRun.objects.get_open()
+        return ForecastSeries.objects.add_forecasts(
+            run,
+            list(objs),
+            overwrite=not ignore_conflicts,
+        )
+
+    def update(self, **kwargs):
+        """Reject updates of the forecasts view."""
+        raise NotSupportedError(FORECAST_VIEW_WRITE_ERROR)
+
+    def delete(self):
+        """Reject deletion from the forecasts view."""
+        raise NotSupportedError(FORECAST_VIEW_WRITE_ERROR)
+
+
 class Forecast(models.Model):
-    """Model representing forecasts information."""
+    """
+    Model representing forecasts information.
+
+    Forecasts are days of the forecast series expanded by a database
+    view, forecast date is the date of their forecast run.
+    """
 
+    id = models.BigIntegerField(primary_key=True)
+    run = models.ForeignKey(
+        ForecastRun,
+        related_name="forecasts",
+        on_delete=models.DO_NOTHING,
+        verbose_name="Запуск прогноза",
+    )
     store = models.ForeignKey(
         Store,
         related_name="store_forecasts",
@@ -249,7 +890,6 @@ class Forecast(models.Model):
     )
     forecast_date = models.DateTimeField(
         verbose_name="Дата прогноза",
-        auto_now_add=True,
     )
     date = models.DateField(
         verbose_name="Дата",
@@ -258,10 +898,28 @@ class Forecast(models.Model):
         verbose_name="Прогноз",
     )
 
+    objects = ForecastQuerySet.as_manager()
+
     def __str__(self):
         """Return forecast data as str."""
         return f"{self.sku} forecast for {self.store} at {self.forecast_date}"
 
+    def save(self, *args, **kwargs):
+        """
+        Save forecast into the series of its run.
+
+        Every save locks the run to merge its series, forecasts are
+        better added with ``bulk_create``.
+        """
+        Forecast.objects.bulk_create(
+            [self],
+            run=self.run if self.run_id else None,
+        )
+
+    def delete(self, *args, **kwargs):
+        """Reject deletion from the forecasts view."""
+        raise NotSupportedError(FORECAST_VIEW_WRITE_ERROR)
+
     class Meta:
         """Forecast model meta data."""
 
@@ -272,26 +930,8 @@ class Forecast(models.Model):
             "Прогнозы",
         )
         ordering = ("id",)
-
-        constraints = [
-            models.UniqueConstraint(
-                fields=(
-                    "store",
-                    "sku",
-                    "forecast_date",
-                ),
-                name="unique_forecasts",
-            )
-        ]
-        indexes = [
-            models.Index(
-                fields=(
-                    "store",
-                    "sku",
-                    "forecast_date",
-                )
-            ),
-        ]
+        managed = False
+        db_table = "forecasts_forecast"
 
 
 class AsyncFileResults(models.Model):
@@ -321,3 +961,168 @@ class AsyncFileResults(models.Model):
     def successful(self):
         """Check if file generation was successful."""
         return self.errors == "null" and os.path.exists(self.result.path)
+
+
+class UploadSession(models.Model):
+    """Model representing chunked upload of a data file."""
+
+    id = models.UUIDField(
+        primary_key=True,
+        default=uuid.uuid4,
+        editable=False,
+    )
+    user_id = models.PositiveIntegerField(
+        blank=True,
+        null=True,
+        validators=[
+            MinValueValidator(1),
+        ],
+    )
+    model_label = models.CharField(
+        max_length=255,
+        verbose_name="imported model",
+    )
+    engine = models.CharField(
+        max_length=15,
+        verbose_name="import engine",
+    )
+    mode = models.CharField(
+        max_length=15,
+        default="insert",
+        verbose_name="import mode",
+    )
+    file_name = models.CharField(
+        max_length=255,
+        verbose_name="file name",
+    )
+    chunks_count = models.PositiveIntegerField(blank=True, null=True)
+    created_at = models.DateTimeField(
+        verbose_name="date created",
+        auto_now_add=True,
+    )
+    finalized_at = models.DateTimeField(blank=True, null=True)
+
+    @property
+    def finalized(self):
+        """Check if all chunks of the file were uploaded."""
+        return self.finalized_at is not None
+
+
+class ImportJob(models.Model):
+    """Model representing state of asynchronous data import."""
+
+    class StatusChoices(models.TextChoices):
+        """Import job status choices."""
+
+        PENDING = "pending"
+        STARTED = "started"
+        SUCCESS = "success"
+        FAILURE = "failure"
+
+    task_id = models.CharField(
+        max_length=255,
+        unique=True,
+        verbose_name="task id",
+    )
+    user_id = models.PositiveIntegerField(
+        blank=True,
+        null=True,
+        validators=[
+            MinValueValidator(1),
+        ],
+    )
+    model_label = models.CharField(
+        max_length=255,
+        verbose_name="imported model",
+    )
+    engine = models.CharField(
+        max_length=15,
+        verbose_name="import engine",
+    )
+    mode = models.CharField(
+        max_length=15,
+        default="insert",
+        verbose_name="import mode",
+    )
+    source = models.FileField(
+        upload_to="files/imports/%Y/%m/%d/",
+        blank=True,
+    )
+    upload_session = models.OneToOneField(
+        UploadSession,
+        related_name="import_job",
+        on_delete=models.SET_NULL,
+        blank=True,
+        null=True,
+    )
+    status = models.CharField(
+        max_length=15,
+        choices=StatusChoices.choices,
+        default=StatusChoices.PENDING,
+    )
+    rows_read = models.PositiveBigIntegerField(default=0)
+    rows_inserted = models.PositiveBigIntegerField(default=0)
+    rows_rejected = models.PositiveBigIntegerField(default=0)
+    errors = models.JSONField(blank=True, null=True)
+    created_at = models.DateTimeField(
+        verbose_name="date created",
+        auto_now_add=True,
+    )
+    started_at = models.DateTimeField(blank=True, null=True)
+    finished_at = models.DateTimeField(blank=True, null=True)
+
+    @property
+    def throughput(self):
+        """Return number of rows read per second."""
+        if self.started_at is None:
+            return None
+        finished_at = self.finished_at or timezone.now()
+        elapsed = (finished_at - self.started_at).total_seconds()
+        return round(self.rows_read / elapsed, 2) if elapsed else None
+
+
+class TableVersionQuerySet(models.QuerySet):
+    """Table versions queryset."""
+
+    def of_models(self, *model_classes):
+        """Return versions of the tables of the models."""
+        return self.filter(
+            name__in=[model._meta.db_table for model in model_classes]
+        ).order_by("name")
+
+
+class TableVersion(models.Model):
+    """
+    Model representing version of a table bumped by its writes.
+
+    Versions are kept by database triggers of the tables, so bulk
+    creates, copied imports and admin changes are all counted.
+    """
+
+    name = models.CharField(
+        primary_key=True,
+        max_length=63,
+        verbose_name="Таблица",
+    )
+    version = models.BigIntegerField(default=0, verbose_name="Версия")
+    updated_at = models.DateTimeField(
+        default=timezone.now,
+        verbose_name="Дата изменения",
+    )
+
+    objects = TableVersionQuerySet.as_manager()
+
+    def __str__(self):
+        """Return table version data as str."""
+        return f"{self.name} version {self.version}"
+
+    class Meta:
+        """Table version model meta data."""
+
+        verbose_name = _(
+            "Версия таблицы",
+        )
+        verbose_name_plural = _(
+            "Версии таблиц",
+        )
+        ordering = ("name",)
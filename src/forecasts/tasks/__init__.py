@@ -1 +1 @@
-from . import forecast_tasks  # noqa
+from . import forecast_tasks, import_tasks, partition_tasks  # noqa
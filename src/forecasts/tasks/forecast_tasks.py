@@ -3,6 +3,7 @@ import datetime
 from celery import shared_task
 
 from forecasts.utils import report_utils
+from forecasts.utils.replica_utils import read_from_replicas
 
 
 @shared_task(bind=True)
@@ -23,11 +24,12 @@ def generate_report(self, user_id, data, report_content):
 
     if generator := content_types.get(report_content, None):
         file_name = generate_name(report_content, data)
-        result, errors = report_utils.generate_report_content(
-            data,
-            generator,
-            file_name,
-        )
+        with read_from_replicas():
+            result, errors = report_utils.generate_report_content(
+                data,
+                generator,
+                file_name,
+            )
 
         report_utils.save_report_to_database(
             user_id,
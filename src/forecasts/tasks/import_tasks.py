@@ -0,0 +1,88 @@
+from io import BufferedReader
+from uuid import uuid4
+
+from celery import shared_task
+from django.apps import apps
+from django.db.models import F
+from django.utils import timezone
+
+from forecasts.models import ImportJob
+from forecasts.utils.import_utils import run_import
+from forecasts.utils.upload_utils import (
+    ChunkedUploadStream,
+    remove_session_files,
+)
+
+
+def create_import_job(**job_data):
+    """Create import job waiting for its task to be started."""
+    return ImportJob.objects.create(task_id=str(uuid4()), **job_data)
+
+
+def run_import_job(job):
+    """Start task of the created import job."""
+    import_file.apply_async((job.pk,), task_id=job.task_id)
+
+
+def start_import_job(**job_data):
+    """Create import job and start its task."""
+    job = create_import_job(**job_data)
+    run_import_job(job)
+    return job
+
+
+def open_job_source(job):
+    """Open import job source file as a binary stream."""
+    if job.upload_session is not None:
+        return BufferedReader(ChunkedUploadStream(job.upload_session))
+    return job.source.open("rb")
+
+
+def remove_job_source(job):
+    """Remove import job source file."""
+    if job.upload_session is not None:
+        remove_session_files(job.upload_session)
+    else:
+        job.source.delete(save=False)
+
+
+@shared_task(bind=True)
+def import_file(self, job_id):
+    """Import data of the job source file and record import progress."""
+    job = ImportJob.objects.select_related("upload_session").get(pk=job_id)
+    jobs = ImportJob.objects.filter(pk=job_id)
+    jobs.update(
+        status=ImportJob.StatusChoices.STARTED,
+        started_at=timezone.now(),
+    )
+
+    def progress(rows_read, rows_inserted):
+        jobs.update(
+            rows_read=F("rows_read") + rows_read,
+            rows_inserted=F("rows_inserted") + rows_inserted,
+            rows_rejected=F("rows_rejected") + rows_read - rows_inserted,
+        )
+
+    try:
+        with open_job_source(job) as source:
+            inserted = run_import(
+                apps.get_model(job.model_label),
+                source,
+                job.engine,
+                progress=progress,
+                mode=job.mode,
+            )
+    except Exception as ex:
+        jobs.update(
+            status=ImportJob.StatusChoices.FAILURE,
+            errors={"error": str(ex)},
+            finished_at=timezone.now(),
+        )
+        raise
+
+    jobs.update(
+        status=ImportJob.StatusChoices.SUCCESS,
+        rows_inserted=inserted,
+        finished_at=timezone.now(),
+    )
+    remove_job_source(job)
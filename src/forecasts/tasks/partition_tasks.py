@@ -0,0 +1,24 @@
+from datetime import datetime, timezone
+
+from celery import shared_task
+from django.conf import settings
+
+from forecasts.utils import partition_utils
+
+
+@shared_task
+def maintain_sale_partitions():
+    """Create sales partitions ahead and drop partitions past retention."""
+    created = partition_utils.ensure_sale_partitions()
+    dropped = []
+    if settings.SALES_RETENTION_MONTHS:
+        dropped = partition_utils.drop_sale_partitions(
+            partition_utils.add_months(
+                partition_utils.get_month(datetime.now(timezone.utc)),
+                -settings.SALES_RETENTION_MONTHS,
+            )
+        )
+    return {
+        "created": [partition_utils.get_partition_name(m) for m in created],
+        "dropped": [partition_utils.get_partition_name(m) for m in dropped],
+    }
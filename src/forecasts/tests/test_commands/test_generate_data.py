@@ -0,0 +1,54 @@
+from io import StringIO
+
+from django.core.management import call_command
+from django.test import TestCase
+
+from forecasts.models import SKU, Forecast, Sale, Store
+
+
+class GenerateDataCommandTestCase(TestCase):
+    """Generate data command testcase class."""
+
+    def test_generate_data(self):
+        """Test data of the given cardinalities is generated."""
+        call_command(
+            "generate_data",
+            stores=3,
+            skus=20,
+            days=10,
+            forecast_days=7,
+            assortment=0.5,
+            sale_rate=1,
+            batch_size=40,
+            stdout=StringIO(),
+        )
+
+        self.assertEqual(Store.objects.count(), 3)
+        self.assertEqual(SKU.objects.count(), 20)
+        self.assertEqual(Sale.objects.count(), 3 * 10 * 10)
+        self.assertEqual(Forecast.objects.count(), 3 * 10 * 7)
+        self.assertEqual(
+            Sale.objects.filter(sales_units__lt=1).count(),
+            0,
+        )
+        self.assertEqual(
+            Sale.objects.filter(date__date="2022-01-10").count(),
+            3 * 10,
+        )
+        self.assertEqual(
+            Forecast.objects.filter(date="2022-01-11").count(),
+            3 * 10,
+        )
+
+    def test_generated_data_is_reproducible(self):
+        """Test the same seed generates the same sales."""
+        options = {"stores": 2, "skus": 10, "days": 5, "stdout": StringIO()}
+        call_command("generate_data", **options)
+        sales = list(Sale.objects.values_list("sales_units", flat=True))
+        Sale.objects.all().delete()
+
+        call_command("generate_data", **options)
+        self.assertEqual(
+            list(Sale.objects.values_list("sales_units", flat=True)),
+            sales,
+        )
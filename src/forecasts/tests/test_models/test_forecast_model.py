@@ -1,9 +1,19 @@
-from datetime import datetime
+from datetime import date, datetime
 
 import pytz
+from django.db import NotSupportedError
 from django.test import TestCase
 
-from forecasts.models import SKU, Forecast, Store
+from forecasts.models import (
+    SKU,
+    Forecast,
+    ForecastRun,
+    ForecastSeries,
+    SKUCategory,
+    SKUGroup,
+    SKUSubcategory,
+    Store,
+)
 
 
 class ForecastModelTestCase(TestCase):
@@ -23,9 +33,9 @@ class ForecastModelTestCase(TestCase):
             is_active=True,
         )
         self.sku = SKU.objects.create(
-            group="Group1",
-            category="Category1",
-            subcategory="Subcategory1",
+            group=SKUGroup(name="Group1"),
+            category=SKUCategory(name="Category1"),
+            subcategory=SKUSubcategory(name="Subcategory1"),
             sku="SKU123",
             uom=10,
         )
@@ -72,3 +82,45 @@ class ForecastModelTestCase(TestCase):
     def test_model_plural_verbose_name(self):
         """Test the plural verbose name of the model."""
         self.assertEqual(str(Forecast._meta.verbose_name_plural), "Прогнозы")
+
+    def test_forecasts_merged_into_series(self):
+        """Test forecasts of a run are merged into one series."""
+        run = self.forecast.run
+        Forecast.objects.bulk_create(
+            [
+                Forecast(store=self.store, sku=self.sku, date=day, target=1)
+                for day in ("2023-09-29", "2023-09-26")
+            ],
+            ignore_conflicts=True,
+            run=run,
+        )
+
+        series = ForecastSeries.objects.get()
+        self.assertEqual(series.start_date, date(2023, 9, 26))
+        self.assertEqual(series.targets, [100, None, None, 1])
+        self.assertEqual(
+            list(Forecast.objects.values_list("target", flat=True)),
+            [100, 1],
+        )
+
+    def test_forecasts_of_new_run(self):
+        """Test forecasts of another run are stored in a new series."""
+        run = ForecastRun.objects.create(model_version="v2")
+        forecast = Forecast(store=self.store, sku=self.sku, run=run)
+        forecast.date = date(2023, 9, 26)
+        forecast.target = 50
+        forecast.save()
+
+        self.assertEqual(ForecastSeries.objects.count(), 2)
+        self.assertEqual(Forecast.objects.get(pk=forecast.pk).target, 50)
+        self.assertEqual(ForecastRun.objects.get_open("v2"), run)
+
+    def test_forecasts_view_not_written(self):
+        """Test forecasts are not updated or deleted through the view."""
+        with self.assertRaises(NotSupportedError):
+            self.forecast.delete()
+        with self.assertRaises(NotSupportedError):
+            Forecast.objects.filter(pk=self.forecast.pk).update(target=1)
+        with self.assertRaises(NotSupportedError):
+            Forecast.objects.all().delete()
+        self.assertEqual(Forecast.objects.get().target, 100)
@@ -3,7 +3,14 @@ from datetime import datetime
 import pytz
 from django.test import TestCase
 
-from forecasts.models import SKU, Sale, Store
+from forecasts.models import (
+    SKU,
+    Sale,
+    SKUCategory,
+    SKUGroup,
+    SKUSubcategory,
+    Store,
+)
 
 
 class SaleModelTestCase(TestCase):
@@ -23,9 +30,9 @@ class SaleModelTestCase(TestCase):
             is_active=True,
         )
         self.sku = SKU.objects.create(
-            group="Group1",
-            category="Category1",
-            subcategory="Subcategory1",
+            group=SKUGroup(name="Group1"),
+            category=SKUCategory(name="Category1"),
+            subcategory=SKUSubcategory(name="Subcategory1"),
             sku="SKU123",
             uom=10,
         )
@@ -0,0 +1,115 @@
+from datetime import date, datetime, timezone
+from decimal import Decimal
+
+from django.test import TestCase
+
+from forecasts.models import (
+    SKU,
+    GroupSaleWeekly,
+    Sale,
+    SaleDaily,
+    SKUCategory,
+    SKUGroup,
+    SKUSubcategory,
+    Store,
+)
+
+
+class SaleRollupModelTestCase(TestCase):
+    """Sales rollup models testcase class."""
+
+    def setUp(self):
+        """Create sample store and SKUs of one group."""
+        self.store = Store.objects.create(
+            store="Store1",
+            city="City1",
+            division="Division1",
+            type_format=1,
+            loc=1,
+            size=1,
+            is_active=True,
+        )
+        self.skus = [
+            SKU.objects.create(
+                group=SKUGroup(name="Group1"),
+                category=SKUCategory(name="Category1"),
+                subcategory=SKUSubcategory(name="Subcategory1"),
+                sku=f"SKU{number}",
+                uom=1,
+            )
+            for number in range(2)
+        ]
+
+    def get_sale(self, sku, day, sales_type=False, units=1):
+        """Return sale of the SKU on the day of September 2023."""
+        return Sale(
+            store=self.store,
+            sku=sku,
+            date=datetime(2023, 9, day, tzinfo=timezone.utc),
+            sales_type=sales_type,
+            sales_units=units,
+            sales_units_promo=0,
+            sales_rub=Decimal("1.5") * units,
+            sales_rub_promo=0,
+        )
+
+    def get_daily(self):
+        """Return daily units and rubles by SKU and date."""
+        return {
+            (daily.sku_id, daily.date): (daily.sales_units, daily.sales_rub)
+            for daily in SaleDaily.objects.all()
+        }
+
+    def get_weekly(self):
+        """Return weekly units of the group by weeks."""
+        return dict(
+            GroupSaleWeekly.objects.filter(
+                store=self.store, group__name="Group1"
+            ).values_list("week", "sales_units")
+        )
+
+    def test_inserted_sales_added(self):
+        """Test inserted sales are added to daily and weekly rollups."""
+        sku, other_sku = self.skus
+        Sale.objects.bulk_create(
+            [
+                self.get_sale(sku, 25, units=2),
+                self.get_sale(sku, 25, sales_type=True, units=3),
+                self.get_sale(other_sku, 26),
+                self.get_sale(other_sku, 24),
+            ]
+        )
+        self.assertEqual(
+            self.get_daily(),
+            {
+                (sku.pk, date(2023, 9, 25)): (5, Decimal("7.50")),
+                (other_sku.pk, date(2023, 9, 26)): (1, Decimal("1.50")),
+                (other_sku.pk, date(2023, 9, 24)): (1, Decimal("1.50")),
+            },
+        )
+        self.assertEqual(
+            self.get_weekly(), {date(2023, 9, 25): 6, date(2023, 9, 18): 1}
+        )
+
+    def test_updated_and_deleted_sales_applied(self):
+        """Test upserted and deleted sales change rollups by difference."""
+        sku = self.skus[0]
+        Sale.objects.bulk_create(
+            [self.get_sale(sku, 25, units=2), self.get_sale(sku, 26)]
+        )
+        Sale.objects.bulk_create(
+            [self.get_sale(sku, 25, units=7)],
+            update_conflicts=True,
+            unique_fields=["store", "sku", "date", "sales_type"],
+            update_fields=["sales_units", "sales_rub"],
+        )
+        Sale.objects.filter(date__day=26).delete()
+
+        self.assertEqual(
+            self.get_daily(),
+            {
+                (sku.pk, date(2023, 9, 25)): (7, Decimal("10.50")),
+                (sku.pk, date(2023, 9, 26)): (0, Decimal("0.00")),
+            },
+        )
+        self.assertEqual(self.get_weekly(), {date(2023, 9, 25): 7})
@@ -1,7 +1,7 @@
 from django.db import IntegrityError
 from django.test import TestCase
 
-from forecasts.models import SKU
+from forecasts.models import SKU, SKUCategory, SKUGroup, SKUSubcategory
 
 
 class SKUModelTestCase(TestCase):
@@ -10,9 +10,9 @@ class SKUModelTestCase(TestCase):
     def setUp(self):
         """Create sample SKU instances for testing."""
         self.sku = SKU.objects.create(
-            group="Group1",
-            category="Category1",
-            subcategory="Subcategory1",
+            group=SKUGroup(name="Group1"),
+            category=SKUCategory(name="Category1"),
+            subcategory=SKUSubcategory(name="Subcategory1"),
             sku="SKU123",
             uom=10,
         )
@@ -25,22 +25,40 @@ class SKUModelTestCase(TestCase):
         """Test creating a duplicate SKU raise an IntegrityError."""
         with self.assertRaises(Exception) as context:
             SKU.objects.create(
-                group="Group1",
-                category="Category1",
-                subcategory="Subcategory1",
+                group=SKUGroup(name="Group1"),
+                category=SKUCategory(name="Category1"),
+                subcategory=SKUSubcategory(name="Subcategory1"),
                 sku="SKU123",
                 uom=10,
             )
 
         self.assertEqual(type(context.exception), IntegrityError)
 
+    def test_dimensions_shared_by_names(self):
+        """Test SKUs of the same hierarchy names share dimensions."""
+        skus = SKU.objects.bulk_create(
+            [
+                SKU(
+                    group=SKUGroup(name="Group1"),
+                    category=SKUCategory(name=f"Category{number}"),
+                    subcategory=SKUSubcategory(name="Subcategory1"),
+                    sku=f"SKU{number}",
+                    uom=1,
+                )
+                for number in range(2)
+            ]
+        )
+        self.assertEqual({sku.group_id for sku in skus}, {self.sku.group_id})
+        self.assertEqual(SKUGroup.objects.count(), 1)
+        self.assertEqual(SKUCategory.objects.count(), 2)
+
     def test_model_fields(self):
         """Test model fields."""
         sku_from_db = SKU.objects.get(pk=self.sku.pk)
 
-        self.assertEqual(sku_from_db.group, "Group1")
-        self.assertEqual(sku_from_db.category, "Category1")
-        self.assertEqual(sku_from_db.subcategory, "Subcategory1")
+        self.assertEqual(sku_from_db.group.name, "Group1")
+        self.assertEqual(sku_from_db.category.name, "Category1")
+        self.assertEqual(sku_from_db.subcategory.name, "Subcategory1")
         self.assertEqual(sku_from_db.sku, "SKU123")
         self.assertEqual(sku_from_db.uom, 10)
 
@@ -0,0 +1,102 @@
+from datetime import date, datetime, timezone
+
+from django.test import TestCase
+
+from forecasts.models import (
+    SKU,
+    Sale,
+    SKUCategory,
+    SKUGroup,
+    SKUSubcategory,
+    Store,
+    StoreAssortment,
+)
+
+
+class StoreAssortmentModelTestCase(TestCase):
+    """Store assortment model testcase class."""
+
+    def setUp(self):
+        """Create sample store and SKUs."""
+        self.store = Store.objects.create(
+            store="Store1",
+            city="City1",
+            division="Division1",
+            type_format=1,
+            loc=1,
+            size=1,
+            is_active=True,
+        )
+        self.skus = [
+            SKU.objects.create(
+                group=SKUGroup(name="Group1"),
+                category=SKUCategory(name="Category1"),
+                subcategory=SKUSubcategory(name="Subcategory1"),
+                sku=f"SKU{number}",
+                uom=1,
+            )
+            for number in range(2)
+        ]
+
+    def get_sale(self, sku, day, sales_type=False):
+        """Return sale of the SKU on the day of September 2023."""
+        return Sale(
+            store=self.store,
+            sku=sku,
+            date=datetime(2023, 9, day, tzinfo=timezone.utc),
+            sales_type=sales_type,
+            sales_units=1,
+            sales_units_promo=0,
+            sales_rub=1,
+            sales_rub_promo=0,
+        )
+
+    def get_assortment(self):
+        """Return first and last sale dates by SKUs."""
+        return {
+            assortment.sku_id: (assortment.first_sale, assortment.last_sale)
+            for assortment in StoreAssortment.objects.all()
+        }
+
+    def test_inserted_sales_added(self):
+        """Test inserted sales extend the store assortment."""
+        sku, other_sku = self.skus
+        Sale.objects.bulk_create(
+            [self.get_sale(sku, 10), self.get_sale(other_sku, 12)]
+        )
+        Sale.objects.bulk_create(
+            [
+                self.get_sale(sku, 5),
+                self.get_sale(sku, 20),
+                self.get_sale(sku, 10, sales_type=True),
+            ]
+        )
+        self.assertEqual(
+            self.get_assortment(),
+            {
+                sku.pk: (date(2023, 9, 5), date(2023, 9, 20)),
+                other_sku.pk: (date(2023, 9, 12), date(2023, 9, 12)),
+            },
+        )
+        self.assertEqual(list(self.store.skus.all()), self.skus)
+
+    def test_updated_and_deleted_sales_recounted(self):
+        """Test moved and deleted sales recount the store assortment."""
+        sku, other_sku = self.skus
+        Sale.objects.bulk_create(
+            [
+                self.get_sale(sku, 5),
+                self.get_sale(sku, 10),
+                self.get_sale(other_sku, 12),
+            ]
+        )
+        Sale.objects.filter(date__day=5).update(
+            date=datetime(2023, 9, 7, tzinfo=timezone.utc)
+        )
+        Sale.objects.filter(date__day=10).delete()
+        Sale.objects.filter(sku=other_sku).delete()
+
+        self.assertEqual(
+            self.get_assortment(),
+            {sku.pk: (date(2023, 9, 7), date(2023, 9, 7))},
+        )
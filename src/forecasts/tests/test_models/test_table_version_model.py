@@ -0,0 +1,83 @@
+from datetime import datetime, timezone
+
+from django.test import TestCase
+
+from forecasts.models import (
+    SKU,
+    Sale,
+    SKUCategory,
+    SKUGroup,
+    SKUSubcategory,
+    Store,
+    StoreAssortment,
+    TableVersion,
+)
+
+
+class TableVersionModelTestCase(TestCase):
+    """Table version model testcase class."""
+
+    def setUp(self):
+        """Create sample store and SKU."""
+        self.store = Store.objects.create(
+            store="Store1",
+            city="City1",
+            division="Division1",
+            type_format=1,
+            loc=1,
+            size=1,
+            is_active=True,
+        )
+        self.sku = SKU.objects.create(
+            group=SKUGroup(name="Group1"),
+            category=SKUCategory(name="Category1"),
+            subcategory=SKUSubcategory(name="Subcategory1"),
+            sku="SKU1",
+            uom=1,
+        )
+
+    def get_version(self, model):
+        """Return version of the model table."""
+        return TableVersion.objects.of_models(model).get().version
+
+    def create_sale(self, day):
+        """Create sale of the store SKU on the day of September 2023."""
+        Sale.objects.create(
+            store=self.store,
+            sku=self.sku,
+            date=datetime(2023, 9, day, tzinfo=timezone.utc),
+            sales_type=False,
+            sales_units=1,
+            sales_units_promo=0,
+            sales_rub=1,
+            sales_rub_promo=0,
+        )
+
+    def test_writes_bump_versions(self):
+        """Test bulk creates, updates and deletes bump table versions."""
+        version = self.get_version(Store)
+        Store.objects.bulk_create(
+            [
+                Store(
+                    store=f"Store{number}",
+                    city="City1",
+                    division="Division1",
+                    type_format=1,
+                    loc=1,
+                    size=1,
+                    is_active=True,
+                )
+                for number in range(2, 4)
+            ]
+        )
+        Store.objects.filter(store="Store2").update(is_active=False)
+        Store.objects.filter(store="Store3").delete()
+        self.assertGreaterEqual(self.get_version(Store), version + 3)
+
+    def test_assortment_dates_keep_version(self):
+        """Test only new store SKUs bump the assortment version."""
+        version = self.get_version(StoreAssortment)
+        self.create_sale(1)
+        self.assertEqual(self.get_version(StoreAssortment), version + 1)
+        self.create_sale(2)
+        self.assertEqual(self.get_version(StoreAssortment), version + 1)
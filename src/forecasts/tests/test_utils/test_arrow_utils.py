@@ -0,0 +1,110 @@
+import io
+import os
+import tempfile
+
+import pandas as pd
+import pyarrow
+import pyarrow.ipc
+import pyarrow.parquet
+from django.test import TestCase
+
+from forecasts.models import (
+    SKU,
+    Forecast,
+    SKUCategory,
+    SKUGroup,
+    SKUSubcategory,
+    Store,
+)
+from forecasts.utils.import_utils import run_import
+
+
+class ArrowImportTestCase(TestCase):
+    """Parquet and Arrow IPC import testcase class."""
+
+    def setUp(self):
+        """Create sample store, SKU and forecasts table."""
+        Store.objects.create(
+            store="Store1",
+            city="City1",
+            division="Division1",
+            type_format=1,
+            loc=1,
+            size=1,
+            is_active=True,
+        )
+        SKU.objects.create(
+            group=SKUGroup(name="Group1"),
+            category=SKUCategory(name="Category1"),
+            subcategory=SKUSubcategory(name="Subcategory1"),
+            sku="SKU1",
+            uom=1,
+        )
+        self.table = pyarrow.Table.from_pandas(
+            pd.DataFrame(
+                {
+                    "st_id": "Store1",
+                    "pr_sku_id": "SKU1",
+                    "date": pd.date_range("2023-01-01", periods=14).date,
+                    "target": range(14),
+                    "ignored": 0,
+                }
+            ),
+            preserve_index=False,
+        )
+        self.directory = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        """Remove temporary directory."""
+        self.directory.cleanup()
+
+    def assertForecastsImported(self, data_source, batches):
+        """Assert all forecasts are imported by the given batches."""
+        progress = []
+        inserted = run_import(
+            Forecast,
+            data_source,
+            progress=lambda *counts: progress.append(counts),
+        )
+        self.assertEqual(inserted, 14)
+        self.assertEqual(len(progress), batches)
+        self.assertEqual(
+            sum(Forecast.objects.values_list("target", flat=True)),
+            sum(range(14)),
+        )
+
+    def test_import_parquet_by_row_groups(self):
+        """Test Parquet file is imported by row groups."""
+        path = os.path.join(self.directory.name, "forecasts.parquet")
+        pyarrow.parquet.write_table(
+            self.table,
+            path,
+            row_group_size=5,
+        )
+        self.assertForecastsImported(path, batches=3)
+
+    def test_import_arrow_file(self):
+        """Test Arrow IPC file is imported by record batches."""
+        path = os.path.join(self.directory.name, "forecasts.arrow")
+        with pyarrow.ipc.new_file(path, self.table.schema) as w:
+            for batch in self.table.to_batches(max_chunksize=7):
+                w.write_batch(batch)
+        self.assertForecastsImported(path, batches=2)
+
+    def test_import_arrow_stream(self):
+        """Test Arrow IPC stream is imported from unseekable stream."""
+        sink = io.BytesIO()
+        with pyarrow.ipc.new_stream(sink, self.table.schema) as w:
+            w.write_table(self.table)
+        stream = io.BufferedReader(io.BytesIO(sink.getvalue()))
+        stream.seekable = lambda: False
+        self.assertForecastsImported(stream, batches=1)
+
+    def test_unseekable_parquet(self):
+        """Test Parquet can not be read from unseekable stream."""
+        sink = io.BytesIO()
+        pyarrow.parquet.write_table(self.table, sink)
+        stream = io.BufferedReader(io.BytesIO(sink.getvalue()))
+        stream.seekable = lambda: False
+        with self.assertRaises(ValueError):
+            run_import(Forecast, stream)
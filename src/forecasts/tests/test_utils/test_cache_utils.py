@@ -0,0 +1,37 @@
+from unittest import mock
+
+from django.core.cache import caches
+from django.test import SimpleTestCase
+
+from forecasts.utils import cache_utils
+
+
+class ListCacheTestCase(SimpleTestCase):
+    """List cache utils testcase class."""
+
+    def setUp(self):
+        """Clear the cache and its metrics."""
+        caches["default"].clear()
+        cache_utils.reset_cache_stats()
+
+    def test_values_cached(self):
+        """Test values are computed once and hits are counted."""
+        compute = mock.Mock(return_value=["Group1"])
+        key = cache_utils.get_cache_key("list", [("store", ["1"])])
+        for hit in (False, True, True):
+            self.assertEqual(
+                cache_utils.get_or_compute(key, compute), (["Group1"], hit)
+            )
+        compute.assert_called_once_with()
+        stats = cache_utils.get_cache_stats()
+        self.assertEqual((stats["hits"], stats["misses"]), (2, 1))
+        self.assertAlmostEqual(stats["hit_ratio"], 2 / 3)
+
+    def test_unavailable_cache_computes(self):
+        """Test values are computed while the cache fails."""
+        cache = mock.Mock(**{"get.side_effect": ConnectionError})
+        cache.set.side_effect = ConnectionError
+        with mock.patch.object(cache_utils, "caches", {"default": cache}):
+            value = cache_utils.get_or_compute("key", lambda: 1)
+        self.assertEqual(value, (1, False))
+        self.assertEqual(cache_utils.get_cache_stats()["errors"], 2)
@@ -0,0 +1,156 @@
+import os
+import tempfile
+from decimal import Decimal
+
+import pandas as pd
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+
+from forecasts.models import (
+    SKU,
+    Forecast,
+    Sale,
+    SKUCategory,
+    SKUGroup,
+    SKUSubcategory,
+    Store,
+)
+from forecasts.utils.columnar_utils import (
+    columnar_import_data,
+    read_csv_frames,
+)
+from forecasts.utils.constants import IMPORT_MODE_UPSERT
+from forecasts.utils.csv_utils import split_csv_file
+
+
+class ColumnarImportDataTestCase(TestCase):
+    """Columnar import utils testcase class."""
+
+    def setUp(self):
+        """Create sample store and SKUs for testing."""
+        self.store = Store.objects.create(
+            store="Store1",
+            city="City1",
+            division="Division1",
+            type_format=1,
+            loc=1,
+            size=1,
+            is_active=True,
+        )
+        self.skus = SKU.objects.bulk_create(
+            [
+                SKU(
+                    group=SKUGroup(name="Group1"),
+                    category=SKUCategory(name="Category1"),
+                    subcategory=SKUSubcategory(name="Subcategory1"),
+                    sku=f"SKU{i}",
+                    uom=1,
+                )
+                for i in range(3)
+            ]
+        )
+
+    def get_sales_frame(self, **columns):
+        """Return sales data frame for every SKU."""
+        frame = pd.DataFrame(
+            {
+                "st_id": "Store1",
+                "pr_sku_id": [sku.sku for sku in self.skus],
+                "date": "2023-01-01",
+                "pr_sales_type_id": "1.0",
+                "pr_sales_in_units": "2.7",
+                "pr_promo_sales_in_units": "0.0",
+                "pr_sales_in_rub": "100.456",
+                "pr_promo_sales_in_rub": "0.0",
+            }
+        )
+        return frame.assign(**columns)
+
+    def test_columns_converted(self):
+        """Test column values are converted as with the ORM import."""
+        progress = []
+        inserted = columnar_import_data(
+            Sale,
+            [self.get_sales_frame()],
+            progress=lambda *counts: progress.append(counts),
+        )
+
+        self.assertEqual(inserted, 3)
+        self.assertEqual(progress, [(3, 3)])
+        sale = Sale.objects.get(sku=self.skus[0])
+        self.assertEqual(sale.store, self.store)
+        self.assertTrue(sale.sales_type)
+        self.assertEqual(sale.sales_units, 2)
+        self.assertEqual(sale.sales_rub, Decimal("100.46"))
+        self.assertEqual(sale.date.isoformat(), "2023-01-01T00:00:00+00:00")
+
+    def test_invalid_rows_rejected(self):
+        """Test rows with invalid values are dropped."""
+        frame = self.get_sales_frame(
+            pr_sku_id=["SKU0", "Unknown", "SKU2"],
+            pr_sales_in_units=["1", "1", "nan"],
+        )
+        progress = []
+        inserted = columnar_import_data(
+            Sale,
+            [frame],
+            progress=lambda *counts: progress.append(counts),
+        )
+
+        self.assertEqual(inserted, 1)
+        self.assertEqual(progress, [(3, 1)])
+        self.assertTrue(Sale.objects.filter(sku=self.skus[0]).exists())
+
+    def test_upsert_sales(self):
+        """Test duplicated sales of the frames update the same sale."""
+        frames = [
+            self.get_sales_frame(pr_sales_in_units=["1", "2", "3"]),
+            self.get_sales_frame(pr_sales_in_units=["4", "5", "6"])[:1],
+        ]
+        columnar_import_data(Sale, frames, mode=IMPORT_MODE_UPSERT)
+
+        self.assertEqual(Sale.objects.count(), 3)
+        self.assertEqual(Sale.objects.get(sku=self.skus[0]).sales_units, 4)
+
+    def test_references_resolved_once_per_frame(self):
+        """Test references are mapped with a query per referenced model."""
+        dates = [f"2023-01-0{day}" for day in range(1, 8)]
+        frame = pd.DataFrame(
+            {
+                "st_id": "Store1",
+                "pr_sku_id": ["SKU0", "SKU1"] * 7,
+                "date": dates * 2,
+                "target": "5",
+            }
+        )
+        with CaptureQueriesContext(connection) as context:
+            columnar_import_data(Forecast, [frame])
+
+        reference_tables = ('FROM "forecasts_store"', 'FROM "forecasts_sku"')
+        selects = [
+            query["sql"]
+            for query in context.captured_queries
+            if any(table in query["sql"] for table in reference_tables)
+        ]
+        self.assertEqual(len(selects), 2)
+        self.assertEqual(Forecast.objects.count(), 14)
+
+    def test_read_frames_by_byte_ranges(self):
+        """Test frames of byte ranges cover the whole file."""
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "stores.csv")
+            with open(path, "w") as file:
+                file.write("st_id,st_city_id\n")
+                file.writelines(f"Store{i},City{i}\n" for i in range(100))
+
+            frames = [
+                frame
+                for byte_range in split_csv_file(path, 3)
+                for frame in read_csv_frames(path, 30, byte_range)
+            ]
+
+        # Every range of about 33 lines is read by two frames.
+        self.assertEqual(len(frames), 6)
+        stores = pd.concat(frames)["st_id"].tolist()
+        self.assertEqual(stores, [f"Store{i}" for i in range(100)])
@@ -0,0 +1,81 @@
+import gzip
+import io
+import os
+import tempfile
+
+import zstandard
+from django.test import SimpleTestCase
+
+from forecasts.utils.columnar_utils import read_csv_frames
+from forecasts.utils.compression_utils import find_data_file
+from forecasts.utils.csv_utils import read_csv_file
+from forecasts.utils.parallel_utils import get_file_chunks
+
+CONTENT = b"st_id,st_city_id\n" + b"".join(
+    f"Store{i},City{i}\n".encode() for i in range(10)
+)
+
+
+class CompressedInputTestCase(SimpleTestCase):
+    """Compressed input utils testcase class."""
+
+    def setUp(self):
+        """Create temporary directory for data files."""
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "stores.csv")
+
+    def tearDown(self):
+        """Remove temporary directory."""
+        self.directory.cleanup()
+
+    def write_file(self, path, content):
+        """Write content into the file."""
+        with open(path, "wb") as file:
+            file.write(content)
+        return path
+
+    def assertStoresRead(self, get_data_source):
+        """Assert all stores are read by both CSV readers."""
+        rows = [
+            row for batch in read_csv_file(get_data_source()) for row in batch
+        ]
+        self.assertEqual(len(rows), 10)
+        self.assertEqual(rows[-1], {"st_id": "Store9", "st_city_id": "City9"})
+
+        frames = list(read_csv_frames(get_data_source()))
+        self.assertEqual(frames[0]["st_id"].tolist()[-1], "Store9")
+
+    def test_read_gzip(self):
+        """Test gzip files and streams are decompressed."""
+        content = gzip.compress(CONTENT)
+        # Compression is detected by content despite the file extension.
+        path = self.write_file(self.path, content)
+        self.assertStoresRead(lambda: path)
+        self.assertStoresRead(lambda: io.BytesIO(content))
+
+    def test_read_zstd(self):
+        """Test zstd files and streams are decompressed."""
+        content = zstandard.compress(CONTENT)
+        path = self.write_file(self.path + ".zst", content)
+        self.assertStoresRead(lambda: path)
+        self.assertStoresRead(lambda: io.BytesIO(content))
+
+    def test_read_plain_stream(self):
+        """Test not compressed streams are read as they are."""
+        self.assertStoresRead(lambda: io.BufferedReader(io.BytesIO(CONTENT)))
+
+    def test_find_compressed_copy(self):
+        """Test compressed copy is found when the file is missing."""
+        self.assertEqual(find_data_file(self.path), self.path)
+        compressed_path = self.write_file(
+            self.path + ".gz",
+            gzip.compress(CONTENT),
+        )
+        self.assertEqual(find_data_file(self.path), compressed_path)
+        self.write_file(self.path, CONTENT)
+        self.assertEqual(find_data_file(self.path), self.path)
+
+    def test_compressed_file_not_split(self):
+        """Test compressed files are loaded by a single chunk."""
+        path = self.write_file(self.path, gzip.compress(CONTENT * 1000))
+        self.assertEqual(get_file_chunks(path, 4), [None])
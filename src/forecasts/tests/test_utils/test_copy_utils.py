@@ -0,0 +1,148 @@
+from datetime import date
+from unittest import skipUnless
+
+from django.db import connection
+from django.test import TestCase
+
+from forecasts.models import (
+    SKU,
+    Forecast,
+    ForecastRun,
+    ForecastSeries,
+    GroupSaleWeekly,
+    Sale,
+    SaleDaily,
+    SKUCategory,
+    SKUGroup,
+    SKUSubcategory,
+    Store,
+)
+from forecasts.utils.constants import IMPORT_MODE_UPSERT
+from forecasts.utils.copy_utils import copy_import_data, supports_copy
+
+
+@skipUnless(connection.vendor == "postgresql", "COPY requires PostgreSQL")
+class CopyImportDataTestCase(TestCase):
+    """COPY import utils testcase class."""
+
+    def setUp(self):
+        """Create sample store and SKUs for testing."""
+        self.store = Store.objects.create(
+            store="Store1",
+            city="City1",
+            division="Division1",
+            type_format=1,
+            loc=1,
+            size=1,
+            is_active=True,
+        )
+        self.skus = SKU.objects.bulk_create(
+            [
+                SKU(
+                    group=SKUGroup(name="Group1"),
+                    category=SKUCategory(name="Category1"),
+                    subcategory=SKUSubcategory(name="Subcategory1"),
+                    sku=f"SKU{i}",
+                    uom=1,
+                )
+                for i in range(2)
+            ]
+        )
+
+    def test_copy_sales(self):
+        """Test sales are copied into the sales table."""
+        rows = [
+            {
+                "st_id": "Store1",
+                "pr_sku_id": sku.sku,
+                "date": "2023-01-01",
+                "pr_sales_type_id": "1",
+                "pr_sales_in_units": "3.0",
+                "pr_promo_sales_in_units": "1.0",
+                "pr_sales_in_rub": "300.5",
+                "pr_promo_sales_in_rub": "100.0",
+            }
+            for sku in self.skus
+        ]
+        rows.append(dict(rows[0], pr_sku_id="Unknown"))
+
+        inserted = copy_import_data(Sale, [rows[:1], rows[1:]])
+
+        self.assertEqual(inserted, 2)
+        sale = Sale.objects.get(sku=self.skus[0])
+        self.assertTrue(sale.sales_type)
+        self.assertEqual(sale.sales_units, 3)
+        self.assertEqual(float(sale.sales_rub), 300.5)
+
+    def test_copy_forecasts(self):
+        """Test copied forecasts are merged into series of the open run."""
+        self.assertTrue(supports_copy(Forecast))
+        Forecast.objects.bulk_create(
+            [
+                Forecast(
+                    store=self.store,
+                    sku=self.skus[0],
+                    date="2023-01-02",
+                    target=5,
+                )
+            ]
+        )
+        rows = [
+            {
+                "st_id": "Store1",
+                "pr_sku_id": sku.sku,
+                "date": day,
+                "target": str(target),
+            }
+            for sku in self.skus
+            for day, target in (("2023-01-02", 1), ("2023-01-04", 2))
+        ]
+
+        inserted = copy_import_data(Forecast, [rows[:2], rows[2:]])
+
+        self.assertEqual(inserted, 4)
+        series = {
+            series.sku_id: series
+            for series in ForecastSeries.objects.filter(
+                run=ForecastRun.objects.get_open()
+            )
+        }
+        self.assertEqual(series[self.skus[0].pk].targets, [5, None, 2])
+        self.assertEqual(series[self.skus[1].pk].targets, [1, None, 2])
+        self.assertEqual(
+            series[self.skus[1].pk].start_date,
+            date(2023, 1, 2),
+        )
+
+        rows = [dict(rows[0], target="7"), dict(rows[0], target="8")]
+        copy_import_data(Forecast, [rows], mode=IMPORT_MODE_UPSERT)
+        self.assertEqual(
+            Forecast.objects.get(sku=self.skus[0], date="2023-01-02").target,
+            8,
+        )
+        self.assertEqual(Forecast.objects.count(), 4)
+
+    def test_copy_upsert_sales(self):
+        """Test copied sales update sales with the same natural key."""
+        row = {
+            "st_id": "Store1",
+            "pr_sku_id": "SKU0",
+            "date": "2023-01-01",
+            "pr_sales_type_id": "0",
+            "pr_sales_in_units": "3.0",
+            "pr_promo_sales_in_units": "0.0",
+            "pr_sales_in_rub": "300.0",
+            "pr_promo_sales_in_rub": "0.0",
+        }
+        copy_import_data(Sale, [[row]])
+        batches = [
+            [dict(row, pr_sales_in_units="4.0")],
+            [dict(row, pr_sales_in_units="5.0")],
+        ]
+        self.assertEqual(
+            copy_import_data(Sale, batches, mode=IMPORT_MODE_UPSERT),
+            1,
+        )
+        self.assertEqual(Sale.objects.get().sales_units, 5)
+        self.assertEqual(SaleDaily.objects.get().sales_units, 5)
+        self.assertEqual(GroupSaleWeekly.objects.get().sales_units, 5)
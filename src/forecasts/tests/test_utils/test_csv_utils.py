@@ -0,0 +1,133 @@
+from django.test import TestCase
+
+from forecasts.models import (
+    SKU,
+    Sale,
+    SKUCategory,
+    SKUGroup,
+    SKUSubcategory,
+    Store,
+)
+from forecasts.utils.constants import IMPORT_MODE_UPSERT
+from forecasts.utils.csv_utils import ReferenceCache, import_data
+
+
+class ImportDataTestCase(TestCase):
+    """CSV import utils testcase class."""
+
+    def setUp(self):
+        """Create sample stores and SKUs for testing."""
+        self.stores = Store.objects.bulk_create(
+            [
+                Store(
+                    store=f"Store{i}",
+                    city="City1",
+                    division="Division1",
+                    type_format=1,
+                    loc=1,
+                    size=1,
+                    is_active=True,
+                )
+                for i in range(2)
+            ]
+        )
+        self.skus = SKU.objects.bulk_create(
+            [
+                SKU(
+                    group=SKUGroup(name="Group1"),
+                    category=SKUCategory(name="Category1"),
+                    subcategory=SKUSubcategory(name="Subcategory1"),
+                    sku=f"SKU{i}",
+                    uom=1,
+                )
+                for i in range(3)
+            ]
+        )
+
+    def get_sales_rows(self, day):
+        """Return sales CSV rows for every store and SKU."""
+        return [
+            {
+                "st_id": store.store,
+                "pr_sku_id": sku.sku,
+                "date": f"2023-01-{day:02d}",
+                "pr_sales_type_id": "0",
+                "pr_sales_in_units": "2.0",
+                "pr_promo_sales_in_units": "0.0",
+                "pr_sales_in_rub": "100.0",
+                "pr_promo_sales_in_rub": "0.0",
+            }
+            for store in self.stores
+            for sku in self.skus
+        ]
+
+    def test_references_resolved_once_per_batch(self):
+        """Test references are resolved with bulk queries."""
+        batches = [self.get_sales_rows(1), self.get_sales_rows(2)]
+        # Stores and SKUs of the first batch are resolved with one query
+        # per referenced model, the second batch hits the cache.
+        with self.assertNumQueries(4):
+            import_data(Sale, batches)
+
+        self.assertEqual(Sale.objects.count(), 12)
+        sale = Sale.objects.get(
+            store=self.stores[1],
+            sku=self.skus[2],
+            date__day=2,
+        )
+        self.assertEqual(sale.sales_units, 2)
+
+    def test_unknown_references_skipped(self):
+        """Test rows with unknown natural keys are not imported."""
+        rows = self.get_sales_rows(1)
+        rows[0]["st_id"] = "Unknown"
+        import_data(Sale, [rows])
+        self.assertEqual(Sale.objects.count(), len(rows) - 1)
+
+    def test_ambiguous_references_skipped(self):
+        """Test natural keys matching several objects are not resolved."""
+        SKU.objects.create(
+            group=SKUGroup(name="Group2"),
+            category=SKUCategory(name="Category2"),
+            subcategory=SKUSubcategory(name="Subcategory2"),
+            sku="SKU0",
+            uom=1,
+        )
+        resolved = ReferenceCache().resolve(SKU, "sku", {"SKU0", "SKU1"})
+        self.assertEqual(resolved, {"SKU1": self.skus[1].pk})
+
+    def test_cache_size_bounded(self):
+        """Test cache evicts least recently used keys."""
+        cache = ReferenceCache(max_size=2)
+        cache.resolve(SKU, "sku", {"SKU0", "SKU1", "SKU2"})
+        with self.assertNumQueries(1):
+            resolved = cache.resolve(SKU, "sku", {"SKU0", "SKU1", "SKU2"})
+        self.assertEqual(len(resolved), 3)
+
+    def test_duplicated_sales_ignored(self):
+        """Test resent sales are not duplicated."""
+        rows = self.get_sales_rows(1)
+        import_data(Sale, [rows])
+        rows[0]["pr_sales_in_units"] = "5.0"
+        self.assertEqual(import_data(Sale, [rows]), len(rows))
+        self.assertEqual(Sale.objects.count(), len(rows))
+        self.assertEqual(Sale.objects.filter(sales_units=5).count(), 0)
+
+    def test_upsert_sales(self):
+        """Test resent sales are updated by the last row of the key."""
+        rows = self.get_sales_rows(1)
+        import_data(Sale, [rows])
+        corrected_rows = [
+            dict(rows[0], pr_sales_in_units="5.0"),
+            dict(rows[0], pr_sales_in_units="7.0"),
+        ]
+        import_data(Sale, [corrected_rows], mode=IMPORT_MODE_UPSERT)
+
+        self.assertEqual(Sale.objects.count(), len(rows))
+        sale = Sale.objects.get(store=self.stores[0], sku=self.skus[0])
+        self.assertEqual(sale.sales_units, 7)
+
+    def test_upsert_not_supported(self):
+        """Test models without natural key can not be upserted."""
+        with self.assertRaises(ValueError):
+            import_data(SKU, [], mode=IMPORT_MODE_UPSERT)
@@ -0,0 +1,101 @@
+import json
+from datetime import datetime, timezone
+from io import BytesIO
+
+from django.test import TestCase
+
+from forecasts.models import (
+    SKU,
+    Sale,
+    SKUCategory,
+    SKUGroup,
+    SKUSubcategory,
+    Store,
+)
+from forecasts.utils.csv_utils import import_data, read_csv_file
+from forecasts.utils.export_utils import stream_csv, stream_ndjson
+
+SALE_FIELDS = (
+    "store",
+    "sku",
+    "date",
+    "sales_type",
+    "sales_units",
+    "sales_units_promo",
+    "sales_rub",
+    "sales_rub_promo",
+)
+
+
+class ExportTestCase(TestCase):
+    """Export utils testcase class."""
+
+    def setUp(self):
+        """Create sample sales for testing."""
+        store = Store.objects.create(
+            store="Store1",
+            city="City1",
+            division="Division1",
+            type_format=1,
+            loc=1,
+            size=1,
+            is_active=True,
+        )
+        sku = SKU.objects.create(
+            group=SKUGroup(name="Group1"),
+            category=SKUCategory(name="Category1"),
+            subcategory=SKUSubcategory(name="Subcategory1"),
+            sku="SKU1",
+            uom=1,
+        )
+        Sale.objects.bulk_create(
+            [
+                Sale(
+                    store=store,
+                    sku=sku,
+                    date=datetime(2023, 1, day, tzinfo=timezone.utc),
+                    sales_type=day % 2 == 0,
+                    sales_units=day,
+                    sales_units_promo=0,
+                    sales_rub=f"{day}.50",
+                    sales_rub_promo="0.00",
+                )
+                for day in range(1, 6)
+            ]
+        )
+
+    def get_sales(self):
+        """Return sales values ordered by dates."""
+        return list(Sale.objects.order_by("date").values_list(*SALE_FIELDS))
+
+    def test_csv_imported_back(self):
+        """Test exported CSV chunks are imported back to the same sales."""
+        sales = self.get_sales()
+        chunks = list(stream_csv(Sale, Sale.objects.all(), chunk_size=2))
+        # Header is sent before rows are fetched.
+        self.assertEqual(len(chunks), 4)
+        self.assertTrue(chunks[0].startswith("st_id,pr_sku_id,date,"))
+
+        Sale.objects.all().delete()
+        source = BytesIO("".join(chunks).encode("utf-8"))
+        import_data(Sale, read_csv_file(source))
+        self.assertEqual(self.get_sales(), sales)
+
+    def test_ndjson_rows(self):
+        """Test sales are exported as JSON lines of file columns."""
+        content = "".join(stream_ndjson(Sale, Sale.objects.order_by("date")))
+        rows = [json.loads(line) for line in content.splitlines()]
+        self.assertEqual(len(rows), 5)
+        self.assertEqual(
+            rows[1],
+            {
+                "st_id": "Store1",
+                "pr_sku_id": "SKU1",
+                "date": "2023-01-02T00:00:00Z",
+                "pr_sales_type_id": True,
+                "pr_sales_in_units": 2,
+                "pr_promo_sales_in_units": 0,
+                "pr_sales_in_rub": "2.50",
+                "pr_promo_sales_in_rub": "0.00",
+            },
+        )
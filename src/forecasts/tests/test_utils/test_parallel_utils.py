@@ -0,0 +1,145 @@
+import os
+import tempfile
+
+from django.db import IntegrityError, transaction
+from django.test import SimpleTestCase, TestCase
+
+from forecasts.models import (
+    SKU,
+    CurrentForecastRun,
+    Forecast,
+    ForecastRun,
+    ForecastSeries,
+    Sale,
+    SKUCategory,
+    SKUGroup,
+    SKUSubcategory,
+    Store,
+)
+from forecasts.utils.constants import IMPORT_ENGINE_ORM, MODEL_FILE_MAPPING
+from forecasts.utils.csv_utils import read_csv_file, split_csv_file
+from forecasts.utils.parallel_utils import get_import_stages, import_chunk
+
+
+class ImportStagesTestCase(SimpleTestCase):
+    """Import stages testcase class."""
+
+    def test_references_imported_first(self):
+        """Test models are imported after the models they reference."""
+        stages = get_import_stages(MODEL_FILE_MAPPING)
+        self.assertEqual(len(stages), 2)
+        self.assertCountEqual(stages[0], [Store, SKU])
+        self.assertCountEqual(stages[1], [Sale, Forecast])
+
+    def test_circular_references(self):
+        """Test circular references raise an error."""
+        mapping = {
+            Store: {"mapping": {"sku": {"reference": SKU}}},
+            SKU: {"mapping": {"store": {"reference": Store}}},
+        }
+        with self.assertRaises(ValueError):
+            get_import_stages(mapping)
+
+
+class SplitCSVFileTestCase(SimpleTestCase):
+    """CSV file splitting testcase class."""
+
+    def setUp(self):
+        """Create sample CSV file for testing."""
+        file = tempfile.NamedTemporaryFile("w", suffix=".csv", delete=False)
+        with file:
+            file.write("st_id,target\n")
+            file.writelines(f"Store{i},{i * 10}\n" for i in range(100))
+        self.path = file.name
+
+    def tearDown(self):
+        """Remove sample CSV file."""
+        os.remove(self.path)
+
+    def read_rows(self, byte_range=None):
+        """Read all rows of the file or its chunk."""
+        return [
+            row
+            for batch in read_csv_file(self.path, 7, byte_range=byte_range)
+            for row in batch
+        ]
+
+    def test_chunks_cover_file(self):
+        """Test rows of all chunks are the rows of the whole file."""
+        for chunks in (1, 3, 8, 1000):
+            with self.subTest(chunks=chunks):
+                byte_ranges = split_csv_file(self.path, chunks)
+                self.assertLessEqual(len(byte_ranges), chunks)
+                rows = [
+                    row
+                    for byte_range in byte_ranges
+                    for row in self.read_rows(byte_range)
+                ]
+                self.assertEqual(rows, self.read_rows())
+
+
+class ImportChunksTestCase(TestCase):
+    """Forecast chunks import testcase class."""
+
+    def setUp(self):
+        """Create stores, SKU and forecasts file of them for testing."""
+        self.stores = [
+            Store.objects.create(
+                store=f"Store{i}",
+                city="City1",
+                division="Division1",
+                type_format=1,
+                loc=1,
+                size=1,
+                is_active=True,
+            )
+            for i in range(20)
+        ]
+        SKU.objects.create(
+            group=SKUGroup.objects.create(name="Group1"),
+            category=SKUCategory.objects.create(name="Category1"),
+            subcategory=SKUSubcategory.objects.create(name="Subcategory1"),
+            sku="SKU1",
+            uom=1,
+        )
+        file = tempfile.NamedTemporaryFile("w", suffix=".csv", delete=False)
+        with file:
+            file.write("st_id,pr_sku_id,date,target\n")
+            file.writelines(
+                f"{store.store},SKU1,2023-09-26,{i}\n"
+                for i, store in enumerate(self.stores)
+            )
+        self.path = file.name
+
+    def tearDown(self):
+        """Remove forecasts file."""
+        os.remove(self.path)
+
+    def test_chunks_imported_into_one_run(self):
+        """Test chunks of forecasts are published as a single run."""
+        run = ForecastRun.objects.get_open()
+        byte_ranges = split_csv_file(self.path, 2)
+        self.assertEqual(len(byte_ranges), 2)
+        for byte_range in byte_ranges:
+            import_chunk(
+                Forecast._meta.label, self.path, byte_range, IMPORT_ENGINE_ORM
+            )
+        ForecastRun.objects.publish_open()
+
+        run.refresh_from_db()
+        self.assertIsNotNone(run.published_at)
+        self.assertEqual(ForecastRun.objects.get(), run)
+        self.assertEqual(
+            ForecastSeries.objects.filter(run=run).count(), len(self.stores)
+        )
+        self.assertEqual(
+            CurrentForecastRun.objects.filter(run=run).count(),
+            len(self.stores),
+        )
+
+    def test_one_open_run(self):
+        """Test a second open run of the same day is not created."""
+        run = ForecastRun.objects.get_open()
+        with self.assertRaises(IntegrityError), transaction.atomic():
+            ForecastRun.objects.create()
+        self.assertEqual(ForecastRun.objects.get_open(), run)
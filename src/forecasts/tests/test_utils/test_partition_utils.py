@@ -0,0 +1,140 @@
+from datetime import date, datetime, timezone
+from importlib import import_module
+from unittest import skipUnless
+
+from django.db import connection
+from django.test import TestCase
+
+from forecasts.models import (
+    SKU,
+    GroupSaleWeekly,
+    Sale,
+    SaleDaily,
+    SKUCategory,
+    SKUGroup,
+    SKUSubcategory,
+    Store,
+    StoreAssortment,
+)
+from forecasts.tasks.partition_tasks import maintain_sale_partitions
+from forecasts.utils import partition_utils
+
+
+@skipUnless(connection.vendor == "postgresql", "PostgreSQL is required")
+class SalePartitionTestCase(TestCase):
+    """Sales partitioning utils testcase class."""
+
+    def setUp(self):
+        """Create sample store and SKU."""
+        self.store = Store.objects.create(
+            store="Store1",
+            city="City1",
+            division="Division1",
+            type_format=1,
+            loc=1,
+            size=1,
+            is_active=True,
+        )
+        self.sku = SKU.objects.create(
+            group=SKUGroup(name="Group1"),
+            category=SKUCategory(name="Category1"),
+            subcategory=SKUSubcategory(name="Subcategory1"),
+            sku="SKU1",
+            uom=1,
+        )
+
+    def create_sale(self, date):
+        """Create sale of the date."""
+        return Sale.objects.create(
+            store=self.store,
+            sku=self.sku,
+            date=date,
+            sales_type=False,
+            sales_units=1,
+            sales_units_promo=0,
+            sales_rub=1,
+            sales_rub_promo=0,
+        )
+
+    def get_partition(self, sale):
+        """Return name of the partition holding the sale."""
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "SELECT tableoid::regclass::text FROM forecasts_sale "
+                "WHERE id = %s",
+                [sale.pk],
+            )
+            return cursor.fetchone()[0]
+
+    def test_sales_table_partitioned(self):
+        """Test the sales table is partitioned up to months ahead."""
+        self.assertTrue(partition_utils.is_sale_partitioned())
+        self.assertEqual(partition_utils.ensure_sale_partitions(), [])
+
+    def test_migration_partitions_existing_months(self):
+        """Test sales table rebuild keeps existing sales out of default."""
+        migration = import_module(
+            "forecasts.migrations.0005_sale_partitioning"
+        )
+        with connection.cursor() as cursor:
+            migration.rebuild_sale_table(cursor, partitioned=False)
+        sales = [
+            self.create_sale(datetime(2019, 5, 10, tzinfo=timezone.utc)),
+            self.create_sale(datetime(2021, 11, 3, tzinfo=timezone.utc)),
+        ]
+        with connection.cursor() as cursor:
+            migration.rebuild_sale_table(cursor, partitioned=True)
+
+        self.assertEqual(
+            [self.get_partition(sale) for sale in sales],
+            ["forecasts_sale_p2019_05", "forecasts_sale_p2021_11"],
+        )
+
+    def test_default_partition_rows_moved(self):
+        """Test rows of new partition are moved from default partition."""
+        month = datetime(2100, 5, 1, tzinfo=timezone.utc)
+        sale = self.create_sale(datetime(2100, 5, 17, tzinfo=timezone.utc))
+        self.assertEqual(self.get_partition(sale), "forecasts_sale_default")
+
+        self.assertEqual(partition_utils.ensure_sale_partitions(), [month])
+        self.assertEqual(self.get_partition(sale), "forecasts_sale_p2100_05")
+        self.assertEqual(
+            Sale.objects.filter(date__year=2100).get().pk, sale.pk
+        )
+
+    def test_expired_partitions_dropped(self):
+        """Test partitions before retention are dropped with their rows."""
+        old_month = datetime(1990, 1, 1, tzinfo=timezone.utc)
+        partition_utils.ensure_sale_partitions([old_month])
+        self.create_sale(old_month)
+        self.create_sale(datetime(1989, 12, 31, tzinfo=timezone.utc))
+        kept = self.create_sale(datetime(1990, 2, 1, tzinfo=timezone.utc))
+
+        dropped = partition_utils.drop_sale_partitions(
+            datetime(1990, 2, 10, tzinfo=timezone.utc)
+        )
+        self.assertIn(old_month, dropped)
+        self.assertEqual(list(Sale.objects.all()), [kept])
+        self.assertEqual(
+            list(SaleDaily.objects.values_list("date", flat=True)),
+            [date(1990, 2, 1)],
+        )
+        self.assertEqual(
+            list(GroupSaleWeekly.objects.values_list("week", "sales_units")),
+            [(date(1990, 1, 29), 1)],
+        )
+        self.assertEqual(
+            list(
+                StoreAssortment.objects.values_list("first_sale", "last_sale")
+            ),
+            [(date(1990, 2, 1), date(1990, 2, 1))],
+        )
+
+    def test_maintenance_task(self):
+        """Test maintenance task keeps sales within retention."""
+        self.create_sale(datetime(1990, 1, 1, tzinfo=timezone.utc))
+        with self.settings(SALES_RETENTION_MONTHS=12):
+            result = maintain_sale_partitions.delay().get()
+        self.assertEqual(result["created"], ["forecasts_sale_p1990_01"])
+        self.assertIn("forecasts_sale_p1990_01", result["dropped"])
+        self.assertFalse(Sale.objects.exists())
@@ -0,0 +1,40 @@
+from unittest import mock
+
+from django.db import OperationalError
+from django.test import SimpleTestCase
+
+from forecasts.utils.pool_utils import ConnectionPool
+
+
+class ConnectionPoolTestCase(SimpleTestCase):
+    """Connection pool utils testcase class."""
+
+    def test_connections_reused(self):
+        """Test returned connections are checked out again."""
+        pool = ConnectionPool(max_size=2)
+        connection = pool.checkout(mock.Mock, bool)
+        pool.checkin(connection)
+        self.assertIs(pool.checkout(mock.Mock, bool), connection)
+        self.assertIsNot(pool.checkout(mock.Mock, bool), connection)
+        self.assertEqual(pool.stats()["connects"], 2)
+        self.assertEqual(pool.stats()["checkouts"], 3)
+
+    def test_full_pool_timed_out(self):
+        """Test checkouts of the full pool wait for returns."""
+        pool = ConnectionPool(max_size=1, timeout=0.01)
+        pool.checkout(mock.Mock, bool)
+        with self.assertRaises(OperationalError):
+            pool.checkout(mock.Mock, bool)
+        self.assertEqual(pool.stats()["waits"], 1)
+        self.assertEqual(pool.stats()["timeouts"], 1)
+
+    def test_unusable_connections_replaced(self):
+        """Test idle connections failing checks are closed and replaced."""
+        pool = ConnectionPool(max_size=1, check_after=0)
+        connection = pool.checkout(mock.Mock, bool)
+        pool.checkin(connection)
+        is_usable = mock.Mock(return_value=False)
+        self.assertIsNot(pool.checkout(mock.Mock, is_usable), connection)
+        is_usable.assert_called_once_with(connection)
+        connection.close.assert_called_once_with()
+        self.assertEqual(pool.stats()["size"], 1)
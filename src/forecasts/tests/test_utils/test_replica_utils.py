@@ -0,0 +1,71 @@
+from django.http import HttpResponse, StreamingHttpResponse
+from django.test import RequestFactory, SimpleTestCase, override_settings
+
+from forecasts.models import ImportJob, Sale
+from forecasts.utils.replica_utils import (
+    REPLICA_PIN_COOKIE,
+    ReplicaMiddleware,
+    ReplicaRouter,
+    read_from_replicas,
+)
+
+
+@override_settings(REPLICA_DATABASES=["replica_0"], REPLICA_PIN_SECONDS=5)
+class ReplicaRoutingTestCase(SimpleTestCase):
+    """Replica routing utils testcase class."""
+
+    def setUp(self):
+        """Create sample router and request factory."""
+        self.router = ReplicaRouter()
+        self.factory = RequestFactory()
+
+    def get_response(self, request, streaming=False):
+        """Return response of the request with databases read by views."""
+
+        def view(request):
+            if streaming:
+                return StreamingHttpResponse(
+                    self.router.db_for_read(Sale) for _ in range(1)
+                )
+            return HttpResponse(self.router.db_for_read(Sale))
+
+        return ReplicaMiddleware(view)(request)
+
+    def test_reads_routed_in_context(self):
+        """Test reads go to replicas only within the context."""
+        self.assertEqual(self.router.db_for_read(Sale), "default")
+        with read_from_replicas():
+            self.assertEqual(self.router.db_for_read(Sale), "replica_0")
+            self.assertEqual(self.router.db_for_read(ImportJob), "default")
+            self.assertEqual(self.router.db_for_write(Sale), "default")
+        self.assertFalse(self.router.allow_migrate("replica_0", "forecasts"))
+
+    @override_settings(REPLICA_DATABASES=["replica_0", "replica_1"])
+    def test_context_reads_from_one_replica(self):
+        """Test reads of a context go to the same replica."""
+        for _ in range(5):
+            with read_from_replicas():
+                replica = self.router.db_for_read(Sale)
+                self.assertEqual(
+                    {self.router.db_for_read(Sale) for _ in range(10)},
+                    {replica},
+                )
+
+    def test_safe_requests_read_from_replicas(self):
+        """Test safe requests and their streams read from replicas."""
+        response = self.get_response(self.factory.get("/"))
+        self.assertEqual(response.content, b"replica_0")
+        self.assertNotIn(REPLICA_PIN_COOKIE, response.cookies)
+
+        response = self.get_response(self.factory.get("/"), streaming=True)
+        self.assertEqual(b"".join(response.streaming_content), b"replica_0")
+
+    def test_writing_clients_pinned(self):
+        """Test clients read from the primary after their writes."""
+        response = self.get_response(self.factory.post("/"))
+        self.assertEqual(response.content, b"default")
+        self.assertEqual(response.cookies[REPLICA_PIN_COOKIE]["max-age"], 5)
+
+        request = self.factory.get("/")
+        request.COOKIES[REPLICA_PIN_COOKIE] = "1"
+        self.assertEqual(self.get_response(request).content, b"default")
@@ -0,0 +1,59 @@
+import shutil
+import tempfile
+from io import BytesIO
+
+from django.test import TestCase, override_settings
+from django.utils import timezone
+
+from forecasts.errors import UploadError
+from forecasts.models import UploadSession
+from forecasts.utils.upload_utils import ChunkedUploadStream, write_chunk
+
+
+class ChunkedUploadStreamTestCase(TestCase):
+    """Chunked upload stream testcase class."""
+
+    def setUp(self):
+        """Create upload session with temporary media root."""
+        self.media_root = tempfile.mkdtemp()
+        self.settings_override = override_settings(MEDIA_ROOT=self.media_root)
+        self.settings_override.enable()
+        self.session = UploadSession.objects.create(
+            model_label="forecasts.SKU",
+            engine="orm",
+            file_name="skus.csv",
+        )
+
+    def tearDown(self):
+        """Remove temporary media root."""
+        self.settings_override.disable()
+        shutil.rmtree(self.media_root, ignore_errors=True)
+
+    def test_read_chunks(self):
+        """Test chunks are read in order as a single stream."""
+        for index, chunk in enumerate((b"first,", b"second,", b"third")):
+            write_chunk(self.session, index, BytesIO(chunk))
+        self.session.chunks_count = 3
+        self.session.finalized_at = timezone.now()
+        self.session.save()
+
+        with ChunkedUploadStream(self.session) as stream:
+            self.assertEqual(stream.read(), b"first,second,third")
+
+    def test_not_finalized_session(self):
+        """Test stream is not opened for not finalized session."""
+        write_chunk(self.session, 0, BytesIO(b"first"))
+        with self.assertRaises(UploadError):
+            ChunkedUploadStream(self.session)
+
+    def test_missing_chunk(self):
+        """Test stream fails on missing chunk of finalized session."""
+        write_chunk(self.session, 0, BytesIO(b"first"))
+        self.session.chunks_count = 2
+        self.session.finalized_at = timezone.now()
+        self.session.save()
+
+        with ChunkedUploadStream(self.session) as stream:
+            self.assertEqual(stream.read(5), b"first")
+            with self.assertRaises(UploadError):
+                stream.read(5)
@@ -0,0 +1,70 @@
+import pyarrow.ipc
+import pyarrow.parquet
+
+from forecasts.utils.compression_utils import read_magic
+from forecasts.utils.constants import MODEL_FILE_MAPPING
+
+ARROW_FORMAT_PARQUET = "parquet"
+ARROW_FORMAT_FILE = "arrow"
+ARROW_FORMAT_STREAM = "arrow_stream"
+
+# Arrow IPC stream starts with the continuation marker of its schema.
+ARROW_MAGICS = {
+    b"PAR1": ARROW_FORMAT_PARQUET,
+    b"ARROW1": ARROW_FORMAT_FILE,
+    b"\xff\xff\xff\xff": ARROW_FORMAT_STREAM,
+}
+ARROW_MAGIC_SIZE = 6
+
+
+def get_arrow_format(data_source):
+    """Return Parquet or Arrow IPC format of the file or stream, if any."""
+    if isinstance(data_source, str):
+        with open(data_source, "rb") as file:
+            magic = read_magic(file, ARROW_MAGIC_SIZE)
+    else:
+        magic = read_magic(data_source, ARROW_MAGIC_SIZE)
+    for prefix, arrow_format in ARROW_MAGICS.items():
+        if magic.startswith(prefix):
+            return arrow_format
+    return None
+
+
+def read_arrow_frames(model, data_source, arrow_format):
+    """
+    Read model data frames from Parquet or Arrow IPC source.
+
+    Parquet files are read by row groups and Arrow IPC data by record
+    batches, only columns of the model mapping are read. Parquet and
+    Arrow IPC files require seekable sources, Arrow IPC stream does not.
+    """
+    seekable = isinstance(data_source, str) or data_source.seekable()
+    if arrow_format != ARROW_FORMAT_STREAM and not seekable:
+        raise ValueError(
+            f"Format {arrow_format} can not be read from unseekable stream."
+        )
+    columns = [
+        data["csv_name"]
+        for data in MODEL_FILE_MAPPING[model]["mapping"].values()
+    ]
+
+    if arrow_format == ARROW_FORMAT_PARQUET:
+        parquet_file = pyarrow.parquet.ParquetFile(data_source)
+        batches = (
+            parquet_file.read_row_group(index, columns=columns)
+            for index in range(parquet_file.num_row_groups)
+        )
+    elif arrow_format == ARROW_FORMAT_FILE:
+        reader = pyarrow.ipc.open_file(data_source)
+        batches = (
+            reader.get_batch(index).select(columns)
+            for index in range(reader.num_record_batches)
+        )
+    else:
+        batches = (
+            batch.select(columns)
+            for batch in pyarrow.ipc.open_stream(data_source)
+        )
+
+    for batch in batches:
+        yield batch.to_pandas(date_as_object=False)
@@ -0,0 +1,98 @@
+import logging
+import threading
+from hashlib import md5
+from time import monotonic
+
+from django.conf import settings
+from django.core.cache import caches
+
+logger = logging.getLogger(__name__)
+
+# Metrics of the cache are logged after the number of lookups.
+CACHE_STATS_INTERVAL = 1000
+
+_missing = object()
+_stats = {
+    "hits": 0,
+    "misses": 0,
+    "errors": 0,
+    "hit_time": 0.0,
+    "miss_time": 0.0,
+}
+_stats_lock = threading.Lock()
+
+
+def get_cache_key(prefix, *parts):
+    """Return cache key of the prefix and hashed representation of parts."""
+    return f"{prefix}:{md5(repr(parts).encode('utf-8')).hexdigest()}"
+
+
+def get_or_compute(key, compute, timeout=None):
+    """
+    Return cached value of the key or compute and cache it.
+
+    Cache errors are logged and the value is computed, so lists are
+    served while the cache is unavailable. Returns the value and
+    whether it was cached.
+    """
+    cache = caches[settings.LIST_CACHE_ALIAS]
+    start = monotonic()
+    try:
+        value = cache.get(key, _missing)
+    except Exception:
+        logger.warning("Cached value %s is not read.", key, exc_info=True)
+        record_error()
+        value = _missing
+
+    hit = value is not _missing
+    if not hit:
+        value = compute()
+        try:
+            cache.set(key, value, timeout)
+        except Exception:
+            logger.warning("Value %s is not cached.", key, exc_info=True)
+            record_error()
+    record_lookup(hit, monotonic() - start)
+    return value, hit
+
+
+def record_error():
+    """Count failed cache operation."""
+    with _stats_lock:
+        _stats["errors"] += 1
+
+
+def record_lookup(hit, duration):
+    """Count cache lookup with the time of getting its value."""
+    outcome = "hit" if hit else "miss"
+    with _stats_lock:
+        _stats["hits" if hit else "misses"] += 1
+        _stats[f"{outcome}_time"] += duration
+        lookups = _stats["hits"] + _stats["misses"]
+    logger.debug("Cache %s in %.3f s.", outcome, duration)
+    if lookups % CACHE_STATS_INTERVAL == 0:
+        logger.info("List cache: %s", get_cache_stats())
+
+
+def get_cache_stats():
+    """Return hit ratio and mean times of the current process lookups."""
+    with _stats_lock:
+        stats = dict(_stats)
+    lookups = stats["hits"] + stats["misses"]
+    return {
+        **stats,
+        "hit_ratio": stats["hits"] / lookups if lookups else None,
+        "mean_hit_time": (
+            stats["hit_time"] / stats["hits"] if stats["hits"] else None
+        ),
+        "mean_miss_time": (
+            stats["miss_time"] / stats["misses"] if stats["misses"] else None
+        ),
+    }
+
+
+def reset_cache_stats():
+    """Reset metrics of the current process lookups."""
+    with _stats_lock:
+        for name in _stats:
+            _stats[name] = type(_stats[name])()
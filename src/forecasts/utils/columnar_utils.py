@@ -0,0 +1,242 @@
+from io import StringIO
+
+import numpy as np
+import pandas as pd
+from django.utils import timezone
+from tqdm import tqdm
+
+from forecasts.utils.compression_utils import open_decompressed
+from forecasts.utils.constants import (
+    COLUMNAR_BATCH_SIZE,
+    IMPORT_MODE_INSERT,
+    IMPORT_MODE_UPSERT,
+    MODEL_FILE_MAPPING,
+)
+from forecasts.utils.copy_utils import copy_chunks, supports_copy
+from forecasts.utils.csv_utils import (
+    ReferenceCache,
+    get_conflict_options,
+    get_upsert_key,
+    open_csv_range,
+    resolve_reference,
+)
+
+INTEGER_FIELDS = {
+    "AutoField",
+    "BigAutoField",
+    "BigIntegerField",
+    "IntegerField",
+    "PositiveBigIntegerField",
+    "PositiveIntegerField",
+    "PositiveSmallIntegerField",
+    "SmallAutoField",
+    "SmallIntegerField",
+}
+
+BOOLEAN_VALUES = {
+    "1": True,
+    "0": False,
+    "t": True,
+    "f": False,
+    "true": True,
+    "false": False,
+}
+
+
+def to_numeric(values):
+    """Convert column to numbers, invalid and infinite values become NaN."""
+    numbers = pd.to_numeric(values, errors="coerce")
+    return numbers.where(np.isfinite(numbers))
+
+
+# Column counterparts of the value types declared in the mapping.
+TYPE_CONVERTERS = {
+    float: to_numeric,
+    int: to_numeric,
+    str: lambda values: values,
+}
+
+
+def read_csv_frames(
+    data_source,
+    batch_size=COLUMNAR_BATCH_SIZE,
+    byte_range=None,
+    dtype=str,
+):
+    """
+    Read CSV data by data frames.
+
+    Compression and byte range are handled the same way as
+    in ``read_csv_file``. Columns are read as strings unless other types
+    are given.
+    """
+    options = {}
+    if byte_range is not None:
+        fieldnames, stream = open_csv_range(data_source, byte_range)
+        options.update(header=None, names=fieldnames)
+    elif isinstance(data_source, str):
+        stream = open(data_source, "rb")
+    else:
+        stream = data_source
+    try:
+        # The pyarrow engine of pandas does not read by chunks, and
+        # the streaming pyarrow reader fails on values not matching types
+        # inferred from its first block, so the C parser is used for CSV.
+        with pd.read_csv(
+            open_decompressed(stream),
+            dtype=dtype,
+            chunksize=batch_size,
+            **options,
+        ) as reader:
+            yield from reader
+    finally:
+        if stream is not data_source:
+            stream.close()
+
+
+def get_csv_dtypes(model):
+    """
+    Return types of the model CSV columns for reading.
+
+    Numeric columns are parsed by the CSV parser itself, the rest
+    including natural keys are kept as strings.
+    """
+    return {
+        data["csv_name"]: str
+        for data in MODEL_FILE_MAPPING[model]["mapping"].values()
+        if data.get("type", None) not in (float, int)
+    }
+
+
+def columnar_import_data(
+    model,
+    data,
+    reference_cache=None,
+    progress=None,
+    mode=IMPORT_MODE_INSERT,
+):
+    """
+    Populate the database table from data frames.
+
+    Every frame is converted column by column, models supported by COPY
+    are loaded with it and the rest with ``bulk_create``. Progress callback
+    is called as in ``import_data``, returns the number of rows inserted.
+    """
+    if reference_cache is None:
+        reference_cache = ReferenceCache()
+    model_mapping = MODEL_FILE_MAPPING[model]["mapping"]
+    frames = (
+        (frame, convert_frame(model, model_mapping, frame, reference_cache))
+        for frame in tqdm(
+            data,
+            desc=f"Converting {model.__name__} table...",
+            ncols=100,
+            colour="green",
+        )
+    )
+
+    if supports_copy(model):
+        fields = [model._meta.get_field(field) for field in model_mapping]
+        return copy_chunks(
+            model,
+            fields,
+            (
+                (get_copy_buffer(objects), len(frame), len(objects))
+                for frame, objects in frames
+            ),
+            progress,
+            mode,
+        )
+
+    conflict_options = get_conflict_options(model, mode)
+    inserted = 0
+    for frame, objects in frames:
+        if mode == IMPORT_MODE_UPSERT:
+            objects = objects.drop_duplicates(
+                [
+                    model._meta.get_field(field).attname
+                    for field in get_upsert_key(model)
+                ],
+                keep="last",
+            )
+        model.objects.bulk_create(
+            [model(**values) for values in objects.to_dict("records")],
+            **conflict_options,
+        )
+        inserted += len(objects)
+        if progress is not None:
+            progress(len(frame), len(objects))
+    return inserted
+
+
+def get_copy_buffer(objects):
+    """Return CSV buffer of the converted frame for COPY."""
+    objects = objects.copy(deep=False)
+    for column, values in objects.items():
+        if isinstance(values.dtype, pd.DatetimeTZDtype):
+            # Sessions time zone is UTC, naive values are formatted faster.
+            objects[column] = values.dt.tz_convert("UTC").dt.tz_localize(None)
+    return StringIO(objects.to_csv(index=False, header=False))
+
+
+def convert_frame(model, model_mapping, frame, reference_cache):
+    """
+    Convert CSV columns into model field columns.
+
+    Columns are named by field attribute names, rows with values which
+    can not be converted for not nullable fields are dropped.
+    """
+    columns, required = {}, []
+    for field_name, data in model_mapping.items():
+        field = model._meta.get_field(field_name)
+        values = frame[data["csv_name"]]
+
+        if data.get("reference", None):
+            values = values.map(
+                resolve_reference(
+                    reference_cache,
+                    field_name,
+                    data,
+                    values.dropna().unique(),
+                )
+            )
+        elif field_type := data.get("type", None):
+            values = TYPE_CONVERTERS[field_type](values)
+
+        columns[field.attname] = convert_column(field, values)
+        if not field.null:
+            required.append(field.attname)
+
+    objects = pd.DataFrame(columns)
+    return objects[objects[required].notna().all(axis=1)]
+
+
+def convert_column(field, values):
+    """Convert column values into the field database values."""
+    if field.is_relation:
+        field = field.target_field
+    internal_type = field.get_internal_type()
+
+    if internal_type in INTEGER_FIELDS:
+        return np.trunc(to_numeric(values)).astype("Int64")
+    if internal_type == "BooleanField":
+        if pd.api.types.is_numeric_dtype(values):
+            return (values != 0).astype("boolean").mask(values.isna())
+        return values.str.lower().map(BOOLEAN_VALUES).astype("boolean")
+    if internal_type == "DecimalField":
+        numbers = to_numeric(values).round(field.decimal_places)
+        limit = 10 ** (field.max_digits - field.decimal_places)
+        return numbers.where(numbers.abs() < limit)
+    if internal_type == "DateTimeField":
+        dates = pd.to_datetime(values, errors="coerce")
+        if dates.dt.tz is None:
+            # Naive values are in the default time zone as with the ORM.
+            dates = dates.dt.tz_localize(
+                timezone.get_default_timezone_name(),
+                ambiguous="NaT",
+                nonexistent="NaT",
+            )
+        return dates
+    if internal_type == "DateField":
+        return pd.to_datetime(values, errors="coerce").dt.normalize()
+    return values
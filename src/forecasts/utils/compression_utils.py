@@ -0,0 +1,57 @@
+import gzip
+import os
+
+import zstandard
+
+from forecasts.utils.constants import COMPRESSED_EXTENSIONS
+
+GZIP_MAGIC = b"\x1f\x8b"
+ZSTD_MAGIC = b"\x28\xb5\x2f\xfd"
+MAGIC_SIZE = 4
+
+
+def read_magic(stream, size=MAGIC_SIZE):
+    """Return the first bytes of the stream without consuming them."""
+    if hasattr(stream, "peek"):
+        return stream.peek(size)[:size]
+    position = stream.tell()
+    magic = stream.read(size)
+    stream.seek(position)
+    return magic
+
+
+def open_decompressed(stream):
+    """
+    Return binary stream decompressing the gzip or zstd stream on the fly.
+
+    Compression is detected by magic bytes, streams of not compressed
+    data are returned as they are.
+    """
+    magic = read_magic(stream)
+    if magic.startswith(GZIP_MAGIC):
+        return gzip.GzipFile(fileobj=stream, mode="rb")
+    if magic.startswith(ZSTD_MAGIC):
+        return zstandard.ZstdDecompressor().stream_reader(stream)
+    return stream
+
+
+def is_compressed(path):
+    """Check if the file is compressed."""
+    with open(path, "rb") as file:
+        magic = read_magic(file)
+    return magic.startswith((GZIP_MAGIC, ZSTD_MAGIC))
+
+
+def find_data_file(path):
+    """
+    Return path of the data file or of its compressed copy.
+
+    Compressed copies are looked for next to the file by their extensions
+    when the file itself does not exist.
+    """
+    if os.path.exists(path):
+        return path
+    for extension in COMPRESSED_EXTENSIONS:
+        if os.path.exists(compressed_path := path + extension):
+            return compressed_path
+    return path
@@ -1,5 +1,46 @@
 from forecasts import models
 
+REFERENCE_CACHE_SIZE = 100_000
+
+IMPORT_ENGINE_ORM = "orm"
+IMPORT_ENGINE_COPY = "copy"
+IMPORT_ENGINE_COLUMNAR = "columnar"
+IMPORT_ENGINES = (
+    IMPORT_ENGINE_ORM,
+    IMPORT_ENGINE_COPY,
+    IMPORT_ENGINE_COLUMNAR,
+)
+
+IMPORT_MODE_INSERT = "insert"
+IMPORT_MODE_UPSERT = "upsert"
+IMPORT_MODES = (
+    IMPORT_MODE_INSERT,
+    IMPORT_MODE_UPSERT,
+)
+
+# Natural keys of the models which rows can be updated by imports.
+UPSERT_KEYS = {
+    models.Sale: ("store", "sku", "date", "sales_type"),
+}
+
+COPY_BATCH_SIZE = 10_000
+# Copied forecasts are merged into forecast series of the open run.
+COPY_MODELS = (models.Sale, models.Forecast)
+
+COLUMNAR_BATCH_SIZE = 50_000
+
+PARALLEL_MIN_CHUNK_SIZE = 16 * 1024 * 1024
+
+# Monthly sales partitions are created ahead of the current month.
+SALE_PARTITIONS_AHEAD = 3
+
+SALE_ROLLUP_TOTALS = (
+    "sales_units",
+    "sales_units_promo",
+    "sales_rub",
+    "sales_rub_promo",
+)
+
 MODEL_FILE_MAPPING = {
     models.Store: {
         "path": "../data/st_df.csv",
@@ -16,9 +57,24 @@ MODEL_FILE_MAPPING = {
     models.SKU: {
         "path": "../data/pr_df.csv",
         "mapping": {
-            "group": {"csv_name": "pr_group_id"},
-            "category": {"csv_name": "pr_cat_id"},
-            "subcategory": {"csv_name": "pr_subcat_id"},
+            "group": {
+                "csv_name": "pr_group_id",
+                "reference": models.SKUGroup,
+                "reference_field": "name",
+                "create": True,
+            },
+            "category": {
+                "csv_name": "pr_cat_id",
+                "reference": models.SKUCategory,
+                "reference_field": "name",
+                "create": True,
+            },
+            "subcategory": {
+                "csv_name": "pr_subcat_id",
+                "reference": models.SKUSubcategory,
+                "reference_field": "name",
+                "create": True,
+            },
             "sku": {"csv_name": "pr_sku_id"},
             "uom": {"csv_name": "pr_uom_id"},
         },
@@ -55,3 +111,32 @@ MODEL_FILE_MAPPING = {
         },
     },
 }
+
+IMPORT_MODELS = {model._meta.model_name: model for model in MODEL_FILE_MAPPING}
+
+EXPORT_FORMAT_CSV = "csv"
+EXPORT_FORMAT_NDJSON = "ndjson"
+EXPORT_FORMATS = (
+    EXPORT_FORMAT_CSV,
+    EXPORT_FORMAT_NDJSON,
+)
+EXPORT_CONTENT_TYPES = {
+    EXPORT_FORMAT_CSV: "text/csv",
+    EXPORT_FORMAT_NDJSON: "application/x-ndjson",
+}
+# Rows fetched from server side cursors and written at once.
+EXPORT_CHUNK_SIZE = 2000
+
+COMPRESSED_EXTENSIONS = (".gz", ".zst")
+DATA_FILE_EXTENSIONS = (
+    ".csv",
+    ".csv.gz",
+    ".csv.zst",
+    ".parquet",
+    ".arrow",
+    ".feather",
+)
+
+UPLOAD_SESSIONS_DIR = "files/uploads"
+UPLOAD_CHUNK_MAX_SIZE = 64 * 1024 * 1024
+UPLOAD_READ_BLOCK_SIZE = 1024 * 1024
@@ -0,0 +1,305 @@
+import csv
+from io import StringIO
+from uuid import uuid4
+
+from django.db import connection, transaction
+from tqdm import tqdm
+
+from forecasts.models import Forecast, ForecastRun, ForecastSeries, Sale
+from forecasts.utils.constants import (
+    COPY_MODELS,
+    IMPORT_MODE_INSERT,
+    IMPORT_MODE_UPSERT,
+    MODEL_FILE_MAPPING,
+)
+from forecasts.utils.csv_utils import (
+    ROW_ERRORS,
+    ReferenceCache,
+    get_upsert_key,
+    process_field_data,
+    resolve_references,
+)
+from forecasts.utils.partition_utils import ensure_sale_partitions
+
+# Text values are parsed by PostgreSQL itself, only values which text
+# representation differs from the column input format are converted.
+COPY_CONVERTERS = {
+    "BooleanField": bool,
+    "IntegerField": int,
+    "BigIntegerField": int,
+}
+
+
+def supports_copy(model):
+    """Check if the model data can be loaded with COPY."""
+    return connection.vendor == "postgresql" and model in COPY_MODELS
+
+
+def copy_import_data(
+    model,
+    data,
+    reference_cache=None,
+    progress=None,
+    mode=IMPORT_MODE_INSERT,
+):
+    """
+    Populate the database table using PostgreSQL COPY.
+
+    Every batch is streamed into an unlogged staging table with its own
+    COPY, as natural keys of a batch have to be resolved before. Staged
+    rows are merged into the model table with a single INSERT ... SELECT.
+    Progress callback is called as in ``import_data``, returns the number
+    of rows inserted into the model table.
+    """
+    if reference_cache is None:
+        reference_cache = ReferenceCache()
+    model_mapping = MODEL_FILE_MAPPING[model]["mapping"]
+    fields = [model._meta.get_field(field) for field in model_mapping]
+    return copy_chunks(
+        model,
+        fields,
+        generate_copy_chunks(
+            model,
+            model_mapping,
+            fields,
+            data,
+            reference_cache,
+        ),
+        progress,
+        mode,
+    )
+
+
+def copy_chunks(model, fields, chunks, progress=None, mode=IMPORT_MODE_INSERT):
+    """
+    Copy CSV chunks of the field columns into the model table.
+
+    Chunks are ``(buffer, rows_read, rows_copied)`` tuples, returns
+    the number of rows inserted or updated in the model table.
+    """
+    quote_name = connection.ops.quote_name
+    table = quote_name(model._meta.db_table)
+    staging_table = quote_name(
+        f"{model._meta.db_table}_staging_{uuid4().hex[:12]}"
+    )
+    columns = ", ".join(quote_name(field.column) for field in fields)
+    if model is Forecast:
+        run = ForecastRun.objects.get_open()
+        merge_sql = get_forecast_merge_sql(staging_table, mode)
+    else:
+        merge_sql = get_merge_sql(model, fields, staging_table, mode)
+
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f"CREATE UNLOGGED TABLE {staging_table} AS "
+            f"SELECT {columns} FROM {table} WITH NO DATA"
+        )
+        if mode == IMPORT_MODE_UPSERT or model is Forecast:
+            # Rows numbers keep the order of rows updating the same row.
+            cursor.execute(
+                f"ALTER TABLE {staging_table} ADD COLUMN staging_row bigserial"
+            )
+        copied = 0
+        try:
+            for chunk, rows_read, rows_copied in chunks:
+                cursor.copy_expert(
+                    f"COPY {staging_table} ({columns}) "
+                    "FROM STDIN WITH (FORMAT csv)",
+                    chunk,
+                )
+                copied += rows_copied
+                if progress is not None:
+                    progress(rows_read, rows_copied)
+            if model is Sale:
+                # Staged rows are merged straight into monthly partitions.
+                cursor.execute(
+                    "SELECT DISTINCT date_trunc('month', date) "
+                    f"FROM {staging_table}"
+                )
+                ensure_sale_partitions(month for (month,) in cursor.fetchall())
+            if model is Forecast:
+                with transaction.atomic():
+                    # Writers of the same run are serialized as by the ORM.
+                    list(
+                        ForecastRun.objects.select_for_update().filter(
+                            pk=run.pk
+                        )
+                    )
+                    cursor.execute(merge_sql, [run.pk, run.pk])
+                # Forecasts are counted as by bulk_create of the ORM.
+                inserted = copied
+            else:
+                cursor.execute(merge_sql)
+                inserted = cursor.rowcount
+        except Exception:
+            # Staging table created in a transaction is dropped by rollback.
+            if not connection.in_atomic_block:
+                cursor.execute(f"DROP TABLE IF EXISTS {staging_table}")
+            raise
+        cursor.execute(f"DROP TABLE {staging_table}")
+    return inserted
+
+
+def get_merge_sql(model, fields, staging_table, mode=IMPORT_MODE_INSERT):
+    """
+    Return SQL merging the staging table rows into the model table.
+
+    Upsert takes the last staged row of every natural key, as a row
+    can not be updated twice by the same statement.
+    """
+    quote_name = connection.ops.quote_name
+    table = quote_name(model._meta.db_table)
+    target_columns, source_columns = get_merge_columns(model, fields)
+    if mode != IMPORT_MODE_UPSERT:
+        return (
+            f"INSERT INTO {table} ({target_columns}) "
+            f"SELECT {source_columns} FROM {staging_table} "
+            "ON CONFLICT DO NOTHING"
+        )
+
+    key_fields = [
+        model._meta.get_field(field) for field in get_upsert_key(model)
+    ]
+    key_columns = ", ".join(quote_name(field.column) for field in key_fields)
+    updates = ", ".join(
+        f"{column} = EXCLUDED.{column}"
+        for column in (
+            quote_name(field.column)
+            for field in fields
+            if field not in key_fields
+        )
+    )
+    return (
+        f"INSERT INTO {table} ({target_columns}) "
+        f"SELECT DISTINCT ON ({key_columns}) {source_columns} "
+        f"FROM {staging_table} "
+        f"ORDER BY {key_columns}, staging_row DESC "
+        f"ON CONFLICT ({key_columns}) DO UPDATE SET {updates}"
+    )
+
+
+def get_forecast_merge_sql(staging_table, mode=IMPORT_MODE_INSERT):
+    """
+    Return SQL merging the staged forecasts into the series of the run.
+
+    Targets of the series are expanded, merged with the last staged
+    forecasts of their days and collected back into series. Existing
+    targets are replaced only in the upsert mode, as ``bulk_create``
+    of forecasts does. The run id is passed twice as SQL parameters.
+    """
+    series_table = connection.ops.quote_name(ForecastSeries._meta.db_table)
+    source_order = "ASC" if mode == IMPORT_MODE_UPSERT else "DESC"
+    return f"""
+        WITH staged AS (
+            SELECT DISTINCT ON (store_id, sku_id, date)
+                store_id, sku_id, date, target, 1 AS source
+            FROM {staging_table}
+            ORDER BY store_id, sku_id, date, staging_row DESC
+        ),
+        existing AS (
+            SELECT
+                series.store_id,
+                series.sku_id,
+                series.start_date + (point.ordinality - 1)::integer AS date,
+                point.value::integer AS target,
+                2 AS source
+            FROM {series_table} series
+            CROSS JOIN LATERAL jsonb_array_elements_text(series.targets)
+                WITH ORDINALITY point
+            WHERE series.run_id = %s
+                AND point.value IS NOT NULL
+                AND (series.store_id, series.sku_id) IN (
+                    SELECT store_id, sku_id FROM staged
+                )
+        ),
+        merged AS (
+            SELECT DISTINCT ON (store_id, sku_id, date)
+                store_id, sku_id, date, target
+            FROM (SELECT * FROM staged UNION ALL SELECT * FROM existing) day
+            ORDER BY store_id, sku_id, date, source {source_order}
+        )
+        INSERT INTO {series_table} (run_id, store_id, sku_id, start_date,
+            targets)
+        SELECT
+            %s,
+            bounds.store_id,
+            bounds.sku_id,
+            bounds.start_date,
+            (
+                SELECT jsonb_agg(to_jsonb(merged.target) ORDER BY days.day)
+                FROM generate_series(
+                    bounds.start_date, bounds.end_date, interval '1 day'
+                ) days (day)
+                LEFT JOIN merged
+                    ON merged.store_id = bounds.store_id
+                    AND merged.sku_id = bounds.sku_id
+                    AND merged.date = days.day::date
+            )
+        FROM (
+            SELECT
+                store_id,
+                sku_id,
+                min(date) AS start_date,
+                max(date) AS end_date
+            FROM merged
+            GROUP BY store_id, sku_id
+        ) bounds
+        ON CONFLICT (store_id, sku_id, run_id) DO UPDATE
+        SET start_date = EXCLUDED.start_date, targets = EXCLUDED.targets
+    """
+
+
+def get_merge_columns(model, fields):
+    """Return target and source columns of the staging table merge."""
+    quote_name = connection.ops.quote_name
+    target_columns = [quote_name(field.column) for field in fields]
+    source_columns = list(target_columns)
+
+    for field in model._meta.concrete_fields:
+        if field in fields or field.primary_key:
+            continue
+        if getattr(field, "auto_now", False) or getattr(
+            field, "auto_now_add", False
+        ):
+            target_columns.append(quote_name(field.column))
+            # Every row gets its own timestamp as bulk_create does, so rows
+            # are not merged by unique constraints including the field.
+            source_columns.append("clock_timestamp()")
+    return ", ".join(target_columns), ", ".join(source_columns)
+
+
+def generate_copy_chunks(model, model_mapping, fields, data, reference_cache):
+    """Generate CSV buffers of database ready values and rows counts."""
+    converters = [
+        COPY_CONVERTERS.get(field.get_internal_type(), str) for field in fields
+    ]
+    for batch in tqdm(
+        data,
+        desc=f"Copying {model.__name__} table...",
+        ncols=100,
+        colour="green",
+    ):
+        references = resolve_references(
+            model_mapping,
+            batch,
+            reference_cache,
+        )
+        buffer = StringIO()
+        writer = csv.writer(buffer)
+        rows_copied = 0
+        for row in batch:
+            try:
+                values = [
+                    converter(process_field_data(row, field, data, references))
+                    for converter, (field, data) in zip(
+                        converters,
+                        model_mapping.items(),
+                    )
+                ]
+            except ROW_ERRORS:
+                pass
+            else:
+                writer.writerow(values)
+                rows_copied += 1
+        buffer.seek(0)
+        yield buffer, len(batch), rows_copied
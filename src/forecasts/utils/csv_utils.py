@@ -1,35 +1,192 @@
 import csv
-from io import TextIOWrapper
+import os
+from collections import OrderedDict
+from io import BufferedReader, RawIOBase, TextIOWrapper
 from itertools import islice
 
 from tqdm import tqdm
 
-from forecasts.utils.constants import MODEL_FILE_MAPPING
+from forecasts.utils.compression_utils import open_decompressed
+from forecasts.utils.constants import (
+    IMPORT_MODE_INSERT,
+    IMPORT_MODE_UPSERT,
+    MODEL_FILE_MAPPING,
+    REFERENCE_CACHE_SIZE,
+    UPSERT_KEYS,
+)
 
+# Errors of a single row conversion, such rows are skipped.
+ROW_ERRORS = (ArithmeticError, KeyError, TypeError, ValueError)
 
-def read_csv_file(data_source, batch_size=1000):
-    """Read CSV data from either a file or bytes."""
+
+class ReferenceCache:
+    """Bounded natural key to primary key cache of referenced models."""
+
+    def __init__(self, max_size=REFERENCE_CACHE_SIZE):
+        self.max_size = max_size
+        self._keys = OrderedDict()
+
+    def resolve(self, model, field, values, create=False):
+        """
+        Return natural key to primary key map for the given values.
+
+        Missing rows are created by their natural keys if asked to.
+        """
+        resolved, missing = {}, set()
+        for value in values:
+            key = (model, field, value)
+            if key in self._keys:
+                self._keys.move_to_end(key)
+                if (pk := self._keys[key]) is not None:
+                    resolved[value] = pk
+            else:
+                missing.add(value)
+
+        if missing:
+            if create:
+                # Rows created concurrently are looked up below.
+                model.objects.bulk_create(
+                    [
+                        model(**{field: value})
+                        for value in missing
+                        if value is not None
+                    ],
+                    ignore_conflicts=True,
+                )
+            found = {}
+            for value, pk in model.objects.filter(
+                **{f"{field}__in": missing}
+            ).values_list(field, "pk"):
+                # Ambiguous natural keys are not resolved at all, the same
+                # way a ``get`` lookup would fail for them.
+                found[value] = None if value in found else pk
+            for value in missing:
+                pk = found.get(value, None)
+                self._store((model, field, value), pk)
+                if pk is not None:
+                    resolved[value] = pk
+        return resolved
+
+    def _store(self, key, pk):
+        """Save resolved key evicting the least recently used ones."""
+        self._keys[key] = pk
+        while len(self._keys) > self.max_size:
+            self._keys.popitem(last=False)
+
+
+def read_csv_file(data_source, batch_size=1000, byte_range=None):
+    """
+    Read CSV data from either a file or bytes.
+
+    Gzip and zstd compressed data is decompressed on the fly. When byte
+    range is given only lines starting inside the range of the file
+    are read, the header is always taken from the first line.
+    """
 
     def read_csv_from_io(io_obj):
-        with io_obj as data:
-            csv_reader = csv.DictReader(data)
-            while True:
-                batch = list(islice(csv_reader, batch_size))
-                if not batch:
-                    return
-                yield batch
-
-    if isinstance(data_source, str):
-        with open(data_source, "r") as file:
+        with TextIOWrapper(
+            open_decompressed(io_obj), encoding="utf-8"
+        ) as data:
+            yield from read_batches(csv.DictReader(data), batch_size)
+
+    if byte_range is not None:
+        yield from read_csv_range(data_source, byte_range, batch_size)
+    elif isinstance(data_source, str):
+        with open(data_source, "rb") as file:
             yield from read_csv_from_io(file)
     else:
-        byte_stream = TextIOWrapper(data_source, encoding="utf-8")
-        yield from read_csv_from_io(byte_stream)
+        yield from read_csv_from_io(data_source)
+
+
+def read_csv_range(path, byte_range, batch_size=1000):
+    """Read CSV data lines of the file within the byte range."""
+    fieldnames, stream = open_csv_range(path, byte_range)
+    with TextIOWrapper(stream, encoding="utf-8") as file:
+        csv_reader = csv.DictReader(file, fieldnames=fieldnames)
+        yield from read_batches(csv_reader, batch_size)
+
+
+def open_csv_range(path, byte_range):
+    """Return CSV header fields and binary stream of the byte range lines."""
+    start, end = byte_range
+    file = open(path, "rb")
+    fieldnames = next(csv.reader([file.readline().decode("utf-8")]))
+    file.seek(max(start, file.tell()))
+    return fieldnames, BufferedReader(FileRangeStream(file, end))
+
+
+class FileRangeStream(RawIOBase):
+    """Raw stream of the file contents up to the end offset."""
+
+    def __init__(self, file, end):
+        self.file = file
+        self.end = end
+
+    def readable(self):
+        """Check if the stream is readable."""
+        return True
+
+    def readinto(self, buffer):
+        """Read file bytes into the buffer stopping at the end offset."""
+        size = min(len(buffer), max(self.end - self.file.tell(), 0))
+        data = self.file.read(size)
+        buffer[: len(data)] = data
+        return len(data)
 
+    def close(self):
+        """Close the stream and the underlying file."""
+        self.file.close()
+        super().close()
 
-def import_data(model, data):
-    """Populate the database with related models."""
+
+def split_csv_file(path, chunks):
+    """
+    Split CSV file into byte ranges aligned to line starts.
+
+    Lines are expected to hold whole records, so quoted values
+    must not contain line breaks.
+    """
+    size = os.path.getsize(path)
+    with open(path, "rb") as file:
+        file.readline()
+        offsets = [file.tell()]
+        for chunk in range(1, chunks):
+            file.seek(max(size * chunk // chunks, offsets[-1]))
+            file.readline()
+            offsets.append(file.tell())
+    offsets.append(size)
+    return [
+        (start, end) for start, end in zip(offsets, offsets[1:]) if start < end
+    ]
+
+
+def read_batches(csv_reader, batch_size):
+    """Read CSV rows by batches of the given size."""
+    while True:
+        batch = list(islice(csv_reader, batch_size))
+        if not batch:
+            return
+        yield batch
+
+
+def import_data(
+    model,
+    data,
+    reference_cache=None,
+    progress=None,
+    mode=IMPORT_MODE_INSERT,
+):
+    """
+    Populate the database with related models.
+
+    Progress callback is called after every batch with the number of rows
+    read and rows passed to the database. Returns the total of the latter.
+    """
     model_mapping = MODEL_FILE_MAPPING[model]["mapping"]
+    if reference_cache is None:
+        reference_cache = ReferenceCache()
+    conflict_options = get_conflict_options(model, mode)
+    inserted = 0
 
     for batch in tqdm(
         data,
@@ -37,20 +194,102 @@ def import_data(model, data):
         ncols=100,
         colour="green",
     ):
-        objects = create_objects(model, model_mapping, batch)
-        model.objects.bulk_create(objects, ignore_conflicts=True)
+        objects = create_objects(model, model_mapping, batch, reference_cache)
+        if mode == IMPORT_MODE_UPSERT:
+            objects = deduplicate_objects(model, objects)
+        model.objects.bulk_create(objects, **conflict_options)
+        inserted += len(objects)
+        if progress is not None:
+            progress(len(batch), len(objects))
+    return inserted
+
+
+def get_upsert_key(model):
+    """Return natural key fields of the model rows updated by imports."""
+    try:
+        return UPSERT_KEYS[model]
+    except KeyError:
+        raise ValueError(f"Upsert is not supported for {model.__name__}.")
+
+
+def get_conflict_options(model, mode=IMPORT_MODE_INSERT):
+    """Return ``bulk_create`` options handling conflicts in the mode."""
+    if mode != IMPORT_MODE_UPSERT:
+        return {"ignore_conflicts": True}
+    unique_fields = get_upsert_key(model)
+    return {
+        "update_conflicts": True,
+        "unique_fields": unique_fields,
+        "update_fields": [
+            field.name
+            for field in model._meta.concrete_fields
+            if not field.primary_key and field.name not in unique_fields
+        ],
+    }
+
+
+def deduplicate_objects(model, objects):
+    """
+    Keep only the last of the objects with the same natural key.
+
+    A row can not be updated twice by the same upsert statement.
+    """
+    fields = [model._meta.get_field(field) for field in get_upsert_key(model)]
+    unique_objects = {}
+    for obj in objects:
+        key = tuple(
+            field.to_python(getattr(obj, field.attname)) for field in fields
+        )
+        unique_objects.pop(key, None)
+        unique_objects[key] = obj
+    return list(unique_objects.values())
+
+
+def resolve_references(model_mapping, batch, reference_cache):
+    """Resolve natural keys of all referenced models used in the batch."""
+    references = {}
+    for field, data in model_mapping.items():
+        if data.get("reference", None):
+            references[field] = resolve_reference(
+                reference_cache,
+                field,
+                data,
+                {row.get(data["csv_name"], None) for row in batch},
+            )
+    return references
+
+
+def resolve_reference(reference_cache, field, data, values):
+    """Resolve natural keys of the reference field mapping values."""
+    return reference_cache.resolve(
+        data["reference"],
+        data.get("reference_field", field),
+        values,
+        create=data.get("create", False),
+    )
 
 
-def create_objects(model, model_mapping, batch):
+def create_objects(model, model_mapping, batch, reference_cache=None):
     """Create database objects from batch data."""
+    if reference_cache is None:
+        reference_cache = ReferenceCache()
+    references = resolve_references(model_mapping, batch, reference_cache)
+    attnames = {
+        field: model._meta.get_field(field).attname for field in model_mapping
+    }
     objects = []
 
     for row in batch:
         object_data = {}
         try:
             for field, data in model_mapping.items():
-                object_data[field] = process_field_data(row, field, data)
-        except Exception:
+                object_data[attnames[field]] = process_field_data(
+                    row,
+                    field,
+                    data,
+                    references,
+                )
+        except ROW_ERRORS:
             pass
         else:
             if all(object_data.keys()):
@@ -58,12 +297,12 @@ def create_objects(model, model_mapping, batch):
     return objects
 
 
-def process_field_data(row, field, data):
+def process_field_data(row, field, data, references):
     """Process field data based on mapping information."""
     field_value = row.get(data["csv_name"], None)
 
-    if referenced_model := data.get("reference", None):
-        return referenced_model.objects.get(**{field: field_value})
+    if data.get("reference", None):
+        return references[field][field_value]
     elif field_type := data.get("type", None):
         return field_type(field_value)
     else:
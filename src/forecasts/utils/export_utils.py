@@ -0,0 +1,80 @@
+import csv
+import json
+from datetime import datetime
+from io import StringIO
+
+from django.core.serializers.json import DjangoJSONEncoder
+
+from forecasts.utils.constants import (
+    EXPORT_CHUNK_SIZE,
+    EXPORT_FORMAT_CSV,
+    MODEL_FILE_MAPPING,
+)
+
+
+def get_export_columns(model):
+    """Return CSV names and value lookups of the model file columns."""
+    columns = {}
+    for field, data in MODEL_FILE_MAPPING[model]["mapping"].items():
+        lookup = field
+        if data.get("reference", None):
+            lookup = f"{field}__{data.get('reference_field', field)}"
+        columns[data["csv_name"]] = lookup
+    return columns
+
+
+def format_csv_value(value):
+    """Return value written to CSV files readable by the importer."""
+    if isinstance(value, bool):
+        return int(value)
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return value
+
+
+def iterate_export_rows(model, queryset, chunk_size=EXPORT_CHUNK_SIZE):
+    """Iterate chunks of the queryset rows as values of the file columns."""
+    columns = get_export_columns(model)
+    rows = queryset.values_list(*columns.values()).iterator(
+        chunk_size=chunk_size
+    )
+    chunk = []
+    for row in rows:
+        chunk.append(row)
+        if len(chunk) == chunk_size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def stream_csv(model, queryset, chunk_size=EXPORT_CHUNK_SIZE):
+    """Stream CSV lines of the queryset in the model file layout."""
+    buffer = StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(get_export_columns(model))
+    yield buffer.getvalue()
+    for chunk in iterate_export_rows(model, queryset, chunk_size):
+        buffer.seek(0)
+        buffer.truncate()
+        writer.writerows(
+            [format_csv_value(value) for value in row] for row in chunk
+        )
+        yield buffer.getvalue()
+
+
+def stream_ndjson(model, queryset, chunk_size=EXPORT_CHUNK_SIZE):
+    """Stream JSON lines of the queryset rows keyed by the file columns."""
+    names = list(get_export_columns(model))
+    for chunk in iterate_export_rows(model, queryset, chunk_size):
+        yield "".join(
+            json.dumps(dict(zip(names, row)), cls=DjangoJSONEncoder) + "\n"
+            for row in chunk
+        )
+
+
+def stream_export(model, queryset, export_format=EXPORT_FORMAT_CSV):
+    """Stream the queryset rows in the export format."""
+    if export_format == EXPORT_FORMAT_CSV:
+        return stream_csv(model, queryset)
+    return stream_ndjson(model, queryset)
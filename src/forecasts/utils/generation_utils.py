@@ -0,0 +1,156 @@
+import hashlib
+
+import numpy as np
+import pandas as pd
+
+from forecasts.models import SKU
+from forecasts.utils.constants import COLUMNAR_BATCH_SIZE
+
+
+def make_ids(prefix, count):
+    """Return hash identifiers as used in the source data."""
+    return np.array(
+        [
+            hashlib.md5(f"{prefix}-{index}".encode()).hexdigest()
+            for index in range(count)
+        ],
+        dtype=object,
+    )
+
+
+class DatasetGenerator:
+    """Generator of data frames in the layout of the source CSV files."""
+
+    def __init__(
+        self,
+        stores,
+        skus,
+        start_date,
+        days,
+        groups=10,
+        forecast_days=14,
+        assortment=0.3,
+        sale_rate=0.4,
+        promo_rate=0.1,
+        batch_size=COLUMNAR_BATCH_SIZE,
+        seed=0,
+    ):
+        self.stores = stores
+        self.skus = skus
+        self.start_date = pd.Timestamp(start_date)
+        self.days = days
+        self.groups = groups
+        self.forecast_days = forecast_days
+        self.assortment = assortment
+        self.sale_rate = sale_rate
+        self.promo_rate = promo_rate
+        self.batch_size = batch_size
+        self.seed = seed
+        self.random = np.random.default_rng(seed)
+        self.store_ids = make_ids("store", stores)
+        self.sku_ids = make_ids("sku", skus)
+        # Average daily units and unit price of every SKU.
+        self.sku_demand = self.random.gamma(1.5, 2.0, skus) + 0.5
+        self.sku_price = np.round(self.random.lognormal(4.5, 0.8, skus), 2)
+
+    def generate_stores(self):
+        """Generate stores data frames."""
+        count = self.stores
+        yield pd.DataFrame(
+            {
+                "st_id": self.store_ids,
+                "st_city_id": make_ids("city", max(count // 5, 1))[
+                    self.random.integers(0, max(count // 5, 1), count)
+                ],
+                "st_division_code": make_ids("division", 6)[
+                    self.random.integers(0, 6, count)
+                ],
+                "st_type_format_id": self.random.integers(1, 5, count),
+                "st_type_loc_id": self.random.integers(1, 4, count),
+                "st_type_size_id": self.random.integers(1, 33, count),
+                "st_is_active": (self.random.random(count) < 0.9).astype(int),
+            }
+        )
+
+    def generate_skus(self):
+        """Generate SKUs data frames with the group hierarchy."""
+        count = self.skus
+        groups = self.groups
+        categories = groups * 5
+        subcategories = categories * 4
+        subcategory = self.random.integers(0, subcategories, count)
+        category = subcategory // 4
+        yield pd.DataFrame(
+            {
+                "pr_group_id": make_ids("group", groups)[category // 5],
+                "pr_cat_id": make_ids("category", categories)[category],
+                "pr_subcat_id": make_ids("subcategory", subcategories)[
+                    subcategory
+                ],
+                "pr_sku_id": self.sku_ids,
+                "pr_uom_id": self.random.choice(SKU.UOMChoices.values, count),
+            }
+        )
+
+    def get_assortment(self, store):
+        """Return indexes of SKUs sold in the store."""
+        random = np.random.default_rng((self.seed, store))
+        size = max(int(self.skus * self.assortment), 1)
+        return np.sort(random.choice(self.skus, size, replace=False))
+
+    def generate_sales(self):
+        """Generate daily sales data frames store by store."""
+        dates = pd.date_range(self.start_date, periods=self.days)
+        for store in range(self.stores):
+            skus = self.get_assortment(store)
+            sold = self.random.random((len(skus), len(dates)))
+            sku_index, date_index = np.nonzero(sold < self.sale_rate)
+            sku_index = skus[sku_index]
+            count = len(sku_index)
+
+            promo = self.random.random(count) < self.promo_rate
+            demand = self.sku_demand[sku_index] * np.where(promo, 2.0, 1.0)
+            units = self.random.poisson(demand) + 1
+            price = self.sku_price[sku_index] * np.where(promo, 0.8, 1.0)
+            rub = np.round(units * price, 2)
+            frame = pd.DataFrame(
+                {
+                    "st_id": self.store_ids[store],
+                    "pr_sku_id": self.sku_ids[sku_index],
+                    "date": dates[date_index],
+                    "pr_sales_type_id": promo.astype(int),
+                    "pr_sales_in_units": units.astype(float),
+                    "pr_promo_sales_in_units": np.where(promo, units, 0.0),
+                    "pr_sales_in_rub": rub,
+                    "pr_promo_sales_in_rub": np.where(promo, rub, 0.0),
+                }
+            )
+            yield from split_frame(frame, self.batch_size)
+
+    def generate_forecasts(self):
+        """Generate forecasts data frames for days after the sales."""
+        dates = pd.date_range(
+            self.start_date + pd.Timedelta(days=self.days),
+            periods=self.forecast_days,
+        )
+        for store in range(self.stores):
+            assortment = self.get_assortment(store)
+            skus = np.repeat(assortment, len(dates))
+            frame = pd.DataFrame(
+                {
+                    "st_id": self.store_ids[store],
+                    "pr_sku_id": self.sku_ids[skus],
+                    "date": np.tile(dates, len(assortment)),
+                    "target": self.random.poisson(
+                        self.sku_demand[skus] * self.sale_rate
+                    ),
+                }
+            )
+            yield from split_frame(frame, self.batch_size)
+
+
+def split_frame(frame, batch_size):
+    """Split data frame into frames of the batch size."""
+    for start in range(0, len(frame), batch_size):
+        end = start + batch_size
+        yield frame.iloc[start:end]
@@ -0,0 +1,85 @@
+from forecasts.models import Forecast, ForecastRun, Sale
+from forecasts.utils.arrow_utils import get_arrow_format, read_arrow_frames
+from forecasts.utils.columnar_utils import (
+    columnar_import_data,
+    get_csv_dtypes,
+    read_csv_frames,
+)
+from forecasts.utils.constants import (
+    COPY_BATCH_SIZE,
+    IMPORT_ENGINE_COLUMNAR,
+    IMPORT_ENGINE_COPY,
+    IMPORT_ENGINE_ORM,
+    IMPORT_MODE_INSERT,
+)
+from forecasts.utils.copy_utils import copy_import_data, supports_copy
+from forecasts.utils.csv_utils import import_data, read_csv_file
+from forecasts.utils.partition_utils import ensure_sale_partitions
+
+
+def run_import(
+    model,
+    data_source,
+    engine=IMPORT_ENGINE_ORM,
+    byte_range=None,
+    progress=None,
+    mode=IMPORT_MODE_INSERT,
+):
+    """
+    Import model data from the CSV source with the chosen engine.
+
+    Models not supported by COPY are always loaded with the ORM,
+    the columnar engine converts data frames and loads them with COPY
+    when possible. Parquet and Arrow IPC sources are always loaded
+    by the columnar engine. Rows with existing natural keys are updated
+    in the upsert mode. Returns the number of rows written.
+    """
+    inserted = import_model_data(
+        model, data_source, engine, byte_range, progress, mode
+    )
+    if model is Sale:
+        # Rows of months without partitions are moved out of the default.
+        ensure_sale_partitions()
+    if model is Forecast and byte_range is None:
+        # Chunks of a file are published after all of them are imported.
+        ForecastRun.objects.publish_open()
+    return inserted
+
+
+def import_model_data(model, data_source, engine, byte_range, progress, mode):
+    """Import model data from the source with the chosen engine."""
+    if byte_range is None and (arrow_format := get_arrow_format(data_source)):
+        return columnar_import_data(
+            model,
+            read_arrow_frames(model, data_source, arrow_format),
+            progress=progress,
+            mode=mode,
+        )
+    if engine == IMPORT_ENGINE_COLUMNAR:
+        return columnar_import_data(
+            model,
+            read_csv_frames(
+                data_source,
+                byte_range=byte_range,
+                dtype=get_csv_dtypes(model),
+            ),
+            progress=progress,
+            mode=mode,
+        )
+    if engine == IMPORT_ENGINE_COPY and supports_copy(model):
+        return copy_import_data(
+            model,
+            read_csv_file(
+                data_source,
+                batch_size=COPY_BATCH_SIZE,
+                byte_range=byte_range,
+            ),
+            progress=progress,
+            mode=mode,
+        )
+    return import_data(
+        model,
+        read_csv_file(data_source, byte_range=byte_range),
+        progress=progress,
+        mode=mode,
+    )
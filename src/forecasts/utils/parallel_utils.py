@@ -0,0 +1,127 @@
+import math
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import django
+from django.apps import apps
+from django.db import connections
+
+from forecasts.models import Forecast, ForecastRun
+from forecasts.utils.arrow_utils import get_arrow_format
+from forecasts.utils.compression_utils import find_data_file, is_compressed
+from forecasts.utils.constants import PARALLEL_MIN_CHUNK_SIZE
+from forecasts.utils.csv_utils import split_csv_file
+from forecasts.utils.import_utils import run_import
+
+
+def get_import_stages(model_file_mapping):
+    """
+    Group models into import stages.
+
+    Every model is placed into a stage after all models it references,
+    models of the same stage do not depend on each other. References
+    created by imports themselves are not imported in stages.
+    """
+    dependencies = {
+        model: {
+            data["reference"]
+            for data in model_data["mapping"].values()
+            if "reference" in data and not data.get("create", False)
+        }
+        for model, model_data in model_file_mapping.items()
+    }
+    stages, imported = [], set()
+
+    while dependencies:
+        stage = [
+            model
+            for model, references in dependencies.items()
+            if references <= imported
+        ]
+        if not stage:
+            raise ValueError(
+                "Models references can not be resolved: "
+                f"{', '.join(model.__name__ for model in dependencies)}"
+            )
+        for model in stage:
+            del dependencies[model]
+        imported.update(stage)
+        stages.append(stage)
+    return stages
+
+
+def get_file_chunks(path, workers):
+    """
+    Split file into as many chunks as workers may load in parallel.
+
+    Compressed and Arrow files can not be split by lines, so they
+    are loaded as a whole.
+    """
+    if is_compressed(path) or get_arrow_format(path):
+        return [None]
+    chunks = min(
+        workers,
+        math.ceil(os.path.getsize(path) / PARALLEL_MIN_CHUNK_SIZE),
+    )
+    return split_csv_file(path, max(chunks, 1))
+
+
+def setup_worker():
+    """Prepare worker process to open its own database connections."""
+    django.setup()
+    connections.close_all()
+
+
+def import_chunk(model_label, path, byte_range, engine):
+    """Import chunk of the CSV file in the worker process."""
+    run_import(apps.get_model(model_label), path, engine, byte_range)
+
+
+def parallel_import(model_file_mapping, workers, engine):
+    """
+    Import CSV files of the models with the pool of worker processes.
+
+    Models are loaded stage by stage, so stage is started only when
+    all chunks of the previous stage are committed. Forecast chunks are
+    imported into the same open run published after all of them are
+    committed. Generates model and import error, if any, of every model
+    after its stage is finished.
+    """
+    # Forked workers must not share connections of the parent process.
+    connections.close_all()
+
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=setup_worker,
+    ) as executor:
+        for stage in get_import_stages(model_file_mapping):
+            futures, errors = {}, {}
+            if Forecast in stage:
+                # Chunks add their series to the run opened once for all.
+                ForecastRun.objects.get_open()
+                connections.close_all()
+            for model in stage:
+                path = find_data_file(model_file_mapping[model]["path"])
+                try:
+                    byte_ranges = get_file_chunks(path, workers)
+                except OSError as error:
+                    errors[model] = error
+                    continue
+                for byte_range in byte_ranges:
+                    future = executor.submit(
+                        import_chunk,
+                        model._meta.label,
+                        path,
+                        byte_range,
+                        engine,
+                    )
+                    futures[future] = model
+
+            for future in as_completed(futures):
+                if error := future.exception():
+                    errors.setdefault(futures[future], error)
+            if Forecast in stage and Forecast not in errors:
+                ForecastRun.objects.publish_open()
+                connections.close_all()
+            for model in stage:
+                yield model, errors.get(model, None)
@@ -0,0 +1,200 @@
+from datetime import datetime, timedelta, timezone
+
+from django.db import connection, transaction
+from django.db.models import F, OuterRef, Subquery, Sum
+from django.db.models.functions import TruncDate
+
+from forecasts.models import GroupSaleWeekly, Sale, SaleDaily, StoreAssortment
+from forecasts.utils.constants import SALE_PARTITIONS_AHEAD, SALE_ROLLUP_TOTALS
+
+SALE_TABLE = Sale._meta.db_table
+SALE_DEFAULT_PARTITION = f"{SALE_TABLE}_default"
+SALE_PARTITION_FORMAT = f"{SALE_TABLE}_p%Y_%m"
+SALE_PARTITION_LOCK = "forecasts_sale_partitions"
+
+
+def get_month(value):
+    """Return UTC start of the month of the date or datetime."""
+    return datetime(value.year, value.month, 1, tzinfo=timezone.utc)
+
+
+def add_months(month, count):
+    """Return start of the month shifted by the number of months."""
+    years, month_index = divmod(month.month - 1 + count, 12)
+    return month.replace(year=month.year + years, month=month_index + 1)
+
+
+def get_partition_name(month):
+    """Return name of the sales partition of the month."""
+    return month.strftime(SALE_PARTITION_FORMAT)
+
+
+def is_sale_partitioned():
+    """Check if the sales table is partitioned by months."""
+    if connection.vendor != "postgresql":
+        return False
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT 1 FROM pg_partitioned_table "
+            "WHERE partrelid = to_regclass(%s)",
+            [SALE_TABLE],
+        )
+        return cursor.fetchone() is not None
+
+
+def get_sale_partitions(cursor):
+    """Return months of the existing sales partitions."""
+    cursor.execute(
+        "SELECT child.relname FROM pg_inherits "
+        "JOIN pg_class child ON child.oid = pg_inherits.inhrelid "
+        "WHERE pg_inherits.inhparent = %s::regclass",
+        [SALE_TABLE],
+    )
+    months = set()
+    for (name,) in cursor.fetchall():
+        if name != SALE_DEFAULT_PARTITION:
+            month = datetime.strptime(name, SALE_PARTITION_FORMAT)
+            months.add(month.replace(tzinfo=timezone.utc))
+    return months
+
+
+def create_sale_partition(cursor, month):
+    """
+    Create sales partition of the month.
+
+    Rows of the month are moved out of the default partition before
+    the new partition is attached, as attaching fails otherwise.
+    """
+    quote_name = connection.ops.quote_name
+    table = quote_name(SALE_TABLE)
+    default = quote_name(SALE_DEFAULT_PARTITION)
+    partition = quote_name(get_partition_name(month))
+    bounds = [month, add_months(month, 1)]
+
+    cursor.execute(
+        f"CREATE TABLE {partition} (LIKE {table} INCLUDING DEFAULTS)"
+    )
+    cursor.execute(
+        f"WITH moved AS (DELETE FROM {default} "
+        "WHERE date >= %s AND date < %s RETURNING *) "
+        f"INSERT INTO {partition} SELECT * FROM moved",
+        bounds,
+    )
+    cursor.execute(
+        f"ALTER TABLE {table} ATTACH PARTITION {partition} "
+        "FOR VALUES FROM (%s) TO (%s)",
+        bounds,
+    )
+
+
+def ensure_sale_partitions(months=(), months_ahead=SALE_PARTITIONS_AHEAD):
+    """
+    Create missing sales partitions, return months of created ones.
+
+    Partitions are created for the given months, for the current and
+    following months and for months of rows in the default partition.
+    """
+    if not is_sale_partitioned():
+        return []
+    current_month = get_month(datetime.now(timezone.utc))
+    required = {get_month(month) for month in months}
+    required.update(
+        add_months(current_month, count) for count in range(months_ahead + 1)
+    )
+
+    with transaction.atomic(), connection.cursor() as cursor:
+        # Concurrent imports must not create the same partition.
+        cursor.execute(
+            "SELECT pg_advisory_xact_lock(hashtext(%s))",
+            [SALE_PARTITION_LOCK],
+        )
+        cursor.execute(
+            "SELECT DISTINCT date_trunc('month', date AT TIME ZONE 'UTC') "
+            f"FROM {connection.ops.quote_name(SALE_DEFAULT_PARTITION)}"
+        )
+        required.update(get_month(month) for (month,) in cursor.fetchall())
+        created = sorted(required - get_sale_partitions(cursor))
+        for month in created:
+            create_sale_partition(cursor, month)
+    return created
+
+
+def prune_sale_rollups(before):
+    """
+    Delete sales rollups of days before the given date.
+
+    Weekly totals of the week of the date are recounted from days kept.
+    """
+    day = before.date()
+    week = day - timedelta(days=day.weekday())
+    SaleDaily.objects.filter(date__lt=day).delete()
+    GroupSaleWeekly.objects.filter(week__lte=week).delete()
+    totals = (
+        SaleDaily.objects.filter(
+            date__gte=week, date__lt=week + timedelta(days=7)
+        )
+        .order_by()
+        .values("store_id", sku_group_id=F("sku__group_id"))
+        .annotate(**{f"sum_{name}": Sum(name) for name in SALE_ROLLUP_TOTALS})
+    )
+    GroupSaleWeekly.objects.bulk_create(
+        GroupSaleWeekly(
+            store_id=row["store_id"],
+            group_id=row["sku_group_id"],
+            week=week,
+            **{name: row[f"sum_{name}"] for name in SALE_ROLLUP_TOTALS},
+        )
+        for row in totals
+    )
+
+
+def prune_store_assortment(before):
+    """
+    Delete store SKUs not sold since the given date.
+
+    First sales of the store SKUs kept are recounted from sales left.
+    """
+    day = before.date()
+    StoreAssortment.objects.filter(last_sale__lt=day).delete()
+    StoreAssortment.objects.filter(first_sale__lt=day).update(
+        first_sale=Subquery(
+            Sale.objects.filter(
+                store_id=OuterRef("store_id"), sku_id=OuterRef("sku_id")
+            )
+            .order_by("date")
+            .values(day=TruncDate("date", tzinfo=timezone.utc))[:1]
+        )
+    )
+
+
+def drop_sale_partitions(before):
+    """
+    Drop sales partitions of months before the given date.
+
+    Returns months of dropped partitions, rows of the default partition,
+    sales rollups and assortment before the date are deleted as well.
+    """
+    if not is_sale_partitioned():
+        return []
+    quote_name = connection.ops.quote_name
+    default = quote_name(SALE_DEFAULT_PARTITION)
+    before = get_month(before)
+
+    with transaction.atomic(), connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT pg_advisory_xact_lock(hashtext(%s))",
+            [SALE_PARTITION_LOCK],
+        )
+        # Tables with pending deferred foreign key checks can not be dropped.
+        cursor.execute("SET CONSTRAINTS ALL IMMEDIATE")
+        dropped = sorted(
+            month for month in get_sale_partitions(cursor) if month < before
+        )
+        for month in dropped:
+            cursor.execute(
+                f"DROP TABLE {quote_name(get_partition_name(month))}"
+            )
+        cursor.execute(f"DELETE FROM {default} WHERE date < %s", [before])
+        prune_sale_rollups(before)
+        prune_store_assortment(before)
+    return dropped
@@ -0,0 +1,196 @@
+import logging
+import os
+import threading
+from collections import deque
+from time import monotonic
+
+from django.db import OperationalError
+
+logger = logging.getLogger(__name__)
+
+POOL_MAX_SIZE = 4
+POOL_TIMEOUT = 10
+# Connections idle for longer are checked before checkout.
+POOL_CHECK_AFTER = 30
+POOL_MAX_LIFETIME = 3600
+# Metrics of pools are logged after the number of checkouts.
+POOL_STATS_INTERVAL = 1000
+
+# Pools of the processes, pools inherited by forked processes are kept
+# referenced, so their connections are never closed by the children.
+_pools = {}
+_pools_lock = threading.Lock()
+
+
+class ConnectionPool:
+    """
+    Process local pool of database connections.
+
+    Connections are created when there are no idle ones and the pool
+    is not full, otherwise checkouts wait for returns.
+    """
+
+    def __init__(
+        self,
+        max_size=POOL_MAX_SIZE,
+        timeout=POOL_TIMEOUT,
+        check_after=POOL_CHECK_AFTER,
+        max_lifetime=POOL_MAX_LIFETIME,
+    ):
+        self.max_size = max_size
+        self.timeout = timeout
+        self.check_after = check_after
+        self.max_lifetime = max_lifetime
+        self.pid = os.getpid()
+        self._idle = deque()
+        self._created = {}
+        self._size = 0
+        self._condition = threading.Condition()
+        self._stats = {
+            "checkouts": 0,
+            "connects": 0,
+            "discards": 0,
+            "waits": 0,
+            "wait_time": 0.0,
+            "max_wait_time": 0.0,
+            "timeouts": 0,
+        }
+
+    def checkout(self, connect, is_usable):
+        """
+        Return idle or new connection waiting for returns if full.
+
+        New connections are created by the connect function, connections
+        idle for a while are checked with the usability check function,
+        unusable and expired ones are replaced.
+        """
+        start = monotonic()
+        while True:
+            idle = self._take(start)
+            if idle is None:
+                connection = self._create(connect)
+                break
+            connection, returned_at = idle
+            if self._is_healthy(connection, returned_at, is_usable):
+                break
+            self.discard(connection)
+
+        wait_time = monotonic() - start
+        with self._condition:
+            self._stats["checkouts"] += 1
+            self._stats["wait_time"] += wait_time
+            self._stats["max_wait_time"] = max(
+                self._stats["max_wait_time"], wait_time
+            )
+            checkouts = self._stats["checkouts"]
+        logger.debug("Connection checked out in %.3f s.", wait_time)
+        if checkouts % POOL_STATS_INTERVAL == 0:
+            logger.info("Connection pool of %d: %s", self.pid, self.stats())
+        return connection
+
+    def checkin(self, connection):
+        """Return connection to the idle ones."""
+        with self._condition:
+            self._idle.append((connection, monotonic()))
+            self._condition.notify()
+
+    def discard(self, connection):
+        """Close connection freeing its place in the pool."""
+        with self._condition:
+            self._created.pop(id(connection), None)
+            self._size -= 1
+            self._stats["discards"] += 1
+            self._condition.notify()
+        try:
+            connection.close()
+        except Exception:
+            logger.warning("Discarded connection is not closed.")
+
+    def close(self):
+        """Close idle connections of the pool."""
+        with self._condition:
+            idle = [connection for connection, _ in self._idle]
+            self._idle.clear()
+        for connection in idle:
+            self.discard(connection)
+
+    def stats(self):
+        """Return checkout metrics and sizes of the pool."""
+        with self._condition:
+            return {
+                **self._stats,
+                "size": self._size,
+                "idle": len(self._idle),
+                "max_size": self.max_size,
+            }
+
+    def _take(self, start):
+        """Take the last idle connection or reserve place for a new one."""
+        with self._condition:
+            waited = False
+            while not self._idle and self._size >= self.max_size:
+                remaining = start + self.timeout - monotonic()
+                if not waited:
+                    self._stats["waits"] += 1
+                    waited = True
+                if remaining <= 0 or not self._condition.wait(remaining):
+                    self._stats["timeouts"] += 1
+                    raise OperationalError(
+                        "Timed out waiting for a pooled connection."
+                    )
+            if self._idle:
+                return self._idle.pop()
+            self._size += 1
+            return None
+
+    def _create(self, connect):
+        """Create connection in the reserved place of the pool."""
+        try:
+            connection = connect()
+        except Exception:
+            with self._condition:
+                self._size -= 1
+                self._condition.notify()
+            raise
+        with self._condition:
+            self._created[id(connection)] = monotonic()
+            self._stats["connects"] += 1
+        return connection
+
+    def _is_healthy(self, connection, returned_at, is_usable):
+        """Check if idle connection is not expired and usable."""
+        now = monotonic()
+        if now - self._created[id(connection)] > self.max_lifetime:
+            return False
+        return now - returned_at <= self.check_after or is_usable(connection)
+
+
+def get_pool(key, **options):
+    """Return pool of the current process by the key, create if missing."""
+    key = (os.getpid(), key)
+    with _pools_lock:
+        if key not in _pools:
+            _pools[key] = ConnectionPool(**options)
+        return _pools[key]
+
+
+def close_pools():
+    """Close idle connections of the current process pools."""
+    pid = os.getpid()
+    with _pools_lock:
+        pools = [
+            pool for (pool_pid, _), pool in _pools.items() if pool_pid == pid
+        ]
+    for pool in pools:
+        pool.close()
+
+
+def get_pools_stats():
+    """Return metrics of the current process pools by their keys."""
+    pid = os.getpid()
+    with _pools_lock:
+        return {
+            key: pool.stats()
+            for (pool_pid, key), pool in _pools.items()
+            if pool_pid == pid
+        }
@@ -0,0 +1,110 @@
+import random
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from django.conf import settings
+from django.db import DEFAULT_DB_ALIAS, connections
+from django.http import FileResponse
+
+SAFE_METHODS = ("GET", "HEAD", "OPTIONS")
+
+# Clients are pinned to the primary by the cookie after their writes.
+REPLICA_PIN_COOKIE = "primary_pinned"
+
+# Progress of jobs is polled right after workers write it.
+PRIMARY_MODELS = {
+    "forecasts.asyncfileresults",
+    "forecasts.importjob",
+    "forecasts.uploadsession",
+}
+
+# Replica of the context reads, true until it is chosen by the first read.
+_replica_reads = ContextVar("replica_reads", default=False)
+
+
+@contextmanager
+def read_from_replicas(enabled=True):
+    """Route reads of the context to the replica databases if enabled."""
+    token = _replica_reads.set(enabled)
+    try:
+        yield
+    finally:
+        _replica_reads.reset(token)
+
+
+def iterate_from_replicas(content, enabled=True):
+    """Iterate content of streaming responses reading from the replicas."""
+    with read_from_replicas(enabled):
+        yield from content
+
+
+class ReplicaRouter:
+    """
+    Database router reading from replicas in the replica reads context.
+
+    Reads outside of the context, of the job models or within
+    transactions of the primary go to the primary as well as all writes.
+    All reads of a context go to the same replica, so they see the same
+    replication lag.
+    """
+
+    def db_for_read(self, model, **hints):
+        """Return replica of the context for reads in the context."""
+        replica = _replica_reads.get()
+        if not replica or not settings.REPLICA_DATABASES:
+            return DEFAULT_DB_ALIAS
+        if model._meta.label_lower in PRIMARY_MODELS:
+            return DEFAULT_DB_ALIAS
+        if connections[DEFAULT_DB_ALIAS].in_atomic_block:
+            return DEFAULT_DB_ALIAS
+        if replica is True:
+            replica = random.choice(settings.REPLICA_DATABASES)
+            _replica_reads.set(replica)
+        return replica
+
+    def db_for_write(self, model, **hints):
+        """Return the primary for writes of objects read from replicas."""
+        return DEFAULT_DB_ALIAS
+
+    def allow_relation(self, obj1, obj2, **hints):
+        """Allow relations of objects read from the primary and replicas."""
+        return True
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints):
+        """Migrate the primary only, replicas follow it."""
+        return db not in settings.REPLICA_DATABASES
+
+
+class ReplicaMiddleware:
+    """
+    Read from replicas in safe requests of clients not pinned to the primary.
+
+    Clients writing with unsafe requests are pinned to the primary
+    for a while to read their writes.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        """Handle the request routing its reads."""
+        safe = request.method in SAFE_METHODS
+        pinned = REPLICA_PIN_COOKIE in request.COOKIES
+        replicas = safe and not pinned and bool(settings.REPLICA_DATABASES)
+        with read_from_replicas(replicas):
+            response = self.get_response(request)
+
+        # Contents of streamed queries are read after the view returns.
+        streamed = response.streaming and not response.is_async
+        if replicas and streamed and not isinstance(response, FileResponse):
+            response.streaming_content = iterate_from_replicas(
+                response.streaming_content
+            )
+        if settings.REPLICA_DATABASES and not safe:
+            response.set_cookie(
+                REPLICA_PIN_COOKIE,
+                "1",
+                max_age=settings.REPLICA_PIN_SECONDS,
+                httponly=True,
+            )
+        return response
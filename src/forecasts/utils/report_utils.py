@@ -4,13 +4,44 @@ from io import BytesIO
 
 import pandas as pd
 from django.core.files.base import ContentFile
-from django.db import transaction
+from django.db import connections, transaction
+from django.db.models import Sum
 from rest_framework import status
 
 from api.v1 import filters
 from forecasts import models
 from forecasts.errors import ReportGenerationError
 from forecasts.models import AsyncFileResults
+from forecasts.utils.constants import SALE_ROLLUP_TOTALS
+
+# Prices of sales without units are their whole sums.
+STATISTICS_SQL = """
+SELECT
+    totals.*,
+    totals.sales_units - totals.target AS quantity_difference,
+    (totals.sales_units - totals.target) * totals.price
+        AS amount_difference,
+    CAST(totals.sales_units - totals.target AS DOUBLE PRECISION)
+        / NULLIF(totals.sales_units, 0) AS "WAPE"
+FROM (
+    SELECT
+        forecasts.store_id,
+        forecasts.sku_id,
+        forecasts.target_sum AS target,
+        sales.sales_units_sum AS sales_units,
+        sales.sales_units_promo_sum AS sales_units_promo,
+        sales.sales_rub_sum AS sales_rub,
+        sales.sales_rub_promo_sum AS sales_rub_promo,
+        CAST(sales.sales_rub_sum AS DOUBLE PRECISION) / CASE
+            WHEN sales.sales_units_sum = 0 THEN 1
+            ELSE sales.sales_units_sum
+        END AS price
+    FROM ({forecasts}) forecasts
+    JOIN ({sales}) sales
+    ON sales.store_id = forecasts.store_id AND sales.sku_id = forecasts.sku_id
+) totals
+ORDER BY totals.store_id, totals.sku_id
+"""
 
 
 def generate_forecast_report(validated_data):
@@ -60,9 +91,15 @@ def get_statistics_data(request):
         request.GET,
         models.Forecast.objects.all(),
     ).qs
-    sales_queryset = filters.SaleFilter(
-        request.GET, models.Sale.objects.all()
-    ).qs
+    sales_filter = filters.SaleDailyFilter(
+        request.GET, models.SaleDaily.objects.all()
+    )
+    if not sales_filter.is_valid():
+        raise ReportGenerationError(
+            sales_filter.errors.as_text(),
+            status_code=status.HTTP_400_BAD_REQUEST,
+        )
+    sales_queryset = sales_filter.qs
 
     if not forecasts_queryset.exists():
         raise ReportGenerationError(
@@ -83,55 +120,43 @@ def get_statistics_data(request):
 
 
 def clear_statistic_data(forecasts_queryset, sales_queryset):
-    """Clear statistics data."""
-    forecasts_df = (
-        get_dataframe(forecasts_queryset)
-        .groupby(
-            ["store_id", "sku_id"],
-            as_index=False,
-        )["target"]
-        .sum()
+    """
+    Return statistics of forecasts and sales totals by store SKUs.
+
+    Totals and their differences are computed by the database, only
+    the rows of store SKUs having both forecasts and sales are read.
+    """
+    forecasts_sql, forecasts_params = get_totals_sql(
+        forecasts_queryset, ("target",)
     )
-
-    sales_df = (
-        get_dataframe(sales_queryset)
-        .groupby(["store_id", "sku_id"], as_index=False)
-        .agg(
-            {
-                "sales_units": "sum",
-                "sales_units_promo": "sum",
-                "sales_rub": "sum",
-                "sales_rub_promo": "sum",
-            }
-        )
+    sales_sql, sales_params = get_totals_sql(
+        sales_queryset, SALE_ROLLUP_TOTALS
     )
+    connection = connections[forecasts_queryset.db]
+    with connection.cursor() as cursor:
+        cursor.execute(
+            STATISTICS_SQL.format(forecasts=forecasts_sql, sales=sales_sql),
+            forecasts_params + sales_params,
+        )
+        columns = [column[0] for column in cursor.description]
+        # WAPE of store SKUs without sales units is kept empty.
+        return pd.DataFrame(cursor.fetchall(), columns=columns, dtype=object)
 
-    sales_df["price"] = sales_df["sales_rub"] / sales_df[
-        "sales_units"
-    ].replace(0, 1)
-
-    merged_df = pd.merge(
-        forecasts_df,
-        sales_df,
-        on=["store_id", "sku_id"],
-        how="inner",
-    )
 
-    merged_df["quantity_difference"] = (
-        merged_df["sales_units"] - merged_df["target"]
-    )
-    merged_df["amount_difference"] = merged_df[
-        "quantity_difference"
-    ] * merged_df["price"].astype(float)
-    merged_df["WAPE"] = (
-        merged_df["quantity_difference"] / merged_df["sales_units"]
+def get_totals_sql(queryset, totals):
+    """Return SQL and params of the queryset totals by store SKUs."""
+    queryset = (
+        queryset.order_by()
+        .values("store_id", "sku_id")
+        .annotate(**{f"{total}_sum": Sum(total) for total in totals})
     )
-    return merged_df
+    sql, params = queryset.query.get_compiler(queryset.db).as_sql()
+    return sql, tuple(params)
 
 
 def get_sales(validated_data, skus):
     """Retrieve sales based on the validated data."""
-    return models.Sale.objects.prefetch_related("store_forecasts").filter(
+    return models.SaleDaily.objects.filter(
         store_id__in=validated_data.get("store_ids"),
         sku_id__in=skus,
         date__gte=validated_data.get("from_date"),
@@ -148,13 +173,13 @@ def get_stores(validated_data):
 
 def get_skus(validated_data):
     """Retrieve SKUs based on the validated data."""
-    filters = {"group__in": validated_data.get("groups")}
+    filters = {"group__name__in": validated_data.get("groups")}
 
     if categories := validated_data.get("categories"):
-        filters["category__in"] = categories
+        filters["category__name__in"] = categories
 
     if subcategories := validated_data.get("subcategories"):
-        filters["subcategory__in"] = subcategories
+        filters["subcategory__name__in"] = subcategories
 
     if sku_ids := validated_data.get("sku_ids"):
         filters["id__in"] = sku_ids
@@ -168,8 +193,9 @@ def get_skus(validated_data):
 
 def get_forecasts(validated_data, skus):
     """Retrieve forecasts based on stores and SKUs."""
-    return models.Forecast.objects.filter(
-        forecast_date__date=validated_data.get("forecast_date"),
+    return models.Forecast.objects.published(
+        validated_data.get("forecast_date"),
+    ).filter(
         date__gte=validated_data.get("from_date"),
         date__lte=validated_data.get("to_date"),
         store__in=validated_data.get("store_ids"),
@@ -196,6 +222,14 @@ def get_dataframe(queryset):
     return pd.DataFrame(list(queryset.values()))
 
 
+def get_skus_dataframe(skus):
+    """Convert SKUs to a pandas DataFrame with hierarchy names."""
+    names = {f"{field}__name": field for field in models.SKU_DIMENSIONS}
+    return pd.DataFrame(list(skus.values("id", "sku", "uom", *names))).rename(
+        columns=names
+    )
+
+
 def generate_excel_report(cleared_data):
     """Generate an Excel report based on forecast, SKU, and store data."""
     excel_buffer = BytesIO()
@@ -241,7 +275,7 @@ def merge_on_columns(left_df, right_df, left_on, right_on, how="inner"):
 def clear_forecast_report_data(forecasts, skus, stores):
     """Prepare and cleans data for generating an Excel report."""
     stores_df = get_dataframe(stores)
-    skus_df = get_dataframe(skus)
+    skus_df = get_skus_dataframe(skus)
     forecasts_df = get_dataframe(forecasts)
 
     verbose_names = get_verbose_names(
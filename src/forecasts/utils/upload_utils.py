@@ -0,0 +1,143 @@
+import os
+import shutil
+from io import RawIOBase
+from uuid import uuid4
+
+from django.conf import settings
+from rest_framework import status
+
+from forecasts.errors import UploadError
+from forecasts.utils.constants import (
+    UPLOAD_CHUNK_MAX_SIZE,
+    UPLOAD_READ_BLOCK_SIZE,
+    UPLOAD_SESSIONS_DIR,
+)
+
+
+def get_session_dir(session):
+    """Return directory of the upload session chunks."""
+    return os.path.join(
+        settings.MEDIA_ROOT,
+        UPLOAD_SESSIONS_DIR,
+        str(session.pk),
+    )
+
+
+def get_chunk_path(session, index):
+    """Return path of the upload session chunk."""
+    return os.path.join(get_session_dir(session), f"{index:08d}.part")
+
+
+def get_received_chunks(session):
+    """Return sorted indexes of the chunks received by the session."""
+    try:
+        file_names = os.listdir(get_session_dir(session))
+    except FileNotFoundError:
+        return []
+    return sorted(
+        int(file_name.removesuffix(".part"))
+        for file_name in file_names
+        if file_name.endswith(".part")
+    )
+
+
+def write_chunk(session, index, stream):
+    """
+    Write chunk of the file from the stream to the disk.
+
+    Chunk is written into a temporary file first and replaces the chunk
+    only when completely received, so an interrupted upload of a chunk
+    can be retried and never leaves a partial chunk.
+    """
+    if session.finalized:
+        raise UploadError(
+            "Upload session is already finalized.",
+            status_code=status.HTTP_400_BAD_REQUEST,
+        )
+    os.makedirs(get_session_dir(session), exist_ok=True)
+    path = get_chunk_path(session, index)
+    temp_path = f"{path}.{uuid4().hex}.tmp"
+    size = 0
+
+    try:
+        with open(temp_path, "wb") as file:
+            while stream is not None and (
+                block := stream.read(UPLOAD_READ_BLOCK_SIZE)
+            ):
+                size += len(block)
+                if size > UPLOAD_CHUNK_MAX_SIZE:
+                    raise UploadError(
+                        "Chunk size exceeds "
+                        f"{UPLOAD_CHUNK_MAX_SIZE} bytes.",
+                        status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+                    )
+                file.write(block)
+        if not size:
+            raise UploadError(
+                "Chunk is empty.",
+                status_code=status.HTTP_400_BAD_REQUEST,
+            )
+        os.replace(temp_path, path)
+    finally:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+    return size
+
+
+def remove_session_files(session):
+    """Remove all chunks of the upload session."""
+    shutil.rmtree(get_session_dir(session), ignore_errors=True)
+
+
+class ChunkedUploadStream(RawIOBase):
+    """
+    Binary stream reading chunks of the finalized upload session in order.
+
+    Sessions are imported only when all their chunks are uploaded, so
+    the stream never waits for chunks.
+    """
+
+    def __init__(self, session):
+        if not session.finalized:
+            raise UploadError(
+                "Upload session is not finalized.",
+                status_code=status.HTTP_400_BAD_REQUEST,
+            )
+        self.session = session
+        self._index = 0
+        self._file = None
+
+    def readable(self):
+        """Return True as the stream supports reading."""
+        return True
+
+    def readinto(self, buffer):
+        """Read bytes of the current chunk into the buffer."""
+        while True:
+            if self._file is None and not self._open_next_chunk():
+                return 0
+            if size := self._file.readinto(buffer):
+                return size
+            self._file.close()
+            self._file = None
+            self._index += 1
+
+    def close(self):
+        """Close the stream and the current chunk file."""
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+        super().close()
+
+    def _open_next_chunk(self):
+        """Open the next chunk, if any."""
+        if self._index >= self.session.chunks_count:
+            return False
+        try:
+            self._file = open(get_chunk_path(self.session, self._index), "rb")
+        except FileNotFoundError as error:
+            raise UploadError(
+                f"Chunk {self._index} of finalized upload is missing.",
+                status_code=status.HTTP_400_BAD_REQUEST,
+            ) from error
+        return True